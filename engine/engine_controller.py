@@ -1,55 +1,270 @@
 """
 Engine Controller
 -----------------
-Thread-based chess engine controller for non-blocking move calculation.
+Process-based chess engine controller for non-blocking move calculation.
 
 This module provides two controller implementations for managing chess engine
-move calculations: a threaded version for responsive GUIs and a simple blocking
+move calculations: a subprocess version for responsive GUIs and a simple blocking
 version for debugging or single-threaded environments.
 """
 
+import multiprocessing
 import threading
 import queue
 import time
 import chess
-from typing import Optional, Callable
+from typing import Optional, Callable, NamedTuple
+
+from engine.engine_wrapper import (
+    close_engine,
+    get_best_move,
+    initialize_engine,
+    is_engine_ready,
+)
+from utils.config import Config
+
+# Config attributes the engine reads while loading or searching
+# Snapshotted in the GUI process and applied inside the engine process,
+# since the subprocess does not share the GUI's (mutable) Config class
+ENGINE_CONFIG_KEYS = (
+    "UCI_ENGINE_PATH",
+    "ENGINE_SKILL_LEVEL",
+    "ENGINE_TIME_LIMIT",
+    "ENGINE_MAX_DEPTH",
+)
+
+
+def _engine_config_snapshot() -> dict:
+    """
+    Capture the engine-related Config values of the current process.
+
+    Returns:
+        dict: Mapping of Config attribute name to its current value
+    """
+    return {key: getattr(Config, key, None) for key in ENGINE_CONFIG_KEYS}
+
+
+def _apply_engine_config(snapshot: dict):
+    """
+    Apply a Config snapshot taken in the GUI process (engine process side).
+
+    Args:
+        snapshot (dict): Values produced by _engine_config_snapshot()
+    """
+    for key, value in snapshot.items():
+        setattr(Config, key, value)
+
+
+class MoveReady(NamedTuple):
+    """
+    Engine move analyzed on the listener thread, ready to be applied.
+
+    Everything the GUI needs to play the move (SAN for the history panel and
+    the flags that pick the sound) is derived off the render thread, against
+    the position the engine was asked about.
+    """
 
-from engine.engine_wrapper import get_best_move, is_engine_ready
+    uci: str  # Move in UCI notation, as returned by the engine
+    move: chess.Move  # Parsed move
+    san: str  # Move in SAN, for the move history
+    is_capture: bool
+    is_castling: bool
+    is_promotion: bool
+    is_check: bool  # Move gives check
+    ply: int  # Ply of the position the move was computed for
+
+
+def _analyze_engine_move(board: chess.Board, move_uci: str) -> Optional[MoveReady]:
+    """
+    Parse, validate and classify an engine move against the searched position.
+
+    Args:
+        board (chess.Board): Position the engine was asked to search
+        move_uci (str): Move returned by the engine
+
+    Returns:
+        Optional[MoveReady]: Analyzed move, or None if it is malformed or illegal
+    """
+    try:
+        move = chess.Move.from_uci(move_uci)
+    except ValueError:
+        return None
+
+    if not board.is_legal(move):
+        return None
+
+    # Capture/castling flags are only derivable before the move is pushed
+    return MoveReady(
+        uci=move_uci,
+        move=move,
+        san=board.san(move),
+        is_capture=board.is_capture(move),
+        is_castling=board.is_castling(move),
+        is_promotion=move.promotion is not None,
+        is_check=board.gives_check(move),
+        ply=board.ply(),
+    )
+
+
+def _engine_process_main(
+    request_queue: multiprocessing.Queue,
+    response_queue: multiprocessing.Queue,
+    config_snapshot: dict,
+):
+    """
+    Entry point of the engine subprocess.
+
+    Loads the engine once, reports readiness, then serves move requests until
+    a None sentinel arrives. Runs in its own interpreter, so engine search never
+    competes with the render loop for the GIL.
+
+    Args:
+        request_queue (multiprocessing.Queue): Incoming requests as tuples of
+            (request_id, board, move_history, time_limit, search_depth,
+            temperature, config_snapshot), or None to shut down.
+
+        response_queue (multiprocessing.Queue): Outgoing messages:
+            - ("ready", bool): Sent once after the engine finished loading
+            - ("move", request_id, move_uci or None, elapsed_seconds)
+
+        config_snapshot (dict): Engine Config values at spawn time.
+    """
+    # Load the engine with the GUI's settings (UCI path, skill level, ...)
+    _apply_engine_config(config_snapshot)
+    response_queue.put(("ready", initialize_engine()))
+
+    while True:
+        request = request_queue.get()
+
+        # None is the shutdown sentinel
+        if request is None:
+            break
+
+        (
+            request_id,
+            board,
+            move_history,
+            time_limit,
+            search_depth,
+            temperature,
+            snapshot,
+        ) = request
+
+        # Pick up settings changed since the engine was started (e.g. time limit)
+        _apply_engine_config(snapshot)
+
+        # Record start time to measure actual thinking duration
+        start_time = time.time()
+
+        try:
+            # BLOCKING call - fine here, this process does nothing else
+            move_uci = get_best_move(
+                board=board,
+                move_history=move_history,
+                time_limit=time_limit,
+                search_depth=search_depth,
+                temperature=temperature,
+            )
+        except Exception as e:
+            # Report failure as a None move instead of killing the process
+            print(f"[EngineProcess] ❌ Error during thinking: {e}")
+            move_uci = None
+
+        response_queue.put(("move", request_id, move_uci, time.time() - start_time))
+
+    # Release engine resources (UCI subprocess) before exiting
+    close_engine()
 
 
 class EngineController:
     """
-    Threaded chess engine controller for non-blocking move calculation.
+    Subprocess chess engine controller for non-blocking move calculation.
 
-    This class manages engine move calculations in a separate worker thread,
-    allowing the GUI to remain responsive during engine thinking. It uses
-    a queue-based communication pattern for thread-safe result delivery.
+    This class runs the engine in a separate process, so a pure-Python engine
+    cannot steal GIL time from the GUI while it searches. Requests and results
+    travel over multiprocessing queues; a small listener thread in the GUI
+    process forwards results into a thread-safe queue for polling, or hands
+    them to an on_move_ready hook so the GUI does not have to poll at all.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        on_move_ready: Optional[
+            Callable[[int, Optional[str], Optional[MoveReady]], None]
+        ] = None,
+    ):
         """
-        Initialize the engine controller with default state.
+        Initialize the engine controller and start the engine process.
+
+        Spawns the engine process and its result listener. The engine loads in
+        the background; requests made before it is ready are queued.
 
-        Sets up the thread communication infrastructure and initializes
-        all state flags to their idle values.
+        Args:
+            on_move_ready (Optional[Callable]):
+                Called from the listener thread with (request_id, move_uci,
+                ready) for every answer to the current request. move_uci is
+                None if the engine failed; ready is the MoveReady analysis of
+                the move, or None if it is illegal in the searched position.
+                When set, answers are delivered only through this hook and
+                get_move_if_ready() stays empty.
         """
         # Flag indicating engine is currently calculating a move
         # Prevents concurrent move requests which would interfere with each other
         self.thinking = False
 
-        # Thread-safe queue for passing calculated moves from worker to main thread
-        # Queue.Queue provides synchronized access without manual locking
-        self.move_queue = queue.Queue()
+        # Thread-safe queue for passing calculated moves from listener to main thread
+        # Single producer (listener) / single consumer (GUI): SimpleQueue is
+        # enough and avoids Queue's task-tracking locks
+        self.move_queue = queue.SimpleQueue()
 
-        # Reference to the active worker thread (None when idle)
-        # Allows monitoring and joining if needed
-        self.current_thread: Optional[threading.Thread] = None
+        # Id of the request whose answer we are waiting for
+        # Answers carrying any other id are stale (cancelled) and dropped
+        self.current_request_id = 0
 
-        # Cooperative cancellation flag
-        # Set to True to request worker thread to stop early
-        self.stop_thinking = False
+        # Engine load result reported by the engine process
+        # None until the process has finished loading
+        self.engine_ready: Optional[bool] = None
 
-        print("[EngineController] Initialized")
+        # Callback for the pending request (invoked from the listener thread)
+        self._callback: Optional[Callable[[str], None]] = None
+
+        # Position of the pending request, used to analyze the answer off
+        # the render thread (stack not needed for SAN or move flags)
+        self._request_board: Optional[chess.Board] = None
+
+        # Persistent delivery hook replacing the polled move queue
+        self._on_move_ready = on_move_ready
+
+        # "spawn" gives the same behaviour on every platform and avoids forking
+        # a process that already owns a pygame window
+        context = multiprocessing.get_context("spawn")
+        self._request_queue = context.Queue()
+        self._response_queue = context.Queue()
+
+        # Engine process - daemon so it never outlives the GUI
+        self._process = context.Process(
+            target=_engine_process_main,
+            args=(
+                self._request_queue,
+                self._response_queue,
+                _engine_config_snapshot(),
+            ),
+            name="EngineProcess",
+            daemon=True,
+        )
+        self._process.start()
+
+        # Listener thread - only blocks on the response queue, never on search
+        self._listener = threading.Thread(
+            target=self._response_listener,
+            name="EngineResponseListener",
+            daemon=True,
+        )
+        self._listener.start()
+
+        print(
+            f"[EngineController] Initialized (engine process pid {self._process.pid})"
+        )
 
     def request_move(
         self,
@@ -63,17 +278,16 @@ class EngineController:
         """
         Request engine to calculate best move asynchronously (non-blocking).
 
-        This method starts a background thread to calculate the engine's move,
-        allowing the calling thread (typically the GUI) to continue processing
-        events.
+        This method sends the position to the engine process and returns
+        immediately, allowing the calling thread (typically the GUI) to continue
+        processing events.
 
         Args:
             board (chess.Board): Current board position to analyze.
-                Will be deep-copied to prevent race conditions with main thread.
+                Pickled into the request, so later changes don't affect the search.
 
             move_history (list): List of UCI move strings played in the game.
                 Some engines use this for opening book lookup or position context.
-                Will be deep-copied to ensure thread safety.
 
             time_limit (float, optional): Maximum thinking time in seconds.
                 Defaults to 5.0. Engine will try to return best move within this limit.
@@ -91,17 +305,17 @@ class EngineController:
 
             callback (Optional[Callable[[str], None]], optional): Function to call
                 when move is ready. Receives UCI move string as argument.
-                Called from worker thread - ensure callback is thread-safe.
+                Called from the listener thread - ensure callback is thread-safe.
                 Defaults to None (poll via get_move_if_ready instead).
         """
         # Check if already calculating a move
-        # Only one move calculation allowed at a time to prevent thread conflicts
+        # Only one move calculation allowed at a time
         if self.thinking:
             print("[EngineController] ⚠️ Already thinking, ignoring request")
             return
 
-        # Verify engine is initialized and ready to receive commands
-        if not is_engine_ready():
+        # Engine process reported that loading failed
+        if self.engine_ready is False:
             print("[EngineController] ⚠️ Engine not ready")
 
             # If callback provided, try to recover by returning a random legal move
@@ -124,110 +338,87 @@ class EngineController:
                 # Queue is empty, nothing left to clear
                 break
 
-        # Update state flags to indicate calculation in progress
-        self.thinking = True  # Prevents concurrent requests
-        self.stop_thinking = False  # Reset cancellation flag
+        # New request id - any answer to an older request is now stale
+        self.current_request_id += 1
+        self._callback = callback
+        self._request_board = board.copy(stack=False)
 
-        # Create and start worker thread for engine calculation
-        # Daemon thread automatically terminates when main program exits
-        self.current_thread = threading.Thread(
-            target=self._engine_worker,  # Worker function to run
-            args=(
-                board.copy(),  # Deep copy to prevent main thread modifications
-                move_history.copy(),  # Deep copy for thread safety
+        # Update state flag to indicate calculation in progress
+        self.thinking = True
+
+        # Hand the request to the engine process - returns immediately
+        self._request_queue.put(
+            (
+                self.current_request_id,
+                board.copy(),
+                list(move_history),
                 time_limit,
                 search_depth,
                 temperature,
-                callback,
-            ),
-            daemon=True,  # Don't prevent program exit
+                _engine_config_snapshot(),
+            )
         )
-        # Start thread - returns immediately, calculation runs in background
-        self.current_thread.start()
 
         print("[EngineController] Started thinking...")
 
-    def _engine_worker(
-        self,
-        board: chess.Board,
-        move_history: list,
-        time_limit: float,
-        search_depth: Optional[int],
-        temperature: float,
-        callback: Optional[Callable[[str], None]],
-    ):
+    def _response_listener(self):
         """
-        Worker thread function that performs engine calculation and delivers results.
-
-        Args:
-            board (chess.Board): Deep copy of board position to analyze.
-                Isolated from main thread to prevent race conditions.
-
-            move_history (list): Deep copy of move history for engine context.
-                Some engines use this for opening book or repetition detection.
-
-            time_limit (float): Maximum calculation time in seconds.
-                Engine should return best move found within this limit.
-
-            search_depth (Optional[int]): Search depth or iteration count.
-                Engine-specific interpretation (MCTS iterations, alpha-beta depth, etc.).
+        Listener thread: forward engine process messages to the main thread.
 
-            temperature (float): Move selection randomness parameter (0.0 to 2.0+).
-                Controls determinism vs exploration in engine's move choice.
-
-            callback (Optional[Callable[[str], None]]): Optional function to call with result.
-                Receives UCI move string. Called from this worker thread.
+        Blocks on the response queue (no polling) until shutdown() posts a None
+        sentinel. Answers to cancelled requests are dropped here.
         """
-        # Record start time to measure actual thinking duration
-        start_time = time.time()
-
-        try:
-            # Call the underlying engine to calculate best move
-            # This is a BLOCKING call that may take several seconds
-            # Safe to block here because we're in a separate thread
-            move_uci = get_best_move(
-                board=board,
-                move_history=move_history,
-                time_limit=time_limit,
-                search_depth=search_depth,
-                temperature=temperature,
-            )
+        while True:
+            message = self._response_queue.get()
 
-            # Calculate how long the engine actually took
-            elapsed = time.time() - start_time
-
-            # Check if move was cancelled while we were calculating
-            if self.stop_thinking:
-                print("[EngineController] Thinking cancelled")
-                # Don't queue result, just exit worker thread
+            # None is the shutdown sentinel
+            if message is None:
                 return
 
-            # Queue the calculated move for main thread to retrieve
-            # Queue.put() is thread-safe, no lock needed
-            self.move_queue.put(move_uci)
+            if message[0] == "ready":
+                self.engine_ready = message[1]
+                if self.engine_ready:
+                    print("[EngineController] ✅ Engine process ready")
+                else:
+                    print(
+                        "[EngineController] ⚠️ Engine failed to load in engine process"
+                    )
+                continue
+
+            _, request_id, move_uci, elapsed = message
+
+            # Ignore answers to requests that were cancelled or superseded
+            if request_id != self.current_request_id or not self.thinking:
+                print("[EngineController] Discarded stale engine result")
+                continue
+
+            if move_uci is not None:
+                # Log successful calculation with timing information
+                print(
+                    f"[EngineController] Move calculated in {elapsed:.2f}s: {move_uci}"
+                )
+
+            # Clear thinking flag first, so whoever consumes the move below
+            # already sees the engine as idle and can request the next one
+            self.thinking = False
 
-            # Log successful calculation with timing information
-            print(f"[EngineController] Move calculated in {elapsed:.2f}s: {move_uci}")
+            # Deliver the calculated move (None signals an error) to the main thread
+            if self._on_move_ready is not None:
+                # Parse/validate/classify here so the GUI only has to push it
+                ready = None
+                if move_uci is not None and self._request_board is not None:
+                    ready = _analyze_engine_move(self._request_board, move_uci)
+                self._on_move_ready(request_id, move_uci, ready)
+            else:
+                self.move_queue.put(move_uci)
 
             # Invoke callback if one was provided
-            # Callback runs in THIS worker thread, so it must be thread-safe
-            if callback:
+            # Callback runs in THIS listener thread, so it must be thread-safe
+            callback = self._callback
+            self._callback = None
+            if callback and move_uci is not None:
                 callback(move_uci)
 
-        except Exception as e:
-            # Catch any errors during engine calculation
-            # Prevents worker thread from crashing silently
-            print(f"[EngineController] ❌ Error during thinking: {e}")
-
-            # Queue None to signal error condition to main thread
-            self.move_queue.put(None)
-
-        finally:
-            # ALWAYS reset thinking flag, even if exception occurred
-            # Critical for state consistency - prevents getting stuck in "thinking" state
-            # Without this, subsequent requests would be rejected forever
-            self.thinking = False
-
     def get_move_if_ready(self) -> Optional[str]:
         """
         Poll for calculated move without blocking (non-blocking check).
@@ -261,22 +452,23 @@ class EngineController:
 
     def cancel_thinking(self):
         """
-        Request cancellation of current engine calculation (best-effort).
+        Cancel the current engine calculation.
 
-        Sets the stop_thinking flag that the worker thread can check to abort
-        early. This is a cooperative cancellation mechanism - the worker must
-        explicitly check the flag. Cancellation may not occur immediately.
+        The engine process finishes its current search, but the result is
+        discarded by the listener because its request id is no longer current.
         """
+        # Invalidate the current request id even when idle - an answer that
+        # was already delivered but not yet consumed is then recognised as stale
+        self.current_request_id += 1
+
         # Only attempt cancellation if actually thinking
         if self.thinking:
             print("[EngineController] Cancelling engine thinking...")
 
-            # Set flag that worker thread can check
-            # Worker will see this after get_best_move() returns
-            self.stop_thinking = True
+            # Drop the pending request's callback so its answer is ignored
+            self._callback = None
 
-            # Immediately mark as not thinking to prevent new requests
-            # Worker will also set this to False in finally block
+            # Immediately mark as not thinking to allow new requests
             self.thinking = False
 
     def wait_for_move(self, timeout: Optional[float] = None) -> Optional[str]:
@@ -311,12 +503,39 @@ class EngineController:
             # Timeout occurred - no move available in time
             print("[EngineController] ⚠️ Move request timed out")
 
-            # Attempt to cancel the thinking (best effort)
-            # May not actually stop engine, but clears our state
+            # Drop the pending request so a late answer is ignored
             self.cancel_thinking()
 
             return None
 
+    def shutdown(self, timeout: float = 2.0):
+        """
+        Stop the engine process and the listener thread.
+
+        Args:
+            timeout (float, optional): Seconds to wait for a clean exit before
+                the engine process is terminated. Defaults to 2.0.
+        """
+        # Any in-flight answer is no longer wanted
+        self.cancel_thinking()
+
+        # Ask the engine process to close the engine and exit
+        if self._process.is_alive():
+            self._request_queue.put(None)
+            self._process.join(timeout)
+
+            # Engine stuck in a long search - stop it forcefully
+            if self._process.is_alive():
+                print("[EngineController] ⚠️ Engine process did not exit, terminating")
+                self._process.terminate()
+                self._process.join(timeout)
+
+        # Wake the listener thread so it can exit
+        self._response_queue.put(None)
+        self._listener.join(timeout)
+
+        print("[EngineController] Engine process stopped")
+
 
 # =============================================================================
 # SIMPLE BLOCKING API
@@ -11,10 +11,11 @@ move indicators.
 import math
 import pygame
 import chess
-from typing import List, Optional, Tuple
+from typing import Iterable, List, Optional, Sequence, Tuple
 from pathlib import Path
 
 from gui.colors import Colors
+from gui.fonts import get_font
 from utils.config import Config
 from gui.piece_loader import PieceLoader
 
@@ -28,6 +29,7 @@ class BoardGUI:
 
     Attributes:
         screen (pygame.Surface): The display surface to render onto
+        board_size (int): Pixel size of the whole board (Config.BOARD_SIZE)
         square_size (int): Pixel size of each board square
         board_x (int): X-coordinate of board's top-left corner
         board_y (int): Y-coordinate of board's top-left corner
@@ -44,8 +46,49 @@ class BoardGUI:
         """
         self.screen = screen
 
+        # Square size and board position from the current layout
+        self._update_geometry()
+
+        # Initialize PieceLoader
+        self.piece_loader = PieceLoader(piece_dir=Config.PIECE_IMAGES_DIR)
+        self._update_piece_sprites()
+
+        # Initialize font system for rendering coordinate labels
+        pygame.font.init()
+        self.coord_font = get_font("Arial", 16, bold=True)
+
+        # Snapshot of the whole static window (background fill, board squares,
+        # border, coordinates) and the settings it was drawn with; rebuilt
+        # only when one of them changes
+        self._background = None
+        self._background_key = None
+
+        # Pre-composite the "Engine thinking..." banner once so that drawing it
+        # while the engine searches costs a single blit per frame
+        self._thinking_banner = self._build_banner("Engine thinking...")
+
+        # Same mechanism for background PGN load/save operations
+        self._loading_banner = self._build_banner("Loading...")
+        self._saving_banner = self._build_banner("Saving...")
+
+        # Transparent overlay the user arrows are drawn on; allocated once per
+        # board size instead of once per frame
+        self._arrow_surface: Optional[pygame.Surface] = None
+
+        # Log successful initialization with diagnostic information
+        print("[BoardGUI] Initialized successfully")
+        print(f"    Square size: {self.square_size}x{self.square_size}")
+        print(f"    Board position: ({self.board_x}, {self.board_y})")
+        print(f"    Piece loader initialized with PNG assets")
+
+    def _update_geometry(self):
+        """Recompute square size and board position from Config layout values."""
+        # Board edge length in pixels; read here once instead of from Config
+        # by every draw and hit test (Config changes only through a relayout)
+        self.board_size = Config.BOARD_SIZE
+
         # Calculate individual square size (board divided into 8x8 grid)
-        self.square_size = Config.BOARD_SIZE // 8
+        self.square_size = self.board_size // 8
 
         # Determine board position on screen
         if hasattr(Config, "BOARD_X") and hasattr(Config, "BOARD_Y"):
@@ -57,47 +100,196 @@ class BoardGUI:
             self.board_x = (Config.WINDOW_WIDTH - Config.BOARD_SIZE) // 2
             self.board_y = (Config.WINDOW_HEIGHT - Config.BOARD_SIZE) // 2
 
-        # Initialize PieceLoader
-        self.piece_loader = PieceLoader(piece_dir=Config.PIECE_IMAGES_DIR)
-        self.piece_loader.load_pieces(self.square_size)
+    def _update_piece_sprites(self):
+        """Resolve the piece images and their centering offset for the square size."""
+        # Symbol -> image scaled to 80% of a square, already in display format
+        self._piece_sprites = self.piece_loader.get_piece_set(self.square_size)
 
-        # Initialize font system for rendering coordinate labels
-        pygame.font.init()
-        self.coord_font = pygame.font.SysFont("Arial", 16, bold=True)
+        # Offset that centers an 80% sprite inside its square
+        self._piece_offset = (self.square_size - int(self.square_size * 0.8)) // 2
 
-        # Log successful initialization with diagnostic information
-        print("[BoardGUI] Initialized successfully")
-        print(f"    Square size: {self.square_size}x{self.square_size}")
-        print(f"    Board position: ({self.board_x}, {self.board_y})")
-        print(f"    Piece loader initialized with PNG assets")
+        # Same sprites keyed by chess.Piece, so blit_pieces() needs no symbol()
+        self._sprites_by_piece = {
+            chess.Piece.from_symbol(symbol): sprite
+            for symbol, sprite in self._piece_sprites.items()
+        }
+
+        # Sprite position per square; rebuilt on first use for this layout
+        self._piece_positions_key = None
+
+    def resize(self, screen: pygame.Surface):
+        """
+        Adapt the renderer to a new window size without rebuilding it.
+
+        Keeps the piece loader (and its decoded images), fonts and banners;
+        only the geometry is recomputed and pieces are rescaled in memory.
+
+        Args:
+            screen (pygame.Surface): The (resized) display surface
+        """
+        self.screen = screen
+        self._update_geometry()
+        self._update_piece_sprites()
+
+    def _build_banner(self, text: str) -> pygame.Surface:
+        """
+        Render a status banner (background, border and text) into one surface.
+
+        Args:
+            text (str): Message displayed in the banner
+
+        Returns:
+            pygame.Surface: Per-pixel alpha surface ready to blit onto the screen
+        """
+        font = get_font("Arial", 18, bold=True)
+        text_surface = font.render(text, True, (255, 215, 0))
+
+        # Size the banner around the text with some padding
+        padding_x, padding_y = 16, 8
+        width = text_surface.get_width() + padding_x * 2
+        height = text_surface.get_height() + padding_y * 2
+
+        banner = pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha()
+
+        # Dark semi-transparent background with gold border
+        pygame.draw.rect(banner, (20, 20, 20, 210), banner.get_rect(), border_radius=6)
+        pygame.draw.rect(banner, (255, 215, 0), banner.get_rect(), 2, border_radius=6)
+
+        # Text centered inside the banner
+        banner.blit(
+            text_surface, text_surface.get_rect(center=banner.get_rect().center)
+        )
+
+        return banner
+
+    def draw_thinking_banner(self):
+        """
+        Draw the pre-rendered "Engine thinking..." banner over the top of the board.
+        """
+        self._blit_banner(self._thinking_banner)
+
+    def draw_io_banner(self, loading: bool):
+        """
+        Draw the pre-rendered banner shown while a PGN file operation runs.
+
+        Args:
+            loading (bool): True for "Loading...", False for "Saving..."
+        """
+        self._blit_banner(self._loading_banner if loading else self._saving_banner)
+
+    def _blit_banner(self, banner: pygame.Surface):
+        """
+        Blit a pre-rendered banner centered over the top of the board.
+
+        Args:
+            banner (pygame.Surface): Surface built by _build_banner()
+        """
+        # Center horizontally on the board, just below its top edge
+        x = self.board_x + (self.board_size - banner.get_width()) // 2
+        y = self.board_y + 8
+
+        self.screen.blit(banner, (x, y))
 
     def draw_board(self):
         """
         Render the complete chess board with squares, border, and coordinates.
+
+        Also clears the rest of the window to the background color, so this
+        is the first draw of every full frame.
         """
+        # The background and board only change with layout, theme or
+        # orientation - reuse the last rendering when none of those changed.
+        # One full-window blit replaces the fill plus the board redraw.
+        key = self._background_key_now()
+        if self._background is not None and self._background_key == key:
+            self.screen.blit(self._background, (0, 0))
+            return
+
         # Fill entire screen with background color
         # This creates the margin area around the board
         self.screen.fill(Colors.BACKGROUND)
 
-        # Draw decorative border around the chess board
-        # Border is 2 pixels thick and surrounds the board area
-        border_rect = pygame.Rect(
-            self.board_x - 2,
-            self.board_y - 2,
-            Config.BOARD_SIZE + 4,
-            Config.BOARD_SIZE + 4,
-        )
-        pygame.draw.rect(self.screen, Colors.BORDER, border_rect, 2)
+        # The border and squares are ~34 draw calls in a row - hold one lock
+        # for all of them instead of letting each call lock the screen.
+        # Blits are not allowed on a locked surface, so the coordinate labels
+        # are drawn after unlocking.
+        self.screen.lock()
+        try:
+            # Draw decorative border around the chess board
+            # Border is 2 pixels thick and surrounds the board area
+            border_rect = pygame.Rect(
+                self.board_x - 2,
+                self.board_y - 2,
+                self.board_size + 4,
+                self.board_size + 4,
+            )
+            pygame.draw.rect(self.screen, Colors.BORDER, border_rect, 2)
 
-        # Render all 64 squares in the 8x8 grid
-        for row in range(8):
-            for col in range(8):
-                self._draw_square(row, col)
+            # Render the 8x8 grid: one fill covers every light square, so only
+            # the 32 dark squares need their own rect
+            grid_size = self.square_size * 8
+            pygame.draw.rect(
+                self.screen,
+                Colors.LIGHT_SQUARE,
+                (self.board_x, self.board_y, grid_size, grid_size),
+            )
+            for row in range(8):
+                # Dark squares are those where (row + col) is odd
+                for col in range(1 - row % 2, 8, 2):
+                    self._draw_square(row, col)
+        finally:
+            self.screen.unlock()
 
         # Add algebraic notation labels inside squares if enabled
         if Config.SHOW_COORDINATES:
             self._draw_coordinates_inside()
 
+        # Keep a copy of the freshly drawn background for the next frames
+        self._background = self.screen.copy()
+        self._background_key = key
+
+    def _background_key_now(self) -> tuple:
+        """
+        Collect every setting the static background rendering depends on.
+
+        Returns:
+            tuple: Geometry, colors and orientation of the current board
+        """
+        return (
+            self.screen.get_size(),
+            self.square_size,
+            self.board_x,
+            self.board_y,
+            Colors.LIGHT_SQUARE,
+            Colors.DARK_SQUARE,
+            Colors.BORDER,
+            Config.SHOW_COORDINATES,
+            Config.FLIP_BOARD,
+        )
+
+    def get_board_area(self) -> pygame.Rect:
+        """
+        Screen rectangle covered by the board including its border.
+
+        Returns:
+            pygame.Rect: Board squares plus the 2px border
+        """
+        return pygame.Rect(
+            self.board_x - 2,
+            self.board_y - 2,
+            self.board_size + 4,
+            self.board_size + 4,
+        )
+
+    def restore_board_area(self):
+        """
+        Blit the cached static board, erasing pieces and overlays drawn on it.
+
+        Call only after draw_board() has built the cache for the current layout.
+        """
+        area = self.get_board_area().clip(self.screen.get_rect())
+        self.screen.blit(self._background, area.topleft, area)
+
     def _draw_square(self, row: int, col: int):
         """
         Render a single chess board square with appropriate color.
@@ -213,7 +405,7 @@ class BoardGUI:
         for col, file in enumerate(files):
             # Center label horizontally within each square
             x = self.board_x + col * self.square_size + self.square_size // 2
-            y_bottom = self.board_y + Config.BOARD_SIZE + 8  # Below board
+            y_bottom = self.board_y + self.board_size + 8  # Below board
             y_top = self.board_y - 20  # Above board
 
             # Render and position the file letter
@@ -229,7 +421,7 @@ class BoardGUI:
             # Center label vertically within each square
             y = self.board_y + row * self.square_size + self.square_size // 2
             x_left = self.board_x - 20  # Left of board
-            x_right = self.board_x + Config.BOARD_SIZE + 20  # Right of board
+            x_right = self.board_x + self.board_size + 20  # Right of board
 
             # Render and position the rank number
             text = self.coord_font.render(rank, True, Colors.COORDINATE_TEXT)
@@ -268,6 +460,58 @@ class BoardGUI:
 
             self._draw_piece(piece, square)
 
+    def blit_pieces(
+        self,
+        pieces: Sequence[Optional[chess.Piece]],
+        squares: Iterable[chess.Square],
+    ) -> None:
+        """
+        Draw the pieces standing on the given squares with one Surface.blits().
+
+        The sprite and position of every piece are looked up from tables, and
+        pygame performs all blits in a single C call instead of one Python
+        call per piece.
+
+        Args:
+            pieces (Sequence[Optional[chess.Piece]]): Piece on each square,
+                indexed by square (see cached_piece_grid)
+            squares (Iterable[chess.Square]): Squares to draw, in draw order
+        """
+        sprites = self._sprites_by_piece
+        positions = self._piece_positions_now()
+
+        blit_list = []
+        for square in squares:
+            sprite = sprites.get(pieces[square])
+            if sprite is not None:
+                blit_list.append((sprite, positions[square]))
+
+        self.screen.blits(blit_list, doreturn=False)
+
+    def _piece_positions_now(self) -> Tuple[Tuple[int, int], ...]:
+        """
+        Top-left blit position of a piece sprite on each of the 64 squares.
+
+        Returns:
+            Tuple[Tuple[int, int], ...]: (x, y) indexed by square, for the
+                current geometry and orientation
+        """
+        key = (self.board_x, self.board_y, self.square_size, Config.FLIP_BOARD)
+        if self._piece_positions_key != key:
+            offset = self._piece_offset
+            positions = []
+            for square in chess.SQUARES:
+                row, col = self._square_to_coords(square)
+                positions.append(
+                    (
+                        self.board_x + col * self.square_size + offset,
+                        self.board_y + row * self.square_size + offset,
+                    )
+                )
+            self._piece_positions = tuple(positions)
+            self._piece_positions_key = key
+        return self._piece_positions
+
     def _draw_piece(self, piece: chess.Piece, square: chess.Square):
         """
         Render a single chess piece at its specified square using PieceLoader.
@@ -276,15 +520,23 @@ class BoardGUI:
             piece (chess.Piece): python-chess Piece object with color and type info
             square (chess.Square): Target square index (0-63) where piece should be drawn
         """
+        sprite = self._piece_sprites.get(piece.symbol())
+        if sprite is None:
+            return
+
         # Convert chess square index to screen coordinates (row, col)
         row, col = self._square_to_coords(square)
 
-        # Calculate pixel position of the square's top-left corner
-        x = self.board_x + col * self.square_size
-        y = self.board_y + row * self.square_size
-
-        # Use PieceLoader to draw the piece
-        self.piece_loader.draw_piece(self.screen, piece, x, y, self.square_size)
+        # Square's top-left corner plus the centering offset; the sprite is
+        # pre-scaled and pre-converted, so this is a plain blit
+        offset = self._piece_offset
+        self.screen.blit(
+            sprite,
+            (
+                self.board_x + col * self.square_size + offset,
+                self.board_y + row * self.square_size + offset,
+            ),
+        )
 
     def _square_to_coords(self, square: chess.Square) -> Tuple[int, int]:
         """
@@ -336,10 +588,10 @@ class BoardGUI:
                 are outside the board boundaries
         """
         # Check if click is within horizontal board bounds
-        if x < self.board_x or x >= self.board_x + Config.BOARD_SIZE:
+        if x < self.board_x or x >= self.board_x + self.board_size:
             return None
         # Check if click is within vertical board bounds
-        if y < self.board_y or y >= self.board_y + Config.BOARD_SIZE:
+        if y < self.board_y or y >= self.board_y + self.board_size:
             return None
 
         # Calculate which column and row were clicked
@@ -474,16 +726,20 @@ class BoardGUI:
         # Draw pulsing red glow effect
         surface = pygame.Surface((self.square_size, self.square_size), pygame.SRCALPHA)
 
-        # Draw multiple layers for glow effect
-        for i in range(3):
-            alpha = 180 - (i * 40)
-            color = (235, 97, 80, alpha)
-            pygame.draw.rect(
-                surface,
-                color,
-                (i * 2, i * 2, self.square_size - i * 4, self.square_size - i * 4),
-                3,
-            )
+        # Draw multiple layers for glow effect under a single surface lock
+        surface.lock()
+        try:
+            for i in range(3):
+                alpha = 180 - (i * 40)
+                color = (235, 97, 80, alpha)
+                pygame.draw.rect(
+                    surface,
+                    color,
+                    (i * 2, i * 2, self.square_size - i * 4, self.square_size - i * 4),
+                    3,
+                )
+        finally:
+            surface.unlock()
 
         self.screen.blit(surface, (x, y))
 
@@ -529,62 +785,84 @@ class BoardGUI:
         shaft_overlap = head_height * 0.15
 
         color = (*color_rgb, alpha)
-        arrow_surface = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
 
-        for move in arrows:
-            sx, sy = self.get_square_center(move.from_square)
-            ex, ey = self.get_square_center(move.to_square)
-
-            dx = ex - sx
-            dy = ey - sy
-            length = math.hypot(dx, dy)
-            if length < square_size * 0.25:
-                continue
-
-            angle = math.atan2(dy, dx)
-            cos_a = math.cos(angle)
-            sin_a = math.sin(angle)
-
-            # --- shaft geometry ---
-            shaft_len = length - head_height + shaft_overlap
-
-            half_w = shaft_width / 2
-            perp_x = -sin_a
-            perp_y = cos_a
-
-            # shaft rectangle corners
-            p1 = (sx + perp_x * half_w, sy + perp_y * half_w)
-            p2 = (sx - perp_x * half_w, sy - perp_y * half_w)
-            p3 = (
-                sx + cos_a * shaft_len - perp_x * half_w,
-                sy + sin_a * shaft_len - perp_y * half_w,
-            )
-            p4 = (
-                sx + cos_a * shaft_len + perp_x * half_w,
-                sy + sin_a * shaft_len + perp_y * half_w,
-            )
+        # Arrows run between square centers, so they never leave the board:
+        # a board-sized overlay is enough. Reuse it while the size holds and
+        # clear last frame's arrows instead of allocating a window-sized one.
+        overlay_size = (self.square_size * 8, self.square_size * 8)
+        if (
+            self._arrow_surface is None
+            or self._arrow_surface.get_size() != overlay_size
+        ):
+            self._arrow_surface = pygame.Surface(overlay_size, pygame.SRCALPHA)
+        arrow_surface = self._arrow_surface
+        arrow_surface.fill((0, 0, 0, 0))
+
+        # Every shaft and head is a polygon on the same overlay - lock it
+        # once for the whole loop
+        arrow_surface.lock()
+        try:
+            for move in arrows:
+                # Centers relative to the overlay's top-left (the board corner)
+                sx, sy = self.get_square_center(move.from_square)
+                ex, ey = self.get_square_center(move.to_square)
+                sx -= self.board_x
+                sy -= self.board_y
+                ex -= self.board_x
+                ey -= self.board_y
+
+                dx = ex - sx
+                dy = ey - sy
+                length = math.hypot(dx, dy)
+                if length < square_size * 0.25:
+                    continue
+
+                angle = math.atan2(dy, dx)
+                cos_a = math.cos(angle)
+                sin_a = math.sin(angle)
+
+                # --- shaft geometry ---
+                shaft_len = length - head_height + shaft_overlap
+
+                half_w = shaft_width / 2
+                perp_x = -sin_a
+                perp_y = cos_a
+
+                # shaft rectangle corners
+                p1 = (sx + perp_x * half_w, sy + perp_y * half_w)
+                p2 = (sx - perp_x * half_w, sy - perp_y * half_w)
+                p3 = (
+                    sx + cos_a * shaft_len - perp_x * half_w,
+                    sy + sin_a * shaft_len - perp_y * half_w,
+                )
+                p4 = (
+                    sx + cos_a * shaft_len + perp_x * half_w,
+                    sy + sin_a * shaft_len + perp_y * half_w,
+                )
 
-            pygame.draw.polygon(arrow_surface, color, [p1, p2, p3, p4])
+                pygame.draw.polygon(arrow_surface, color, [p1, p2, p3, p4])
 
-            # --- equilateral arrow head ---
-            base_x = ex - cos_a * head_height
-            base_y = ey - sin_a * head_height
+                # --- equilateral arrow head ---
+                base_x = ex - cos_a * head_height
+                base_y = ey - sin_a * head_height
 
-            half_side = head_side / 2
+                half_side = head_side / 2
 
-            left = (
-                base_x + perp_x * half_side,
-                base_y + perp_y * half_side,
-            )
-            right = (
-                base_x - perp_x * half_side,
-                base_y - perp_y * half_side,
-            )
+                left = (
+                    base_x + perp_x * half_side,
+                    base_y + perp_y * half_side,
+                )
+                right = (
+                    base_x - perp_x * half_side,
+                    base_y - perp_y * half_side,
+                )
 
-            pygame.draw.polygon(
-                arrow_surface,
-                color,
-                [(ex, ey), left, right],
-            )
+                pygame.draw.polygon(
+                    arrow_surface,
+                    color,
+                    [(ex, ey), left, right],
+                )
+        finally:
+            arrow_surface.unlock()
 
-        self.screen.blit(arrow_surface, (0, 0))
+        self.screen.blit(arrow_surface, (self.board_x, self.board_y))
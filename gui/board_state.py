@@ -11,10 +11,133 @@ and provides utilities for both GUI rendering and chess engine integration.
 
 import chess
 import chess.pgn
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Optional, List, Tuple
 from io import StringIO
 
 
+@lru_cache(maxsize=65536)
+def move_from_uci(uci: str) -> chess.Move:
+    """
+    Parse a UCI move string, reusing the Move object for repeated strings.
+
+    History navigation replays every move of the game from UCI strings, so
+    the same few hundred strings are parsed over and over. Move objects are
+    never mutated, which makes sharing them safe.
+
+    Args:
+        uci (str): Move in UCI notation (e.g., "e2e4", "e7e8q")
+
+    Returns:
+        chess.Move: Parsed move
+
+    Raises:
+        ValueError: If the string is not a valid UCI move (not cached)
+    """
+    return chess.Move.from_uci(uci)
+
+
+# LRU cache of legal move lists keyed by python-chess's `_transposition_key()` tuple
+# The key covers everything move generation depends on (placement, side to
+# move, castling rights, legal en passant square), so entries never go stale
+_LEGAL_CACHE: "OrderedDict[tuple, Tuple[chess.Move, ...]]" = OrderedDict()
+_LEGAL_CACHE_SIZE = 4096
+
+
+def cached_legal_moves(board: chess.Board) -> Tuple[chess.Move, ...]:
+    """
+    Legal moves of a position, generated once per distinct position.
+
+    The UI asks for the same position over and over (selecting, reselecting
+    and dragging pieces, navigating back and forth through the history).
+
+    Args:
+        board (chess.Board): Position to generate moves for
+
+    Returns:
+        Tuple[chess.Move, ...]: All legal moves (shared - do not modify)
+    """
+    key = board._transposition_key()
+    moves = _LEGAL_CACHE.get(key)
+    if moves is not None:
+        _LEGAL_CACHE.move_to_end(key)
+        return moves
+
+    moves = tuple(board.legal_moves)
+    _LEGAL_CACHE[key] = moves
+    if len(_LEGAL_CACHE) > _LEGAL_CACHE_SIZE:
+        _LEGAL_CACHE.popitem(last=False)
+    return moves
+
+
+# Piece-per-square tables keyed by the placement bitboards; the renderer
+# looks up the same few positions every frame (current, premove, history)
+_PIECE_GRID_CACHE: "OrderedDict[tuple, Tuple[Optional[chess.Piece], ...]]" = (
+    OrderedDict()
+)
+_PIECE_GRID_CACHE_SIZE = 64
+
+
+def cached_piece_grid(board: chess.Board) -> Tuple[Optional[chess.Piece], ...]:
+    """
+    64-entry table of the piece on each square, built once per placement.
+
+    Indexing the table replaces a board.piece_at() call per piece per frame,
+    each of which tests several bitboards to find the piece type and color.
+
+    Args:
+        board (chess.Board): Position to read the pieces from
+
+    Returns:
+        Tuple[Optional[chess.Piece], ...]: Piece or None, indexed by square
+    """
+    # Six piece-type bitboards plus the white pieces fully describe placement
+    key = (
+        board.pawns,
+        board.knights,
+        board.bishops,
+        board.rooks,
+        board.queens,
+        board.kings,
+        board.occupied_co[chess.WHITE],
+    )
+    grid = _PIECE_GRID_CACHE.get(key)
+    if grid is not None:
+        _PIECE_GRID_CACHE.move_to_end(key)
+        return grid
+
+    squares: List[Optional[chess.Piece]] = [None] * 64
+    for square, piece in board.piece_map().items():
+        squares[square] = piece
+    grid = tuple(squares)
+    _PIECE_GRID_CACHE[key] = grid
+    if len(_PIECE_GRID_CACHE) > _PIECE_GRID_CACHE_SIZE:
+        _PIECE_GRID_CACHE.popitem(last=False)
+    return grid
+
+
+def classify_move(board: chess.Board, move: chess.Move) -> Tuple[bool, bool, bool]:
+    """
+    Classify a move for sound/animation purposes in one place.
+
+    Must be called BEFORE the move is pushed: afterwards python-chess can no
+    longer tell a capture or a castling move from the resulting position.
+
+    Args:
+        board (chess.Board): Position the move is about to be played in
+        move (chess.Move): The move to classify
+
+    Returns:
+        Tuple[bool, bool, bool]: (is_capture, is_castling, is_promotion)
+    """
+    return (
+        board.is_capture(move),
+        board.is_castling(move),
+        move.promotion is not None,
+    )
+
+
 class BoardState:
     """
     High-level chess board state manager with comprehensive game logic.
@@ -50,8 +173,19 @@ class BoardState:
         # Move history in SAN notation (Standard Algebraic Notation)
         # Format: e4, Nf3, O-O, exd5
         # Used for display to human players and PGN export
+        # Both lists are kept in step with the board by _push_move() and
+        # undo_move(): SAN is computed once per ply, never re-derived from
+        # the move stack
         self.move_history_san: List[str] = []
 
+        # Details of the most recent move, filled in by make_move()
+        # Lets callers read UCI/SAN without recomputing SAN from the board
+        self.last_move: Optional[chess.Move] = None
+        self.last_move_uci: Optional[str] = None
+        self.last_move_san: Optional[str] = None
+        # (is_capture, is_castling, is_promotion), see classify_move()
+        self.last_move_flags: Tuple[bool, bool, bool] = (False, False, False)
+
     # =========================================
     # Position Information
     # =========================================
@@ -163,7 +297,7 @@ class BoardState:
         Returns:
             List[chess.Move]: List of chess.Move objects representing all legal moves
         """
-        return list(self.board.legal_moves)
+        return list(cached_legal_moves(self.board))
 
     def get_legal_moves_uci(self) -> List[str]:
         """
@@ -172,7 +306,7 @@ class BoardState:
         Returns:
             List[str]: List of moves in UCI notation
         """
-        return [move.uci() for move in self.board.legal_moves]
+        return [move.uci() for move in cached_legal_moves(self.board)]
 
     def get_legal_moves_from_square(self, square: int) -> List[chess.Move]:
         """
@@ -186,7 +320,7 @@ class BoardState:
         Returns:
             List[chess.Move]: Legal moves starting from the given square
         """
-        return [m for m in self.board.legal_moves if m.from_square == square]
+        return [m for m in cached_legal_moves(self.board) if m.from_square == square]
 
     def get_legal_destinations_from_square(self, square: int) -> List[int]:
         """
@@ -227,7 +361,7 @@ class BoardState:
             bool: True if move is legal, False if illegal or invalid format
         """
         try:
-            move = chess.Move.from_uci(uci)
+            move = move_from_uci(uci)
             return move in self.board.legal_moves
         except ValueError:
             return False
@@ -241,7 +375,7 @@ class BoardState:
         Returns:
             int: Number of legal moves in current position
         """
-        return self.board.legal_moves.count()
+        return len(cached_legal_moves(self.board))
 
     # =========================================
     # Move Execution
@@ -266,15 +400,52 @@ class BoardState:
         # SAN depends on current position (e.g., which pieces can reach a square)
         san = self.board.san(move)
 
+        # Capture/castling flags are only derivable before the move is pushed
+        flags = classify_move(self.board, move)
+
+        self._push_move(move, san, flags)
+        return True
+
+    def make_analyzed_move(
+        self, move: chess.Move, san: str, flags: Tuple[bool, bool, bool]
+    ):
+        """
+        Execute a move that was already validated and classified elsewhere.
+
+        Used for engine moves, whose legality, SAN and flags are computed on
+        the engine listener thread against the same position.
+
+        Args:
+            move (chess.Move): Legal move in the current position
+            san (str): The move in SAN, computed before the push
+            flags (Tuple[bool, bool, bool]): (is_capture, is_castling,
+                is_promotion) as returned by classify_move()
+        """
+        self._push_move(move, san, flags)
+
+    def _push_move(self, move: chess.Move, san: str, flags: Tuple[bool, bool, bool]):
+        """
+        Push a legal move and record it in the history and last-move details.
+
+        Args:
+            move (chess.Move): Legal move in the current position
+            san (str): The move in SAN
+            flags (Tuple[bool, bool, bool]): Move classification
+        """
         # Execute the move on the internal board
         # This updates piece positions, turn, castling rights, etc.
         self.board.push(move)
 
         # Record move in both notations for different use cases
-        self.move_history_uci.append(move.uci())  # For engine communication
+        uci = move.uci()
+        self.move_history_uci.append(uci)  # For engine communication
         self.move_history_san.append(san)  # For human-readable display
 
-        return True
+        # Remember last move details so consumers never recompute them
+        self.last_move = move
+        self.last_move_uci = uci
+        self.last_move_san = san
+        self.last_move_flags = flags
 
     def make_move_uci(self, uci: str) -> bool:
         """
@@ -287,7 +458,7 @@ class BoardState:
             True if move was made, False if illegal
         """
         try:
-            move = chess.Move.from_uci(uci)
+            move = move_from_uci(uci)
             return self.make_move(move)
         except ValueError:
             return False
@@ -328,8 +499,28 @@ class BoardState:
         if self.move_history_san:
             self.move_history_san.pop()
 
+        # Last move info now refers to the previous move (if any)
+        self._sync_last_move()
+
         return move
 
+    def _sync_last_move(self):
+        """Refresh last move details from the tail of the move history."""
+        if self.board.move_stack and self.move_history_uci and self.move_history_san:
+            self.last_move = self.board.peek()
+            self.last_move_uci = self.move_history_uci[-1]
+            self.last_move_san = self.move_history_san[-1]
+
+            # Classify against the position before the move was played
+            move = self.board.pop()
+            self.last_move_flags = classify_move(self.board, move)
+            self.board.push(move)
+        else:
+            self.last_move = None
+            self.last_move_uci = None
+            self.last_move_san = None
+            self.last_move_flags = (False, False, False)
+
     def undo_two_moves(self) -> Tuple[Optional[chess.Move], Optional[chess.Move]]:
         """
         Undo last two moves (player + engine).
@@ -421,15 +612,14 @@ class BoardState:
                 - "1/2-1/2" if draw (any draw condition)
                 - None if game is still ongoing
         """
-        if not self.is_game_over():
+        # One legal-move pass decides both whether the game is over and how,
+        # instead of is_game_over() followed by is_checkmate()
+        outcome = self.board.outcome()
+        if outcome is None:
             return None
 
-        if self.is_checkmate():
-            # The side to move is checkmated, so the other side wins
-            return "0-1" if self.is_white_turn else "1-0"
-        else:
-            # All other game-ending conditions are draws
-            return "1/2-1/2"
+        # Checkmate gives the winner's score, every other ending is a draw
+        return outcome.result()
 
     def get_game_status(self) -> str:
         """
@@ -494,11 +684,11 @@ class BoardState:
     # =========================================
 
     def get_move_history_uci(self) -> List[str]:
-        """Get move history as UCI strings (for engine)."""
+        """Get a copy of the move history as UCI strings (for engine)."""
         return self.move_history_uci.copy()
 
     def get_move_history_san(self) -> List[str]:
-        """Get move history in SAN notation (for display)."""
+        """Get a copy of the move history in SAN notation (for display)."""
         return self.move_history_san.copy()
 
     def get_last_move(self) -> Optional[chess.Move]:
@@ -576,6 +766,7 @@ class BoardState:
         self.board.reset()
         self.move_history_uci.clear()
         self.move_history_san.clear()
+        self._sync_last_move()
 
     def set_fen(self, fen: str):
         """
@@ -585,12 +776,17 @@ class BoardState:
         self.board.set_fen(fen)
         self.move_history_uci.clear()
         self.move_history_san.clear()
+        self._sync_last_move()
 
     def copy(self) -> "BoardState":
         """Create a deep copy of current state."""
         new_state = BoardState(self.get_fen())
         new_state.move_history_uci = self.move_history_uci.copy()
         new_state.move_history_san = self.move_history_san.copy()
+        new_state.last_move = self.last_move
+        new_state.last_move_uci = self.last_move_uci
+        new_state.last_move_san = self.last_move_san
+        new_state.last_move_flags = self.last_move_flags
         return new_state
 
     # =========================================
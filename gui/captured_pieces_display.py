@@ -12,6 +12,7 @@ import pygame
 import chess
 from typing import List, Tuple
 from gui.colors import Colors
+from gui.fonts import get_font
 
 
 class CapturedPiecesDisplay:
@@ -30,6 +31,7 @@ class CapturedPiecesDisplay:
         black_y: int,
         black_width: int,
         black_height: int,
+        piece_loader=None,
     ):
         """
         Initialize captured pieces display with position and styling.
@@ -50,10 +52,20 @@ class CapturedPiecesDisplay:
             black_y (int): Y position for black's captured pieces section.
             black_width (int): Width of black's captured pieces section.
             black_height (int): Height of black's captured pieces section.
+
+            piece_loader (PieceLoader, optional): Loader shared with the board.
+                Its decoded piece images are reused for the icons, so no
+                PNG is loaded twice. Defaults to None (Unicode symbols).
         """
         # Store display surface reference
         self.screen = screen
 
+        # Shared piece image source (None = draw Unicode symbols instead)
+        self.piece_loader = piece_loader
+
+        # Rendered Unicode symbols, keyed by (piece_type, color)
+        self._symbol_cache = {}
+
         # White's captured pieces section (above board)
         self.white_rect = pygame.Rect(white_x, white_y, white_width, white_height)
 
@@ -61,15 +73,13 @@ class CapturedPiecesDisplay:
         self.black_rect = pygame.Rect(black_x, black_y, black_width, black_height)
 
         # Title font for section headers
-        self.title_font = pygame.font.SysFont("Arial", 11, bold=True)
+        self.title_font = get_font("Arial", 11, bold=True)
 
         # Score font for material advantage display
-        self.score_font = pygame.font.SysFont("Arial", 14, bold=True)
+        self.score_font = get_font("Arial", 14, bold=True)
 
         # Font that supports chess symbols
-        self.piece_font = pygame.font.SysFont(
-            "Segoe UI Symbol, Arial Unicode MS, DejaVu Sans", 20
-        )
+        self.piece_font = get_font("Segoe UI Symbol, Arial Unicode MS, DejaVu Sans", 20)
 
         # Size of captured piece icons in pixels
         self.piece_size = 24
@@ -77,7 +87,31 @@ class CapturedPiecesDisplay:
         # Padding from edges of each section
         self.padding = 4
 
-    def draw(self, board: chess.Board):
+    def resize(
+        self,
+        screen: pygame.Surface,
+        white_x: int,
+        white_y: int,
+        white_width: int,
+        white_height: int,
+        black_x: int,
+        black_y: int,
+        black_width: int,
+        black_height: int,
+    ):
+        """
+        Move/resize both sections in place, keeping fonts.
+
+        Args:
+            screen (pygame.Surface): The (resized) display surface.
+            white_x, white_y, white_width, white_height: New white section rect.
+            black_x, black_y, black_width, black_height: New black section rect.
+        """
+        self.screen = screen
+        self.white_rect = pygame.Rect(white_x, white_y, white_width, white_height)
+        self.black_rect = pygame.Rect(black_x, black_y, black_width, black_height)
+
+    def draw(self, board: chess.Board) -> List[pygame.Rect]:
         """
         Render complete captured pieces display with both sections.
 
@@ -88,6 +122,9 @@ class CapturedPiecesDisplay:
             board (chess.Board): Current board state from python-chess.
                 Used to determine which pieces have been captured.
                 Compared against starting position piece counts.
+
+        Returns:
+            List[pygame.Rect]: Both section areas, for partial display updates.
         """
         # Analyze current board to determine which pieces were captured
         # Returns two lists: pieces each side has lost
@@ -114,6 +151,8 @@ class CapturedPiecesDisplay:
             material_score if material_score > 0 else 0,
         )
 
+        return [self.white_rect, self.black_rect]
+
     def _draw_section(
         self,
         title: str,
@@ -189,7 +228,7 @@ class CapturedPiecesDisplay:
             if piece_y + self.piece_size > rect.bottom - self.padding:
                 break  # Stop drawing if no more room
 
-            # Draw simple piece icon (using Unicode symbols)
+            # Draw piece icon (sprite, or Unicode symbol without a loader)
             self._draw_piece_icon(piece, piece_x, piece_y)
 
             piece_x += self.piece_size + 2
@@ -218,35 +257,52 @@ class CapturedPiecesDisplay:
 
     def _draw_piece_icon(self, piece: chess.Piece, x: int, y: int):
         """
-        Draw a piece using Unicode chess symbols (emoji).
+        Draw a captured piece icon.
+
+        Uses the shared piece sprites when a PieceLoader was given, otherwise
+        falls back to Unicode chess symbols. Either way the icon surface is
+        rendered once and reused on later frames.
 
         Args:
-            piece (chess.Piece): Piece to render as placeholder.
+            piece (chess.Piece): Piece to render.
             x (int): X position
             y (int): Y position
         """
-        # Unicode chess piece symbols
-        piece_symbols = {
-            (chess.PAWN, chess.WHITE): "♙",
-            (chess.KNIGHT, chess.WHITE): "♘",
-            (chess.BISHOP, chess.WHITE): "♗",
-            (chess.ROOK, chess.WHITE): "♖",
-            (chess.QUEEN, chess.WHITE): "♕",
-            (chess.KING, chess.WHITE): "♔",
-            (chess.PAWN, chess.BLACK): "♟",
-            (chess.KNIGHT, chess.BLACK): "♞",
-            (chess.BISHOP, chess.BLACK): "♝",
-            (chess.ROOK, chess.BLACK): "♜",
-            (chess.QUEEN, chess.BLACK): "♛",
-            (chess.KING, chess.BLACK): "♚",
-        }
-
-        # Get the Unicode symbol
-        symbol = piece_symbols.get((piece.piece_type, piece.color), "?")
-
-        # Render the symbol
-        text_color = (240, 240, 240) if piece.color == chess.WHITE else (100, 100, 100)
-        text = self.piece_font.render(symbol, True, text_color)
+        if self.piece_loader is not None:
+            icon = self.piece_loader.get_piece_icon(piece, self.piece_size)
+            if icon is not None:
+                self.screen.blit(icon, (x, y))
+                return
+
+        key = (piece.piece_type, piece.color)
+        text = self._symbol_cache.get(key)
+        if text is None:
+            # Unicode chess piece symbols
+            piece_symbols = {
+                (chess.PAWN, chess.WHITE): "♙",
+                (chess.KNIGHT, chess.WHITE): "♘",
+                (chess.BISHOP, chess.WHITE): "♗",
+                (chess.ROOK, chess.WHITE): "♖",
+                (chess.QUEEN, chess.WHITE): "♕",
+                (chess.KING, chess.WHITE): "♔",
+                (chess.PAWN, chess.BLACK): "♟",
+                (chess.KNIGHT, chess.BLACK): "♞",
+                (chess.BISHOP, chess.BLACK): "♝",
+                (chess.ROOK, chess.BLACK): "♜",
+                (chess.QUEEN, chess.BLACK): "♛",
+                (chess.KING, chess.BLACK): "♚",
+            }
+
+            # Get the Unicode symbol
+            symbol = piece_symbols.get(key, "?")
+
+            # Render the symbol (once per piece type and color)
+            text_color = (
+                (240, 240, 240) if piece.color == chess.WHITE else (100, 100, 100)
+            )
+            text = self._symbol_cache[key] = self.piece_font.render(
+                symbol, True, text_color
+            )
 
         # Draw at the specified position
         self.screen.blit(text, (x, y))
@@ -11,6 +11,8 @@ color randomly assigned.
 import pygame
 import random
 from gui.colors import Colors
+from gui.fonts import get_font
+from gui.events import MAIN_LOOP_EVENTS
 
 
 class ColorSelectionDialog:
@@ -32,9 +34,9 @@ class ColorSelectionDialog:
         self.dialog_height = 350
 
         # Fonts
-        self.title_font = pygame.font.SysFont("Arial", 32, bold=True)
-        self.button_font = pygame.font.SysFont("Arial", 20, bold=True)
-        self.desc_font = pygame.font.SysFont("Arial", 14)
+        self.title_font = get_font("Arial", 32, bold=True)
+        self.button_font = get_font("Arial", 20, bold=True)
+        self.desc_font = get_font("Arial", 14)
 
         # Button dimensions
         self.button_width = 380
@@ -170,7 +172,7 @@ class ColorSelectionDialog:
 
             # -------------------- Event Handling --------------------
 
-            for event in pygame.event.get():
+            for event in pygame.event.get(exclude=MAIN_LOOP_EVENTS):
                 # Window close - default to white
                 if event.type == pygame.QUIT:
                     return "white"
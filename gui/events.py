@@ -0,0 +1,15 @@
+"""
+Custom Events
+-------------
+pygame event types shared between the main loop and the modal dialogs.
+"""
+
+import pygame
+
+# Posted from the engine listener thread when the engine has answered
+# Attributes: uci (str or None on engine error), request_id (int)
+ENGINE_MOVE_READY = pygame.USEREVENT + 1
+
+# Event types only the main loop consumes - modal dialogs running their own
+# event loops must leave these in the queue instead of discarding them
+MAIN_LOOP_EVENTS = (ENGINE_MOVE_READY,)
@@ -0,0 +1,70 @@
+"""
+Font Cache
+----------
+Shared pygame fonts and pre-rendered text surfaces.
+
+pygame.font.SysFont() searches the system font list and opens the TTF file on
+every call, and Font.render() rasterizes the text each time. Components ask
+this module instead, so each (name, size, bold) font is opened once per run
+and labels drawn every frame are rendered once.
+"""
+
+from functools import lru_cache
+from typing import Dict, Tuple
+
+import pygame
+
+# Rendered labels keyed by (font name, size, bold, text, color)
+_text_cache: Dict[tuple, pygame.Surface] = {}
+
+# Upper bound for _text_cache; changing labels (FPS counter) must not grow it forever
+_TEXT_CACHE_LIMIT = 256
+
+
+@lru_cache(maxsize=32)
+def get_font(name: str, size: int, bold: bool = False) -> pygame.font.Font:
+    """
+    Return a shared SysFont, opening it on first use.
+
+    Fonts are shared between components, so callers must not change their
+    style (set_bold, set_underline, ...) after getting them.
+
+    Args:
+        name (str): Font name(s) as accepted by pygame.font.SysFont
+        size (int): Font size in points
+        bold (bool): Bold variant. Defaults to False.
+
+    Returns:
+        pygame.font.Font: Cached font object
+    """
+    return pygame.font.SysFont(name, size, bold=bold)
+
+
+def render_text(
+    text: str,
+    size: int,
+    color: Tuple[int, int, int],
+    name: str = "Arial",
+    bold: bool = False,
+) -> pygame.Surface:
+    """
+    Return an antialiased text surface, rendering it only the first time.
+
+    Args:
+        text (str): Text to render
+        size (int): Font size in points
+        color (Tuple[int, int, int]): RGB text color
+        name (str): Font name. Defaults to "Arial".
+        bold (bool): Bold variant. Defaults to False.
+
+    Returns:
+        pygame.Surface: Rendered text (shared - do not draw onto it)
+    """
+    key = (name, size, bold, text, color)
+    surface = _text_cache.get(key)
+    if surface is None:
+        if len(_text_cache) >= _TEXT_CACHE_LIMIT:
+            _text_cache.clear()
+        surface = get_font(name, size, bold).render(text, True, color)
+        _text_cache[key] = surface
+    return surface
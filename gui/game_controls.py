@@ -11,9 +11,10 @@ and modal dialogs for file operations.
 
 import pygame
 import os
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 from datetime import datetime
 from gui.colors import Colors
+from gui.fonts import get_font
 from utils.config import Config
 import tkinter as tk
 from tkinter import filedialog
@@ -69,7 +70,7 @@ class GameControls:
         self.spacing = spacing
 
         # Fonts
-        self.tooltip_font = pygame.font.SysFont("Arial", 12)
+        self.tooltip_font = get_font("Arial", 12)
 
         # Initialize button dictionary and create buttons first
         self.buttons = {}
@@ -82,12 +83,49 @@ class GameControls:
         # Track which button mouse is hovering over (None if no hover)
         # Updated each frame during draw() call
         self.hover_button = None
-        self.hover_time = 0
-        self.tooltip_delay = 30  # Frames before showing tooltip
+        self.hover_start = 0  # pygame ticks when the current hover began
+        self.tooltip_delay = 500  # Milliseconds before showing tooltip
+        self.tooltip_visible = False  # Tooltip drawn by the last draw()
 
         # Initialize tkinter root (hidden) for file dialogs
         self._init_tk_root()
 
+    def resize(
+        self,
+        screen: pygame.Surface,
+        x: int,
+        y: int,
+        width: int,
+        icon_size: int = 50,
+        spacing: int = 10,
+    ):
+        """
+        Reposition the buttons in place after a window resize.
+
+        Keeps the Tk root and loaded icons; icons are only reloaded when the
+        button size actually changes.
+
+        Args:
+            screen (pygame.Surface): The (resized) display surface.
+            x (int): New left edge X coordinate of control panel.
+            y (int): New top edge Y coordinate of control panel.
+            width (int): New width of the panel in pixels.
+            icon_size (int, optional): Height of each button in pixels.
+            spacing (int, optional): Space between buttons in pixels.
+        """
+        icon_size_changed = icon_size != self.icon_size
+
+        self.screen = screen
+        self.x = x
+        self.y = y
+        self.width = width
+        self.icon_size = icon_size
+        self.spacing = spacing
+        self._create_buttons()
+
+        if icon_size_changed:
+            self._load_icons()
+
     def _init_tk_root(self):
         """
         Initialize hidden tkinter root window for file dialogs.
@@ -188,9 +226,13 @@ class GameControls:
             "icon": "resign.png",
         }
 
-    def draw(self):
+    def draw(self) -> List[pygame.Rect]:
         """
         Render all icon buttons with hover effects and tooltips.
+
+        Returns:
+            List[pygame.Rect]: Screen areas drawn (button strip and tooltip),
+                for partial display updates.
         """
         # Get current mouse position to detect hover
         mouse_pos = pygame.mouse.get_pos()
@@ -256,17 +298,52 @@ class GameControls:
                 pygame.draw.rect(self.screen, fallback_color, fallback_rect)
 
         # Handle hover tracking for tooltips
+        # Time based, so the delay holds even when idle frames are skipped
+        now = pygame.time.get_ticks()
         if current_hover != self.hover_button:
             self.hover_button = current_hover
-            self.hover_time = 0
-        elif current_hover:
-            self.hover_time += 1
+            self.hover_start = now
+
+        # Area covered by the buttons
+        rects = [button["rect"] for button in self.buttons.values()]
+        drawn = [rects[0].unionall(rects[1:])]
 
         # Draw tooltip if hovering long enough
-        if self.hover_button and self.hover_time > self.tooltip_delay:
-            self._draw_tooltip(self.hover_button, mouse_pos)
+        self.tooltip_visible = False
+        if self.hover_button and now - self.hover_start >= self.tooltip_delay:
+            drawn.append(self._draw_tooltip(self.hover_button, mouse_pos))
+            self.tooltip_visible = True
+
+        return drawn
 
-    def _draw_tooltip(self, button_id: str, mouse_pos: Tuple[int, int]):
+    def needs_redraw(self) -> bool:
+        """
+        Check whether a pending tooltip is due to appear.
+
+        Returns:
+            bool: True if a button has been hovered for tooltip_delay ms and
+                its tooltip has not been drawn yet
+        """
+        return (
+            self.hover_button is not None
+            and not self.tooltip_visible
+            and pygame.time.get_ticks() - self.hover_start >= self.tooltip_delay
+        )
+
+    def ms_until_tooltip(self) -> Optional[int]:
+        """
+        Time until the pending tooltip is due to appear.
+
+        Returns:
+            Optional[int]: Milliseconds until needs_redraw() turns True, or
+                None if no tooltip is pending
+        """
+        if self.hover_button is None or self.tooltip_visible:
+            return None
+        elapsed = pygame.time.get_ticks() - self.hover_start
+        return max(0, self.tooltip_delay - elapsed)
+
+    def _draw_tooltip(self, button_id: str, mouse_pos: Tuple[int, int]) -> pygame.Rect:
         """
         Draw tooltip near mouse cursor.
 
@@ -276,6 +353,9 @@ class GameControls:
 
             mouse_pos (Tuple[int, int]): Current mouse position (x, y).
                 Used to position tooltip.
+
+        Returns:
+            pygame.Rect: Area covered by the tooltip.
         """
         # Get tooltip text from button dictionary
         tooltip_text = self.buttons[button_id]["tooltip"]
@@ -301,6 +381,8 @@ class GameControls:
         # Draw tooltip text
         self.screen.blit(text_surface, (tooltip_x, tooltip_y))
 
+        return tooltip_rect
+
     def handle_click(self, pos: Tuple[int, int]) -> Optional[str]:
         """
         Handle mouse click and detect which button was clicked.
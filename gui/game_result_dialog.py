@@ -32,6 +32,8 @@ Supported Result Types:
 import pygame
 from typing import Optional
 from gui.colors import Colors
+from gui.fonts import get_font
+from gui.events import MAIN_LOOP_EVENTS
 
 
 class GameResultDialog:
@@ -58,13 +60,13 @@ class GameResultDialog:
         # SysFont uses system fonts for consistent appearance across platforms
 
         # Title font
-        self.title_font = pygame.font.SysFont("Arial", 36, bold=True)
+        self.title_font = get_font("Arial", 36, bold=True)
 
         # Message font
-        self.message_font = pygame.font.SysFont("Arial", 20)
+        self.message_font = get_font("Arial", 20)
 
         # Button font
-        self.button_font = pygame.font.SysFont("Arial", 18, bold=True)
+        self.button_font = get_font("Arial", 18, bold=True)
 
         # Define button sizes
         self.button_width = 150
@@ -264,7 +266,7 @@ class GameResultDialog:
 
             # Process all pending events in the queue
             # This loop handles user input (keyboard, mouse, window events)
-            for event in pygame.event.get():
+            for event in pygame.event.get(exclude=MAIN_LOOP_EVENTS):
                 # Handle window close button (X button)
                 if event.type == pygame.QUIT:
                     # User closed window - exit application
@@ -9,6 +9,8 @@ players to learn controls and gameplay mechanics.
 
 import pygame
 from gui.colors import Colors
+from gui.fonts import get_font
+from gui.events import MAIN_LOOP_EVENTS
 
 
 class HelpScreen:
@@ -48,23 +50,23 @@ class HelpScreen:
 
         # Title font for main heading "Help & Instructions"
         # Large, bold font for maximum prominence
-        self.title_font = pygame.font.SysFont("Arial", 32, bold=True)
+        self.title_font = get_font("Arial", 32, bold=True)
 
         # Section header font for category titles
         # Medium size, bold, distinguishes content sections
-        self.section_font = pygame.font.SysFont("Arial", 20, bold=True)
+        self.section_font = get_font("Arial", 20, bold=True)
 
         # Body text font for instructions and descriptions
         # Standard readable size for paragraphs and bullet points
-        self.text_font = pygame.font.SysFont("Arial", 16)
+        self.text_font = get_font("Arial", 16)
 
         # Keyboard key font for shortcut displays
         # Monospaced Courier New for technical feel, looks like keyboard
-        self.key_font = pygame.font.SysFont("Courier New", 16, bold=True)
+        self.key_font = get_font("Courier New", 16, bold=True)
 
         # Button text font for close button
         # Bold for clear call-to-action
-        self.button_font = pygame.font.SysFont("Arial", 16, bold=True)
+        self.button_font = get_font("Arial", 16, bold=True)
 
         # -------------------- Scrolling State --------------------
 
@@ -227,7 +229,7 @@ class HelpScreen:
             # -------------------- Event Processing --------------------
 
             # Process all pending events
-            for event in pygame.event.get():
+            for event in pygame.event.get(exclude=MAIN_LOOP_EVENTS):
                 # Window close event
                 if event.type == pygame.QUIT:
                     return  # Exit help screen
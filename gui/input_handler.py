@@ -9,16 +9,20 @@ validates moves, provides visual feedback, and supports premove functionality.
 """
 
 import chess
+import logging
 from typing import Optional, Tuple, List
 
 import pygame
 
 from gui.board_gui import BoardGUI
-from gui.board_state import BoardState
+from gui.board_state import BoardState, cached_legal_moves
 from gui.colors import Colors
 from gui.promotion_dialog import PromotionDialog
 from utils.config import Config
 
+# Shared application logger (configured in main.py)
+log = logging.getLogger("chess_gui")
+
 
 class InputHandler:
     """
@@ -103,7 +107,7 @@ class InputHandler:
         Returns:
             bool: True if a move was successfully executed, False otherwise
         """
-        print(f"[DEBUG] handle_mouse_click called - engine_thinking: {engine_thinking}")
+        log.debug("handle_mouse_click called - engine_thinking: %s", engine_thinking)
 
         # Convert screen pixel coordinates to chess square index
         square = self.board_gui.coords_to_square(pos[0], pos[1])
@@ -114,15 +118,15 @@ class InputHandler:
             self._clear_premove()
             return False
 
-        print(f"[DEBUG] Clicked square: {chess.square_name(square)}")
+        log.debug("Clicked square: %s", chess.square_name(square))
 
         # Determine what piece (if any) is at the clicked square
         piece = self.board_state.board.piece_at(square)
-        print(f"[DEBUG] Piece at square: {piece.symbol() if piece else 'None'}")
+        log.debug("Piece at square: %s", piece)
 
         # Check if premove is enabled and engine is thinking
         if Config.ENABLE_PREMOVE and engine_thinking:
-            print(f"[DEBUG] Routing to _handle_premove_click")
+            log.debug("Routing to _handle_premove_click")
             # Premove mode - allow selection but don't execute moves
             return self._handle_premove_click(square, piece)
 
@@ -137,7 +141,7 @@ class InputHandler:
     def _handle_premove_click(
         self, square: chess.Square, piece: Optional[chess.Piece]
     ) -> bool:
-        human_color = chess.WHITE if Config.HUMAN_COLOR == "white" else chess.BLACK
+        human_color = Config.HUMAN_CHESS_COLOR
 
         # Use visual board (real board + queued premoves) for both selection and legality
         visual_board = self.build_visual_board()
@@ -155,12 +159,16 @@ class InputHandler:
             # Legal moves from this premove position
             visual_board.turn = human_color
             self.legal_moves_from_selected = [
-                move for move in visual_board.legal_moves if move.from_square == square
+                move
+                for move in cached_legal_moves(visual_board)
+                if move.from_square == square
             ]
 
-            print(f"[Premove] Selected {piece.symbol()} at {chess.square_name(square)}")
-            print(
-                f"          Showing {len(self.legal_moves_from_selected)} legal moves"
+            log.debug(
+                "[Premove] Selected %s at %s", piece.symbol(), chess.square_name(square)
+            )
+            log.debug(
+                "          Showing %d legal moves", len(self.legal_moves_from_selected)
             )
             return False
 
@@ -232,15 +240,15 @@ class InputHandler:
 
         # Calculate and cache all legal moves from this square
         # This is used for highlighting and move validation
-        self.legal_moves_from_selected = [
-            move
-            for move in self.board_state.board.legal_moves
-            if move.from_square == square
-        ]
+        self.legal_moves_from_selected = self.board_state.get_legal_moves_from_square(
+            square
+        )
 
         # Log selection for debugging
-        print(f"[Input] Selected {piece.symbol()} at {chess.square_name(square)}")
-        print(f"        Legal moves: {len(self.legal_moves_from_selected)}")
+        log.debug(
+            "[Input] Selected %s at %s", piece.symbol(), chess.square_name(square)
+        )
+        log.debug("        Legal moves: %d", len(self.legal_moves_from_selected))
 
         return False
 
@@ -262,14 +270,14 @@ class InputHandler:
         """
         # Clicking the same square - toggle selection off
         if square == self.selected_square:
-            print(f"[Input] Deselected {chess.square_name(square)}")
+            log.debug("[Input] Deselected %s", chess.square_name(square))
             self._deselect()
             return False
 
         # Clicking a different piece of our own color - reselect it
         # This allows quick piece switching without deselecting first
         if piece is not None and piece.color == self.board_state.board.turn:
-            print(f"[Input] Reselecting piece at {chess.square_name(square)}")
+            log.debug("[Input] Reselecting piece at %s", chess.square_name(square))
             self._deselect()
             return self._handle_selection(square, piece)
 
@@ -330,19 +338,24 @@ class InputHandler:
 
         # Validate move legality
         if move not in self.board_state.board.legal_moves:
-            print(f"[Input] Illegal move: {move.uci()}")
+            log.debug("[Input] Illegal move: %s", move.uci())
             self._deselect()
             return False
 
         # Move is legal - execute it
-        # Get SAN notation BEFORE making the move (depends on current position)
-        move_san = self.board_state.board.san(move)
+        # BoardState computes SAN once and exposes it as last_move_san
         success = self.board_state.make_move(move)
 
         if success:
             # Move executed successfully
-            print(f"[Input] Move made: {move_san} ({move.uci()})")
-            print(f"        Status: {self.board_state.get_game_status()}")
+            log.debug(
+                "[Input] Move made: %s (%s)",
+                self.board_state.last_move_san,
+                self.board_state.last_move_uci,
+            )
+            # get_game_status() runs several draw/mate checks - only when shown
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("        Status: %s", self.board_state.get_game_status())
             self._deselect()
             return True
         else:
@@ -356,15 +369,18 @@ class InputHandler:
             return False
 
         move = self.premove_queue[0]
-        print(f"[Premove] Attempting to execute: {move.uci()}")
+        log.debug("[Premove] Attempting to execute: %s", move)
 
         if move in self.board_state.board.legal_moves:
             self.last_move_method = "click"
-            move_san = self.board_state.board.san(move)
             success = self.board_state.make_move(move)
 
             if success:
-                print(f"[Premove] ✅ Executed: {move_san} ({move.uci()})")
+                log.debug(
+                    "[Premove] ✅ Executed: %s (%s)",
+                    self.board_state.last_move_san,
+                    self.board_state.last_move_uci,
+                )
                 self.premove_queue.pop(0)
 
                 if not self.premove_queue:
@@ -374,7 +390,7 @@ class InputHandler:
                 return True
 
         # Invalid or failed
-        print(f"[Premove] ❌ No longer legal / failed")
+        log.debug("[Premove] ❌ No longer legal / failed")
         self.premove_queue.clear()
         self.virtual_board = None
         self._deselect()
@@ -461,7 +477,7 @@ class InputHandler:
             return
 
         # Determine human player's color
-        human_color = chess.WHITE if Config.HUMAN_COLOR == "white" else chess.BLACK
+        human_color = Config.HUMAN_CHESS_COLOR
 
         if engine_thinking:
             if not Config.ENABLE_PREMOVE:
@@ -477,7 +493,7 @@ class InputHandler:
                 self.drag_piece = piece
                 self.drag_start_pos = pos
                 self.mouse_moved = False
-                print(f"[Premove] Prepared drag from {chess.square_name(square)}")
+                log.debug("[Premove] Prepared drag from %s", chess.square_name(square))
                 return
 
             # No valid premove piece here
@@ -522,7 +538,7 @@ class InputHandler:
 
             # Handle drop outside board
             if to_square is None or self.drag_start_square is None:
-                print(f"[Input] Dropped outside board")
+                log.debug("[Input] Dropped outside board")
                 self.drag_piece = None
                 self.drag_start_square = None
                 self.drag_start_pos = None
@@ -531,7 +547,7 @@ class InputHandler:
 
             # Handle drop on same square (drag cancelled)
             if to_square == self.drag_start_square:
-                print(f"[Input] Dropped on same square")
+                log.debug("[Input] Dropped on same square")
                 self.drag_piece = None
                 self.drag_start_square = None
                 self.drag_start_pos = None
@@ -542,9 +558,7 @@ class InputHandler:
             if engine_thinking and Config.ENABLE_PREMOVE:
                 # Build premove logic board: real board + all queued premoves
                 logic_board = self._get_premove_logic_board()
-                human_color = (
-                    chess.WHITE if Config.HUMAN_COLOR == "white" else chess.BLACK
-                )
+                human_color = Config.HUMAN_CHESS_COLOR
 
                 # Get piece from logic board at drag start square
                 from_piece = logic_board.piece_at(self.drag_start_square)
@@ -575,8 +589,8 @@ class InputHandler:
 
                 # Check legality on logic board (premove position)
                 if move not in logic_board.legal_moves:
-                    print(
-                        f"[Premove] Illegal premove drag on logic board: {move.uci()}"
+                    log.debug(
+                        "[Premove] Illegal premove drag on logic board: %s", move.uci()
                     )
                     self._deselect()
                     self.drag_piece = None
@@ -588,15 +602,17 @@ class InputHandler:
                 self.premove_queue.append(move)
 
                 if promotion:
-                    print(
-                        f"[Premove] Queued drag promotion: "
-                        f"{chess.square_name(self.drag_start_square)} -> {chess.square_name(to_square)} "
-                        f"({chess.PIECE_NAMES[promotion]})"
+                    log.debug(
+                        "[Premove] Queued drag promotion: %s -> %s (%s)",
+                        chess.square_name(self.drag_start_square),
+                        chess.square_name(to_square),
+                        chess.PIECE_NAMES[promotion],
                     )
                 else:
-                    print(
-                        f"[Premove] Queued drag move: "
-                        f"{chess.square_name(self.drag_start_square)} -> {chess.square_name(to_square)}"
+                    log.debug(
+                        "[Premove] Queued drag move: %s -> %s",
+                        chess.square_name(self.drag_start_square),
+                        chess.square_name(to_square),
                     )
 
                 # Clear drag state
@@ -669,24 +685,28 @@ class InputHandler:
                         temp_board.turn = self.drag_piece.color
                         self.legal_moves_from_selected = [
                             move
-                            for move in temp_board.legal_moves
+                            for move in cached_legal_moves(temp_board)
                             if move.from_square == self.drag_start_square
                         ]
                     else:
                         # Normal play - use current board
-                        self.legal_moves_from_selected = [
-                            move
-                            for move in self.board_state.board.legal_moves
-                            if move.from_square == self.drag_start_square
-                        ]
+                        self.legal_moves_from_selected = (
+                            self.board_state.get_legal_moves_from_square(
+                                self.drag_start_square
+                            )
+                        )
 
                     if self.is_premove_mode:
-                        print(
-                            f"[Premove] Started dragging {self.drag_piece.symbol()} from {chess.square_name(self.drag_start_square)}"
+                        log.debug(
+                            "[Premove] Started dragging %s from %s",
+                            self.drag_piece.symbol(),
+                            chess.square_name(self.drag_start_square),
                         )
                     else:
-                        print(
-                            f"[Input] Started dragging {self.drag_piece.symbol()} from {chess.square_name(self.drag_start_square)}"
+                        log.debug(
+                            "[Input] Started dragging %s from %s",
+                            self.drag_piece.symbol(),
+                            chess.square_name(self.drag_start_square),
                         )
 
         # Update cursor position if already dragging
@@ -867,14 +887,14 @@ class InputHandler:
         """
         temp = self.board_state.board.copy()
 
-        human_color = chess.WHITE if Config.HUMAN_COLOR == "white" else chess.BLACK
+        human_color = Config.HUMAN_CHESS_COLOR
 
         for move in self.premove_queue:
             try:
                 temp.turn = human_color
                 temp.push(move)
             except Exception as e:
-                print(f"[Premove] visual push failed for {move.uci()}: {e}")
+                log.debug("[Premove] visual push failed for %s: %s", move.uci(), e)
                 break
 
         return temp
@@ -884,7 +904,7 @@ class InputHandler:
         Board used for premove legality: real board + all queued premoves.
         """
         temp = self.board_state.board.copy()
-        human_color = chess.WHITE if Config.HUMAN_COLOR == "white" else chess.BLACK
+        human_color = Config.HUMAN_CHESS_COLOR
 
         # Always set turn to human before applying each queued premove
         for move in self.premove_queue:
@@ -916,7 +936,7 @@ class InputHandler:
 
         move = chess.Move(self.arrow_start_square, to_square)
         self.user_arrows.append(move)
-        print(f"[Arrow] Added arrow {move.uci()}")
+        log.debug("[Arrow] Added arrow %s", move.uci())
         self.arrow_start_square = None
 
     def clear_premoves_and_arrows(self) -> None:
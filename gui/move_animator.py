@@ -268,6 +268,21 @@ class MoveAnimator:
             square == self.from_square or square == self.to_square
         )
 
+    def hidden_squares_mask(self) -> chess.Bitboard:
+        """
+        Bitboard of the squares whose pieces must not be drawn statically.
+
+        Same squares as is_square_being_animated(), as one mask so the
+        renderer can drop them from the occupancy bitboard in a single step.
+
+        Returns:
+            chess.Bitboard: Source and destination squares while animating,
+                0 otherwise
+        """
+        if not self.is_animating:
+            return 0
+        return chess.BB_SQUARES[self.from_square] | chess.BB_SQUARES[self.to_square]
+
     def cancel(self):
         """
         Cancel current animation and return to idle state immediately.
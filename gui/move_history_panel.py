@@ -7,6 +7,7 @@ Scrollable panel for displaying chess move history in Standard Algebraic Notatio
 import pygame
 from typing import List, Optional, Tuple
 from gui.colors import Colors
+from gui.fonts import get_font
 
 
 class MoveHistoryPanel:
@@ -63,10 +64,10 @@ class MoveHistoryPanel:
         # -------------------- Font Setup --------------------
 
         # Title font
-        self.title_font = pygame.font.SysFont("Arial", 18, bold=True)
+        self.title_font = get_font("Arial", 18, bold=True)
 
         # Move font
-        self.move_font = pygame.font.SysFont("Courier New", 14)
+        self.move_font = get_font("Courier New", 14)
 
         # -------------------- Scrolling Configuration --------------------
 
@@ -92,7 +93,100 @@ class MoveHistoryPanel:
         self.selected_move_index: Optional[int] = None  # Index in flat move list
         self.hover_move_index: Optional[int] = None  # For hover effects
 
-    def draw(self, move_history_san: List[str], current_move_number: int = -1):
+        # -------------------- Text Surface Cache --------------------
+
+        # Bumped whenever the move list may have been replaced (new game,
+        # loaded game, new move); draw() re-validates the cache when it differs
+        self._dirty_version: int = 0
+        self._last_rendered_version: int = -1
+
+        # One pre-rendered surface per half-move, parallel to the SAN list.
+        # New moves append a single surface instead of re-rasterizing history
+        self._move_texts: List[str] = []
+        self._move_surfaces: List[pygame.Surface] = []
+
+        # Move number labels ("  1.", "  2.", ...) never change, so they are
+        # rendered once and only grown as the game gets longer
+        self._number_surfaces: List[pygame.Surface] = []
+
+        # Bumped by _sync_move_surfaces() whenever the cached moves change
+        self._moves_gen: int = 0
+
+        # -------------------- Panel Surface Cache --------------------
+
+        # Copy of the last rendered panel and the state it shows; draw()
+        # just blits it again while moves, highlight, scroll and hover match
+        self._panel_surface: Optional[pygame.Surface] = None
+        self._panel_key: Optional[tuple] = None
+
+    def resize(self, screen: pygame.Surface, x: int, y: int, width: int, height: int):
+        """
+        Move/resize the panel in place, keeping fonts and scroll state.
+
+        Args:
+            screen (pygame.Surface): The (resized) display surface.
+            x (int): New X-coordinate of panel's top-left corner.
+            y (int): New Y-coordinate of panel's top-left corner.
+            width (int): New panel width in pixels.
+            height (int): New panel height in pixels.
+        """
+        self.screen = screen
+        self.rect = pygame.Rect(x, y, width, height)
+        self.visible_lines = (height - 50) // self.line_height
+
+    def _sync_move_surfaces(self, move_history_san: List[str]):
+        """
+        Bring the cached per-move text surfaces in line with the SAN list.
+
+        Only moves that are new (or changed) since the last render are
+        rasterized. A full prefix comparison is done only when the dirty
+        version changed; otherwise a cheap length/last-move check is enough
+        to catch appended or undone moves.
+
+        Args:
+            move_history_san (List[str]): Complete move history in SAN format.
+        """
+        texts = self._move_texts
+        surfaces = self._move_surfaces
+        old_count = len(texts)
+
+        if self._dirty_version != self._last_rendered_version:
+            # History may have been replaced wholesale - find common prefix
+            keep = 0
+            limit = min(len(texts), len(move_history_san))
+            while keep < limit and texts[keep] == move_history_san[keep]:
+                keep += 1
+            self._last_rendered_version = self._dirty_version
+        else:
+            # Fast path: only trailing moves can have changed (append / undo,
+            # possibly followed by different moves)
+            keep = min(len(texts), len(move_history_san))
+            while keep and texts[keep - 1] != move_history_san[keep - 1]:
+                keep -= 1
+
+        # Any dropped or added move invalidates the rendered panel
+        if keep != old_count or keep != len(move_history_san):
+            self._moves_gen += 1
+
+        # Drop stale surfaces (undone or replaced moves)
+        del texts[keep:]
+        del surfaces[keep:]
+
+        # Render only the moves that are not cached yet
+        for san in move_history_san[keep:]:
+            texts.append(san)
+            surfaces.append(self.move_font.render(san, True, Colors.TEXT_PRIMARY))
+
+        # Grow move number labels to cover every move pair
+        pair_count = (len(move_history_san) + 1) // 2
+        for move_num in range(len(self._number_surfaces) + 1, pair_count + 1):
+            self._number_surfaces.append(
+                self.move_font.render(f"{move_num:>3}.", True, Colors.COORDINATE_TEXT)
+            )
+
+    def draw(
+        self, move_history_san: List[str], current_move_number: int = -1
+    ) -> pygame.Rect:
         """
         Render the complete move history panel with all visual elements.
 
@@ -113,6 +207,115 @@ class MoveHistoryPanel:
                 - 2: Highlight third move (White's second move)
                 Useful for move navigation and game replay features.
                 Defaults to -1 (no highlighting).
+
+        Returns:
+            pygame.Rect: Panel area, for partial display updates.
+        """
+        # -------------------- Sync Cached Move Surfaces --------------------
+
+        # Rasterize only moves added since the last frame
+        self._sync_move_surfaces(move_history_san)
+        move_count = len(move_history_san)
+
+        # -------------------- Scroll Position Calculation --------------------
+
+        # Calculate total number of lines to display
+        # Each move pair (White + Black) occupies one line
+        total_lines = (move_count + 1) // 2
+
+        # Calculate maximum valid scroll position
+        max_scroll = max(0, total_lines - self.visible_lines)
+
+        # Clamp scroll offset to valid range
+        # Prevents scrolling too far down
+        self.scroll_offset = int(min(self.scroll_offset, max_scroll))
+
+        # Auto-scroll feature: stick to bottom when at or near bottom
+        # If user is viewing latest moves, keep showing latest as new moves arrive
+        if self.scroll_offset >= max_scroll - 1:
+            self.scroll_offset = max_scroll
+
+        # -------------------- Reuse Last Rendering --------------------
+
+        # Line and half-move under the cursor (None if not over a move line)
+        start_idx = self.scroll_offset
+        end_idx = min(start_idx + self.visible_lines, total_lines)
+        hover = self._hover_slot(pygame.mouse.get_pos(), end_idx - start_idx)
+
+        key = (
+            self._moves_gen,
+            current_move_number,
+            self.scroll_offset,
+            hover,
+            tuple(self.rect),
+        )
+        if key == self._panel_key:
+            # Nothing visible changed - hover_move_index is still valid too
+            self.screen.blit(self._panel_surface, self.rect)
+            return self.rect
+
+        self._render_panel(
+            move_count, total_lines, start_idx, end_idx, hover, current_move_number
+        )
+
+        # Keep a copy for the following draws
+        area = self.rect.clip(self.screen.get_rect())
+        self._panel_surface = self.screen.subsurface(area).copy()
+        self._panel_key = key
+
+        return self.rect
+
+    def _hover_slot(
+        self, mouse_pos: Tuple[int, int], visible_count: int
+    ) -> Optional[Tuple[int, bool]]:
+        """
+        Find the visible move line and half under the mouse cursor.
+
+        Args:
+            mouse_pos (Tuple[int, int]): Mouse position in screen coordinates
+            visible_count (int): Number of move lines currently shown
+
+        Returns:
+            Optional[Tuple[int, bool]]: (line offset from the first visible
+                line, True for the White half) or None if not over a line
+        """
+        mouse_x, mouse_y = mouse_pos
+
+        # Same geometry as the per-line rects in _render_panel()
+        left = self.rect.x + self.padding
+        if not left <= mouse_x < self.rect.right - self.padding:
+            return None
+
+        top = self.rect.y + 35 + 10 - 2
+        if mouse_y < top:
+            return None
+
+        line = (mouse_y - top) // self.line_height
+        if line >= visible_count:
+            return None
+
+        # White half ends where its 80px highlight rect ends
+        return line, mouse_x < left + 45 + 80
+
+    def _render_panel(
+        self,
+        move_count: int,
+        total_lines: int,
+        start_idx: int,
+        end_idx: int,
+        hover: Optional[Tuple[int, bool]],
+        current_move_number: int,
+    ):
+        """
+        Draw the whole panel onto the screen.
+
+        Args:
+            move_count (int): Number of half-moves in the history
+            total_lines (int): Number of move pairs in the history
+            start_idx (int): First visible move pair
+            end_idx (int): Move pair after the last visible one
+            hover (Optional[Tuple[int, bool]]): Result of _hover_slot()
+            current_move_number (int): Half-move to highlight (-1 for none)
         """
         # -------------------- Background and Border --------------------
 
@@ -153,7 +356,7 @@ class MoveHistoryPanel:
         # -------------------- Handle Empty Move List --------------------
 
         # Check if game has no moves yet
-        if not move_history_san:
+        if not move_count:
             # Render placeholder text in gray
             no_moves_text = self.move_font.render("No moves yet", True, (150, 150, 150))
 
@@ -166,61 +369,14 @@ class MoveHistoryPanel:
             self.screen.blit(no_moves_text, no_moves_rect)
 
             # Exit early - no moves to render
+            self.hover_move_index = None
             return
 
-        # -------------------- Format Moves into Pairs --------------------
-
-        # Convert flat move list into traditional paired format
-        # Input:  ["e4", "e5", "Nf3", "Nc6", "Bb5"]
-        # Output: [(1, "e4", "e5"), (2, "Nf3", "Nc6"), (3, "Bb5", "")]
-        move_pairs = []
-        for i in range(0, len(move_history_san), 2):
-            # Calculate move number (1, 2, 3, ...)
-            # Each pair represents one full move (White + Black)
-            move_num = (i // 2) + 1
-
-            # Get White's move
-            white_move = move_history_san[i]
-
-            # Get Black's move if it exists
-            black_move = (
-                move_history_san[i + 1] if i + 1 < len(move_history_san) else ""
-            )
-
-            # Store as tuple: (move_number, white_move, black_move)
-            move_pairs.append((move_num, white_move, black_move))
-
-        # -------------------- Scroll Position Calculation --------------------
-
-        # Calculate total number of lines to display
-        # Each move pair occupies one line
-        total_lines = len(move_pairs)
-
-        # Calculate maximum valid scroll position
-        max_scroll = max(0, total_lines - self.visible_lines)
-
-        # Clamp scroll offset to valid range
-        # Prevents scrolling too far down
-        self.scroll_offset = int(min(self.scroll_offset, max_scroll))
-
-        # Auto-scroll feature: stick to bottom when at or near bottom
-        # If user is viewing latest moves, keep showing latest as new moves arrive
-        if self.scroll_offset >= max_scroll - 1:
-            self.scroll_offset = max_scroll
-
         # -------------------- Calculate Visible Move Window --------------------
 
         # Starting Y position for first visible move
         y_offset = separator_y + 10
 
-        # Calculate which moves are visible in current scroll position
-        start_idx = int(self.scroll_offset)
-
-        # Calculate end index (non-inclusive)
-        end_idx = min(start_idx + self.visible_lines, total_lines)
-
-        # Get current mouse position for hover detection
-        mouse_pos = pygame.mouse.get_pos()
         self.hover_move_index = None
 
         # -------------------- Render Visible Moves --------------------
@@ -228,8 +384,8 @@ class MoveHistoryPanel:
         # Iterate through only the visible move pairs
         # Performance optimization - don't render off-screen moves
         for i in range(start_idx, end_idx):
-            # Unpack move pair data
-            move_num, white_move, black_move = move_pairs[i]
+            # Does this line have a Black move yet?
+            has_black_move = i * 2 + 1 < move_count
 
             # Determine if this move pair contains the current move
             is_current = current_move_number >= 0 and (
@@ -260,18 +416,17 @@ class MoveHistoryPanel:
             )
 
             # Check if mouse is hovering over this line
-            is_hovering = move_line_rect.collidepoint(mouse_pos)
+            is_hovering = hover is not None and hover[0] == i - start_idx
 
             # Hover highlight
             if is_hovering:
                 # Hover on specific half
-                mouse_x = mouse_pos[0]
-                if mouse_x < white_start_x + white_width:
+                if hover[1]:
                     pygame.draw.rect(self.screen, (70, 70, 80), white_rect)
                     self.hover_move_index = i * 2
                 else:
                     pygame.draw.rect(self.screen, (70, 70, 80), black_rect)
-                    if black_move:
+                    if has_black_move:
                         self.hover_move_index = i * 2 + 1
                     else:
                         self.hover_move_index = None  # No black move
@@ -284,33 +439,24 @@ class MoveHistoryPanel:
             # Add darker highlight for exact half-move
             if current_move_number == i * 2:
                 pygame.draw.rect(self.screen, specific_highlight_color, white_rect)
-            elif current_move_number == i * 2 + 1 and black_move:
+            elif current_move_number == i * 2 + 1 and has_black_move:
                 pygame.draw.rect(self.screen, specific_highlight_color, black_rect)
 
-            # Render move number
-            move_num_text = f"{move_num:>3}."
-            move_num_surface = self.move_font.render(
-                move_num_text, True, Colors.COORDINATE_TEXT
-            )
+            # Blit cached move number
             self.screen.blit(
-                move_num_surface, (self.rect.x + self.padding + 5, y_offset)
+                self._number_surfaces[i], (self.rect.x + self.padding + 5, y_offset)
             )
 
-            # Render White's move
-            white_move_surface = self.move_font.render(
-                white_move, True, Colors.TEXT_PRIMARY
-            )
+            # Blit cached White move
             self.screen.blit(
-                white_move_surface, (self.rect.x + self.padding + 50, y_offset)
+                self._move_surfaces[i * 2], (self.rect.x + self.padding + 50, y_offset)
             )
 
-            # Render Black's move (if exists)
-            if black_move:
-                black_move_surface = self.move_font.render(
-                    black_move, True, Colors.TEXT_PRIMARY
-                )
+            # Blit cached Black move (if exists)
+            if has_black_move:
                 self.screen.blit(
-                    black_move_surface, (self.rect.x + self.padding + 130, y_offset)
+                    self._move_surfaces[i * 2 + 1],
+                    (self.rect.x + self.padding + 130, y_offset),
                 )
 
             # Move to next line
@@ -472,6 +618,9 @@ class MoveHistoryPanel:
         # draw() method will clamp this to max_scroll automatically
         self.scroll_offset = 999999
 
+        # Let draw() re-validate cached move surfaces on the next frame
+        self._dirty_version += 1
+
     def scroll_to_top(self):
         """
         Jump to top of move history to show first moves of the game.
@@ -479,6 +628,9 @@ class MoveHistoryPanel:
         # Reset to beginning of history
         self.scroll_offset = 0
 
+        # Called on new game - history is about to be replaced
+        self._dirty_version += 1
+
     def handle_mouse_wheel(self, y_delta: int):
         """
         Process mouse wheel scrolling event.
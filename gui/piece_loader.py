@@ -41,6 +41,15 @@ class PieceLoader:
         # Initialize empty cache for scaled images
         self.cache = {}
 
+        # Full-resolution images decoded from disk, keyed by piece symbol.
+        # Loading a new size (e.g. after a window resize) rescales these
+        # instead of reading the PNG files again.
+        self.originals = {}
+
+        # Small icons at an exact pixel size, keyed by (symbol, size).
+        # Lets other components (captured pieces) share the decoded images
+        self.icon_cache = {}
+
         # Symbol to Filename Mapping
 
         # Maps chess.Piece.symbol() output to PNG filenames
@@ -69,6 +78,8 @@ class PieceLoader:
         Loads PNG images from disk, scales them to match the board square size
         (80% of square for padding), and stores them in the cache. If images
         are already cached at this size, returns immediately (idempotent).
+        Only the most recent size is kept: images and icons scaled for a
+        previous window size are dropped so repeated resizes don't pile up.
 
         Args:
             square_size: int
@@ -86,6 +97,12 @@ class PieceLoader:
         if cache_key in self.cache:
             return
 
+        # Evict Old Sizes
+        # The board only ever draws at one square size, so drop the images
+        # (and icons) scaled for the previous size before building this one
+        self.cache.clear()
+        self.icon_cache.clear()
+
         # Initialize Cache Entry
 
         # Create empty dictionary to store all 12 piece images at this size
@@ -93,34 +110,99 @@ class PieceLoader:
 
         # Load All Pieces
         # Iterate through all 12 chess pieces (6 white + 6 black)
-        for symbol, name in self.symbol_to_name.items():
-            try:
+        for symbol in self.symbol_to_name:
+            self.cache[cache_key][symbol] = self._scaled(symbol, piece_size)
+
+    def _scaled(self, symbol, size):
+        """
+        Scale the decoded image of one piece to a square of the given size.
+
+        The PNG is read from disk only the first time a piece is needed; a
+        colored placeholder is returned if it cannot be loaded.
+
+        Args:
+            symbol: str
+                Piece symbol ('P', 'n', 'K', etc.)
+            size: int
+                Target width and height in pixels
+
+        Returns:
+            pygame.Surface
+                The scaled piece image (or placeholder)
+        """
+        name = self.symbol_to_name[symbol]
+        try:
+            original = self.originals.get(symbol)
+            if original is None:
                 # Construct full path to PNG file
                 # path = f"{self.piece_dir}/{name}.png"
                 path = resource_loader.resource_path(f"{self.piece_dir}\\{name}.png")
 
-                # Load PNG image from disk
+                # Load PNG image from disk (once per piece)
                 original = pygame.image.load(path).convert_alpha()
+                self.originals[symbol] = original
+
+            # Scale image to requested size
+            return pygame.transform.smoothscale(original, (size, size))
 
-                # Scale image to calculated piece size
-                scaled = pygame.transform.smoothscale(
-                    original, (piece_size, piece_size)
-                )
+        except pygame.error as e:
+            # Handle missing or invalid image files
+            print(f"Error loading {name}: {e}")
 
-                # Store scaled image in cache
-                self.cache[cache_key][symbol] = scaled
+            # Create colored placeholder surface
+            # Red for white pieces, blue for black pieces
+            # In the display's pixel format like the real sprites
+            placeholder = pygame.Surface((size, size)).convert()
+            placeholder.fill((255, 0, 0) if symbol.isupper() else (0, 0, 255))
 
-            except pygame.error as e:
-                # Handle missing or invalid image files
-                print(f"Error loading {name}: {e}")
+            # Game continues with colored squares
+            return placeholder
 
-                # Create colored placeholder surface
-                # Red for white pieces, blue for black pieces
-                placeholder = pygame.Surface((piece_size, piece_size))
-                placeholder.fill((255, 0, 0) if symbol.isupper() else (0, 0, 255))
+    def get_piece_set(self, square_size):
+        """
+        Retrieve all 12 scaled piece images for one square size.
+
+        Lets the board resolve the size once (on init and resize) instead of
+        on every piece it draws.
 
-                # Store placeholder in cache (game continues with colored squares)
-                self.cache[cache_key][symbol] = placeholder
+        Args:
+            square_size: int
+                Size of chess board squares in pixels
+
+        Returns:
+            dict
+                Piece symbol ('P', 'n', etc.) -> scaled pygame.Surface
+        """
+        self.load_pieces(square_size)
+        return self.cache[f"size_{square_size}"]
+
+    def get_piece_icon(self, piece, size):
+        """
+        Retrieve a piece image scaled to exactly size x size pixels.
+
+        Used for pieces drawn outside the board (captured pieces, promotion
+        choices). Icons are scaled from the already decoded images and cached
+        per size until the board is next resized.
+
+        Args:
+            piece: chess.Piece or str
+                Either a chess.Piece object or a symbol string ('P', 'n', etc.)
+            size: int
+                Icon width and height in pixels
+
+        Returns:
+            pygame.Surface or None
+                The scaled icon, or None if the symbol is not recognized
+        """
+        symbol = piece.symbol() if isinstance(piece, chess.Piece) else piece
+        if symbol not in self.symbol_to_name:
+            return None
+
+        key = (symbol, size)
+        icon = self.icon_cache.get(key)
+        if icon is None:
+            icon = self.icon_cache[key] = self._scaled(symbol, size)
+        return icon
 
     def get_piece_image(self, piece, square_size):
         """
@@ -11,6 +11,7 @@ import pygame
 import time
 from typing import Optional, Tuple
 from gui.colors import Colors
+from gui.fonts import get_font
 
 
 class PlayerClock:
@@ -53,8 +54,8 @@ class PlayerClock:
         self.time_control = time_control
 
         # Fonts
-        self.label_font = pygame.font.SysFont("Arial", 11, bold=True)
-        self.time_font = pygame.font.SysFont("Courier New", 22, bold=True)
+        self.label_font = get_font("Arial", 11, bold=True)
+        self.time_font = get_font("Courier New", 22, bold=True)
 
         # Time tracking
         self.time_remaining = time_control
@@ -62,6 +63,24 @@ class PlayerClock:
         self.last_update_time = None
         self.paused = True
 
+        # Whole seconds shown by the last draw() (None = never drawn)
+        self._drawn_seconds: Optional[int] = None
+
+        # Rendered text reused by draw(): the name never changes, the time
+        # only when the displayed string or its urgency color does
+        name_color = (255, 255, 255) if player_color else (150, 150, 150)
+        self._name_surface = self.label_font.render(player_name, True, name_color)
+        self._time_key: Optional[Tuple[str, Tuple[int, int, int]]] = None
+        self._time_surface: Optional[pygame.Surface] = None
+
+    def resize(self, screen: pygame.Surface, x: int, y: int, width: int, height: int):
+        """Move/resize the clock in place, keeping its running time state."""
+        self.screen = screen
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+
     def start(self):
         """Start the clock (unpause)."""
         self.paused = False
@@ -106,8 +125,8 @@ class PlayerClock:
         # Deduct time, clamp to 0
         self.time_remaining = max(0, self.time_remaining - elapsed)
 
-    def draw(self):
-        """Render the player clock."""
+    def draw(self) -> pygame.Rect:
+        """Render the player clock and return the area it covers."""
         # Update time if active
         if not self.paused:
             self.update()
@@ -129,10 +148,7 @@ class PlayerClock:
         pygame.draw.rect(self.screen, Colors.BORDER, rect, border_width)
 
         # Draw player name label (small, top-left)
-        name_color = (255, 255, 255) if self.player_color else (150, 150, 150)
-        name_surface = self.label_font.render(self.player_name, True, name_color)
-        name_rect = name_surface.get_rect(x=self.x + 8, y=self.y + 4)
-        self.screen.blit(name_surface, name_rect)
+        self.screen.blit(self._name_surface, (self.x + 8, self.y + 4))
 
         # Draw time
         if self.time_remaining is None:
@@ -153,13 +169,52 @@ class PlayerClock:
             else:
                 time_color = (255, 255, 255)  # White - normal
 
-        # Render time (large, centered)
-        time_surface = self.time_font.render(time_str, True, time_color)
+        # Render time (large, centered) - only when the text changed
+        if self._time_key != (time_str, time_color):
+            self._time_key = (time_str, time_color)
+            self._time_surface = self.time_font.render(time_str, True, time_color)
+        time_surface = self._time_surface
         time_rect = time_surface.get_rect(
             centerx=self.x + self.width // 2, y=self.y + 22  # Below player name
         )
         self.screen.blit(time_surface, time_rect)
 
+        # Remember what is on screen so needs_redraw() can skip idle frames
+        self._drawn_seconds = (
+            None if self.time_remaining is None else int(self.time_remaining)
+        )
+
+        return rect
+
+    def needs_redraw(self) -> bool:
+        """
+        Check whether the displayed time differs from the last drawn frame.
+
+        Returns:
+            bool: True if a running clock has ticked over to a new second
+        """
+        if self.paused or not self.is_active or self.time_remaining is None:
+            return False
+        self.update()
+        return int(self.time_remaining) != self._drawn_seconds
+
+    def ms_until_redraw(self) -> Optional[int]:
+        """
+        Time until the displayed second changes (or the clock runs out).
+
+        Lets the main loop sleep while nothing else is happening.
+
+        Returns:
+            Optional[int]: Milliseconds until needs_redraw() turns True, or
+                None if the clock is not running
+        """
+        if self.paused or not self.is_active or self.time_remaining is None:
+            return None
+        self.update()
+        # The display shows whole seconds, so it changes when the remaining
+        # time drops below the next integer - which is also when it hits 0
+        return int((self.time_remaining % 1) * 1000) + 1
+
     def is_time_expired(self) -> bool:
         """Check if time has run out."""
         if self.time_control is None:
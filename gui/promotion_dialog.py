@@ -11,6 +11,8 @@ import pygame
 import chess
 from typing import Optional, Tuple
 from gui.colors import Colors
+from gui.fonts import render_text
+from gui.events import MAIN_LOOP_EVENTS
 
 
 class PromotionDialog:
@@ -129,9 +131,8 @@ class PromotionDialog:
             pygame.draw.rect(self.screen, Colors.BORDER, dialog_rect, 3)
 
             # Render title text centered at top of dialog
-            font = pygame.font.SysFont("Arial", 24, bold=True)
-            title_text = font.render(
-                "Choose Promotion Piece", True, Colors.COORDINATE_TEXT
+            title_text = render_text(
+                "Choose Promotion Piece", 24, Colors.COORDINATE_TEXT, bold=True
             )
             # Center title horizontally
             title_rect = title_text.get_rect(
@@ -178,7 +179,11 @@ class PromotionDialog:
                 piece = chess.Piece(
                     piece_type, chess.WHITE if is_white else chess.BLACK
                 )
-                image = self.piece_loader.get_piece_image(piece, self.piece_size)
+                # Fetched as an icon (80% of the button) so the fixed dialog
+                # size doesn't evict the board's piece images from the cache
+                image = self.piece_loader.get_piece_icon(
+                    piece, int(self.piece_size * 0.8)
+                )
 
                 if image:
                     # Center image in the button
@@ -193,7 +198,7 @@ class PromotionDialog:
 
             # Process all pending events in the queue
             # This loop handles user input (keyboard, mouse, window close)
-            for event in pygame.event.get():
+            for event in pygame.event.get(exclude=MAIN_LOOP_EVENTS):
                 # Handle window close button (X button)
                 if event.type == pygame.QUIT:
                     # Return None to signal cancellation
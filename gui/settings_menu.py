@@ -9,12 +9,14 @@ from tkinter import font
 import pygame
 from typing import Optional, Tuple
 from gui.colors import Colors
+from gui.fonts import get_font
 from utils.config import Config
 import tkinter as tk
 from tkinter import filedialog
 import os
 
 from utils.config_persistence import save_config_to_file
+from gui.events import MAIN_LOOP_EVENTS
 
 
 class SettingsMenu:
@@ -42,13 +44,13 @@ class SettingsMenu:
         self.menu_height = 650
 
         # Title font: Large bold for "Settings" header
-        self.title_font = pygame.font.SysFont("Arial", 32, bold=True)
+        self.title_font = get_font("Arial", 32, bold=True)
 
         # Label font: Medium for setting names and values
-        self.label_font = pygame.font.SysFont("Arial", 18)
+        self.label_font = get_font("Arial", 18)
 
         # Button font: Smaller bold for close button
-        self.button_font = pygame.font.SysFont("Arial", 16, bold=True)
+        self.button_font = get_font("Arial", 16, bold=True)
 
         # Load current configuration values into settings dictionary
         self.settings = self._initialize_settings()
@@ -430,7 +432,7 @@ class SettingsMenu:
 
             # -------------------- Process Events --------------------
 
-            for event in pygame.event.get():
+            for event in pygame.event.get(exclude=MAIN_LOOP_EVENTS):
                 # Event: Window Close (X button)
                 if event.type == pygame.QUIT:
                     # User closed window, exit menu and return change status
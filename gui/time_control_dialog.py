@@ -7,6 +7,8 @@ Modal dialog for selecting chess time control before game start.
 import pygame
 from typing import Optional, Tuple
 from gui.colors import Colors
+from gui.fonts import get_font
+from gui.events import MAIN_LOOP_EVENTS
 
 
 class TimeControlDialog:
@@ -34,11 +36,11 @@ class TimeControlDialog:
         self.dialog_height = 520
 
         # Fonts
-        self.title_font = pygame.font.SysFont("Arial", 32, bold=True)
-        self.button_font = pygame.font.SysFont("Arial", 18, bold=True)
-        self.desc_font = pygame.font.SysFont("Arial", 14)
-        self.input_font = pygame.font.SysFont("Arial", 20)
-        self.label_font = pygame.font.SysFont("Arial", 14)
+        self.title_font = get_font("Arial", 32, bold=True)
+        self.button_font = get_font("Arial", 18, bold=True)
+        self.desc_font = get_font("Arial", 14)
+        self.input_font = get_font("Arial", 20)
+        self.label_font = get_font("Arial", 14)
 
         # Custom input state
         self.custom_input = ""
@@ -237,7 +239,7 @@ class TimeControlDialog:
             pygame.display.flip()
 
             # Event handling
-            for event in pygame.event.get():
+            for event in pygame.event.get(exclude=MAIN_LOOP_EVENTS):
                 if event.type == pygame.QUIT:
                     return None  # Unlimited
 
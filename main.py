@@ -9,15 +9,46 @@ uses pygame for rendering and the python-chess library for chess logic.
 """
 
 import sys
-from typing import List
+import logging
+import multiprocessing
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
 import pygame
 import chess
+from chess import (
+    WHITE as CHESS_WHITE,
+    BLACK as CHESS_BLACK,
+    BB_SQUARES as CHESS_BB_SQUARES,
+    scan_forward as chess_scan_forward,
+)
+
+# Event types and keys used by the main loop and handlers, bound to bare
+# module names so each per-frame reference is a single global lookup
+from pygame import (
+    QUIT,
+    KEYDOWN,
+    MOUSEBUTTONDOWN,
+    MOUSEBUTTONUP,
+    MOUSEMOTION,
+    MOUSEWHEEL,
+    VIDEORESIZE,
+    K_ESCAPE,
+    K_LEFT,
+    K_RIGHT,
+    K_UP,
+    K_DOWN,
+    K_s,
+    K_h,
+    K_r,
+    K_u,
+)
 
 from gui.board_gui import BoardGUI
 from gui.input_handler import InputHandler
 from utils.config import Config
-from gui.colors import Colors
-from gui.board_state import BoardState
+from gui.fonts import render_text
+from gui.board_state import BoardState, cached_piece_grid
 from gui.game_result_dialog import GameResultDialog
 from gui.move_history_panel import MoveHistoryPanel
 from gui.game_controls import (
@@ -34,18 +65,33 @@ from gui.settings_menu import SettingsMenu
 from gui.help_screen import HelpScreen
 from gui.layout_handler import LayoutHandler
 from gui.color_selection_dialog import ColorSelectionDialog
+from gui.events import ENGINE_MOVE_READY
 
-from engine.engine_wrapper import (
-    close_engine,
-    initialize_engine as init_engine_wrapper,
-    is_engine_ready,
-)
-from engine.engine_controller import EngineController
+from engine.engine_controller import EngineController, MoveReady
 from utils.config_persistence import load_config_from_file
 
 # Load persisted settings first (before anything else uses Config)
 load_config_from_file()
 
+# Application logger - level is configured from Config.LOG_LEVEL in main()
+log = logging.getLogger("chess_gui")
+
+# Single background worker for PGN file I/O so the render loop never blocks
+_io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pgn-io")
+
+# LRU cache of game-end results keyed by python-chess's `_transposition_key()` tuple
+_END_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+_END_CACHE_SIZE = 4096
+
+# Below this many reversible plies neither the 50-move rule nor a threefold
+# repetition claim is possible, so the result depends on the position alone
+_END_CACHE_MAX_HALFMOVES = 7
+
+
+def clear_end_cache():
+    """Drop all cached game-end results (new game / loaded game)."""
+    _END_CACHE.clear()
+
 
 def initialize_pygame():
     """
@@ -78,35 +124,90 @@ def initialize_pygame():
     # Initialize clock for controlling frame rate
     clock = pygame.time.Clock()
 
+    # Only queue event types something actually handles; SDL drops every
+    # other type in C before it reaches the Python-level event loops.
+    # - MOUSEMOTION stays enabled: hover effects in the side panels need it
+    #   (consecutive motion events are coalesced by the main loop)
+    # - TEXTINPUT stays enabled: dialogs read KEYDOWN.unicode, which SDL
+    #   fills from text input
+    # - Expose events ask for a repaint now that unchanged frames are skipped
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(
+        [
+            QUIT,
+            KEYDOWN,
+            MOUSEBUTTONDOWN,
+            MOUSEBUTTONUP,
+            MOUSEMOTION,
+            MOUSEWHEEL,
+            VIDEORESIZE,
+            pygame.TEXTINPUT,
+            pygame.VIDEOEXPOSE,
+            pygame.WINDOWEXPOSED,
+            ENGINE_MOVE_READY,
+        ]
+    )
+
     print(f"[Init] Window created: {Config.WINDOW_WIDTH}x{Config.WINDOW_HEIGHT}")
     print("[Init] Window is resizable (drag edges to resize)")
     return screen, clock
 
 
+def _post_engine_move(
+    request_id: int, move_uci: Optional[str], ready: Optional[MoveReady]
+):
+    """
+    Engine listener hook: wake the main loop with the finished move.
+
+    Runs on the controller's listener thread; pygame.event.post is thread-safe.
+
+    Args:
+        request_id: Id of the request this move answers
+        move_uci: UCI move string, or None if the engine failed
+        ready: Move analyzed against the searched position (SAN, sound
+            flags), or None if the move is illegal there
+    """
+    try:
+        pygame.event.post(
+            pygame.event.Event(
+                ENGINE_MOVE_READY, uci=move_uci, request_id=request_id, ready=ready
+            )
+        )
+    except pygame.error:
+        # Display already shut down - nobody is waiting for the move
+        pass
+
+
 def initialize_engine(engine_path=None):
     """
-    Load and initialize the chess engine model.
+    Start the chess engine that will serve as the AI opponent.
 
-    Placeholder for loading a neural network or traditional
-    chess engine that will serve as the AI opponent.
+    The engine is loaded inside a dedicated subprocess owned by the
+    EngineController, so its search never competes with the render loop.
 
     Returns:
-        EngineController: Controller managing engine operations and threading
+        EngineController: Controller managing the engine process
     """
-    print("\n[Engine] Initializing inference engine...")
+    print("\n[Engine] Starting engine process...")
 
-    # Initialize engine wrapper
-    success = init_engine_wrapper()
+    # Create engine controller (spawns the engine process, loads in background)
+    # Finished moves are delivered to the main loop as ENGINE_MOVE_READY events
+    controller = EngineController(on_move_ready=_post_engine_move)
 
-    if success:
-        print("[Engine] ✅ Engine loaded successfully")
-    else:
-        print("[Engine] ⚠️ Engine not available - will use random moves as fallback")
+    return controller
 
-    # Create engine controller (handles threading)
-    controller = EngineController()
 
-    return controller
+# (result_type, reason) reported for each way a game can end; the winner of
+# a checkmate comes from the outcome itself
+_TERMINATION_RESULTS = {
+    chess.Termination.CHECKMATE: ("checkmate", ""),
+    chess.Termination.STALEMATE: ("stalemate", ""),
+    chess.Termination.INSUFFICIENT_MATERIAL: ("draw", "insufficient material"),
+    chess.Termination.FIFTY_MOVES: ("draw", "50-move rule"),
+    chess.Termination.SEVENTYFIVE_MOVES: ("draw", "75-move rule"),
+    chess.Termination.THREEFOLD_REPETITION: ("draw", "threefold repetition"),
+    chess.Termination.FIVEFOLD_REPETITION: ("draw", "fivefold repetition"),
+}
 
 
 def check_game_end_conditions(board_state: BoardState) -> tuple:
@@ -121,29 +222,34 @@ def check_game_end_conditions(board_state: BoardState) -> tuple:
     """
     board = board_state.board
 
-    # Checkmate
-    if board.is_checkmate():
-        winner = "White" if board.turn == chess.BLACK else "Black"
-        return (True, "checkmate", winner, "")
-
-    # Stalemate
-    if board.is_stalemate():
-        return (True, "stalemate", None, "")
-
-    # Insufficient material
-    if board.is_insufficient_material():
-        return (True, "draw", None, "insufficient material")
-
-    # Fifty-move rule
-    if board.can_claim_fifty_moves():
-        return (True, "draw", None, "50-move rule")
+    # Draw claims depend on move history, so only cache while none is possible
+    cacheable = board.halfmove_clock < _END_CACHE_MAX_HALFMOVES
+    if cacheable:
+        key = board._transposition_key()
+        cached = _END_CACHE.get(key)
+        if cached is not None:
+            _END_CACHE.move_to_end(key)
+            return cached
+
+    # Single legal-move pass covering every termination (incl. draw claims)
+    outcome = board.outcome(claim_draw=True)
+
+    if outcome is None:
+        # Game continues
+        result = (False, None, None, None)
+    else:
+        result_type, reason = _TERMINATION_RESULTS[outcome.termination]
+        winner = None
+        if outcome.winner is not None:
+            winner = "White" if outcome.winner == CHESS_WHITE else "Black"
+        result = (True, result_type, winner, reason)
 
-    # Threefold repetition
-    if board.can_claim_threefold_repetition():
-        return (True, "draw", None, "threefold repetition")
+    if cacheable:
+        _END_CACHE[key] = result
+        if len(_END_CACHE) > _END_CACHE_SIZE:
+            _END_CACHE.popitem(last=False)
 
-    # Game continues
-    return (False, None, None, None)
+    return result
 
 
 def navigate_to_move(move_index: int, full_move_history: List[str]):
@@ -158,41 +264,80 @@ def navigate_to_move(move_index: int, full_move_history: List[str]):
         New BoardState at the requested position
     """
     # DEBUG: Print what we're trying to do
-    print(f"[navigate_to_move] DEBUG INFO:")
-    print(f"  move_index = {move_index}")
-    print(f"  full_move_history length = {len(full_move_history)}")
-    print(f"  full_move_history = {full_move_history}")
+    log.debug("[navigate_to_move] DEBUG INFO:")
+    log.debug("  move_index = %s", move_index)
+    log.debug("  full_move_history length = %s", len(full_move_history))
+    log.debug("  full_move_history = %s", full_move_history)
 
     # Create fresh board
     nav_state = BoardState()
 
     # Replay moves up to and including the selected move
     moves_to_play = move_index + 1 if move_index >= 0 else len(full_move_history)
-    print(f"  moves_to_play = {moves_to_play}")
+    log.debug("  moves_to_play = %s", moves_to_play)
 
     for i in range(min(moves_to_play, len(full_move_history))):
         move_uci = full_move_history[i]
-        print(f"  [{i}] Applying move: '{move_uci}'")
+        log.debug("  [%s] Applying move: '%s'", i, move_uci)
 
         try:
             nav_state.make_move_uci(move_uci)
-            print(
-                f"      ✓ Success - board now has {len(nav_state.board.move_stack)} moves"
+            log.debug(
+                "      ✓ Success - board now has %s moves",
+                len(nav_state.board.move_stack),
             )
         except Exception as e:
-            print(f"      ✗ FAILED: {e}")
-            print(f"      Board state before error:")
-            print(f"        FEN: {nav_state.get_fen()}")
-            print(f"        Turn: {nav_state.get_turn_string()}")
+            log.debug("      ✗ FAILED: %s", e)
+            log.debug("      Board state before error:")
+            log.debug("        FEN: %s", nav_state.get_fen())
+            log.debug("        Turn: %s", nav_state.get_turn_string())
             break
 
-    print(f"  Final board.move_stack length: {len(nav_state.board.move_stack)}")
-    print(f"  Final FEN: {nav_state.get_fen()}")
+    log.debug("  Final board.move_stack length: %s", len(nav_state.board.move_stack))
+    log.debug("  Final FEN: %s", nav_state.get_fen())
 
     return nav_state
 
 
-def check_engine_turn_and_move(board_state, engine_controller, move_history):
+def load_board_state_from_pgn_file(filepath: str) -> Optional[BoardState]:
+    """
+    Read a PGN file and replay it into a new BoardState.
+
+    Runs on the background I/O worker, so it must not touch pygame or any
+    state owned by the main loop.
+
+    Args:
+        filepath: Path of the PGN file to load
+
+    Returns:
+        New BoardState with the game loaded, or None if the file could not be read
+
+    Raises:
+        ValueError: If the file does not contain a valid PGN game
+    """
+    pgn_string = load_pgn_from_file(filepath)
+    if not pgn_string:
+        return None
+
+    return BoardState.from_pgn(pgn_string)
+
+
+def get_player_colors() -> tuple:
+    """
+    Resolve the configured player colors to python-chess color booleans.
+
+    Called once at startup and again whenever a new game picks colors, so the
+    event handlers compare against cached booleans instead of Config strings.
+
+    Returns:
+        tuple: (human_color, engine_color) as chess.WHITE / chess.BLACK
+    """
+    return Config.HUMAN_CHESS_COLOR, Config.ENGINE_CHESS_COLOR
+
+
+def check_engine_turn_and_move(
+    board_state, engine_controller, move_history, engine_color
+):
     """
     Check if it's engine's turn and request move if needed.
 
@@ -200,13 +345,11 @@ def check_engine_turn_and_move(board_state, engine_controller, move_history):
         board_state: BoardState instance
         engine_controller: EngineController instance
         move_history: List of moves in UCI notation
+        engine_color: Engine's side as chess.WHITE / chess.BLACK
 
     Returns:
         True if engine is now thinking, False otherwise
     """
-    # Determine engine color
-    engine_color = chess.BLACK if Config.HUMAN_COLOR == "white" else chess.WHITE
-
     # Check if it's engine's turn
     if board_state.board.turn == engine_color:
         # Check if engine is already thinking
@@ -215,7 +358,7 @@ def check_engine_turn_and_move(board_state, engine_controller, move_history):
             if board_state.is_game_over():
                 return False
 
-            print(f"\n[Engine] Engine's turn ({board_state.get_turn_string()})")
+            log.debug("[Engine] Engine's turn (%s)", board_state.get_turn_string())
 
             # Request move from engine (non-blocking)
             engine_controller.request_move(
@@ -230,58 +373,67 @@ def check_engine_turn_and_move(board_state, engine_controller, move_history):
     return False
 
 
-def reset_game_state(
+def finalize_move(
     board_state,
-    input_handler,
-    move_history,
-    full_san_history,
     engine_controller,
-    move_panel,
+    move_history,
+    engine_color,
+    result_dialog,
+    sound_manager,
     white_clock,
     black_clock,
-    move_animator,
-    sound_manager,
-    time_control,
-):
+    forced_result: Optional[tuple] = None,
+) -> tuple:
     """
-    Helper function to reset all game state for a new game.
+    Shared post-move hook: detect game end, show the result, or hand over to the engine.
+
+    Called after every applied move (human, engine or premove) and for results
+    that do not come from the board (resignation, time forfeit).
 
     Args:
-        board_state: BoardState to reset
-        input_handler: InputHandler to reset
-        move_history: List to clear
-        engine_controller: EngineController to cancel
-        move_panel: MoveHistoryPanel to scroll
-        white_clock: White PlayerClock to reset
-        black_clock: Black PlayerClock to reset
-        move_animator: MoveAnimator to cancel
-        sound_manager: SoundManager for sound
-        time_control: Time control in seconds (or None)
+        board_state: BoardState instance
+        engine_controller: EngineController instance
+        move_history: List of moves in UCI notation
+        engine_color: Engine's side as chess.WHITE / chess.BLACK
+        result_dialog: GameResultDialog instance
+        sound_manager: SoundManager instance
+        white_clock: White player's clock
+        black_clock: Black player's clock
+        forced_result: Optional (result_type, winner, reason) that ends the game
+            regardless of the position
 
     Returns:
-        tuple: (game_ended=False, last_result=None)
+        tuple: (game_ended, last_result, engine_thinking, new_game_requested)
     """
-    board_state.reset()
-    input_handler.reset()
-    print(f"[DEBUG] move_history: {move_history}")
-    move_history.clear()
-    full_san_history.clear()
-    current_move_index = -1  # Reset navigation
-    engine_controller.cancel_thinking()
-    move_panel.scroll_to_top()
+    if forced_result is not None:
+        is_over = True
+        result_type, winner, reason = forced_result
+    else:
+        is_over, result_type, winner, reason = check_game_end_conditions(board_state)
 
-    # Reset both clocks with time control
-    white_clock.reset(time_control)
-    black_clock.reset(time_control)
-    white_clock.start()
-    black_clock.start()
-    white_clock.activate()
-    white_clock.resume()
+    if not is_over:
+        # Game continues - check if engine should move now
+        engine_thinking = check_engine_turn_and_move(
+            board_state, engine_controller, move_history, engine_color
+        )
+        return False, None, engine_thinking, False
 
-    move_animator.cancel()
-    sound_manager.play_game_start_sound()
+    sound_manager.play_game_end_sound()
 
-    return False, None  # game_ended, last_result
+    # Pause both clocks
+    white_clock.pause()
+    black_clock.pause()
+
+    print(f"[Game] Game over: {result_type}")
+    if winner:
+        print(f"       Winner: {winner}")
+    if reason:
+        print(f"       Reason: {reason}")
+
+    # Show result dialog
+    choice = result_dialog.show(result_type, winner, reason)
+
+    return True, (result_type, winner, reason), False, choice == "new_game"
 
 
 def show_game_setup_dialogs(screen, time_control_dialog, color_selection_dialog):
@@ -311,8 +463,7 @@ def show_game_setup_dialogs(screen, time_control_dialog, color_selection_dialog)
     selected_color = color_selection_dialog.show()
 
     # Update Config with selected color
-    setattr(Config, "HUMAN_COLOR", selected_color)
-    setattr(Config, "ENGINE_COLOR", "black" if selected_color == "white" else "white")
+    Config.set_human_color(selected_color)
 
     print(f"✅ Color selected: Human plays as {selected_color.upper()}")
     print(f"   Engine plays as {Config.ENGINE_COLOR.upper()}")
@@ -326,13 +477,14 @@ def show_game_setup_dialogs(screen, time_control_dialog, color_selection_dialog)
     return selected_time_control, selected_color
 
 
-def recreate_clocks_and_captured_display(screen, game_time_control):
+def recreate_clocks_and_captured_display(screen, game_time_control, piece_loader=None):
     """
     Recreate player clocks and captured pieces display with updated positions.
 
     Args:
         screen: pygame.Surface for rendering dialogs
         game_time_control: Time in seconds or None for unlimited
+        piece_loader: PieceLoader shared with the board (captured piece icons)
 
     Returns:
         tuple: (white_clock, black_clock, captured_display)
@@ -348,7 +500,7 @@ def recreate_clocks_and_captured_display(screen, game_time_control):
         width=Config.WHITE_CLOCK_WIDTH,
         height=Config.WHITE_CLOCK_HEIGHT,
         player_name="White",
-        player_color=chess.WHITE,
+        player_color=CHESS_WHITE,
         time_control=game_time_control,
     )
 
@@ -359,7 +511,7 @@ def recreate_clocks_and_captured_display(screen, game_time_control):
         width=Config.BLACK_CLOCK_WIDTH,
         height=Config.BLACK_CLOCK_HEIGHT,
         player_name="Black",
-        player_color=chess.BLACK,
+        player_color=CHESS_BLACK,
         time_control=game_time_control,
     )
 
@@ -373,6 +525,7 @@ def recreate_clocks_and_captured_display(screen, game_time_control):
         black_y=Config.CAPTURED_PIECES_BLACK_Y,
         black_width=Config.CAPTURED_PIECES_BLACK_WIDTH,
         black_height=Config.CAPTURED_PIECES_BLACK_HEIGHT,
+        piece_loader=piece_loader,
     )
 
     return white_clock, black_clock, captured_display
@@ -435,11 +588,11 @@ def start_new_game_with_dialogs(
 
     # Reset board and game state
     board_state.reset()
+    clear_end_cache()
     input_handler.reset()
-    print(f"[DEBUG] move_history: {move_history}")
+    log.debug("move_history: %s", move_history)
     move_history.clear()
     full_san_history.clear()
-    current_move_index = -1  # Reset navigation
     move_panel.scroll_to_top()
 
     # Reset both clocks with new time control
@@ -459,12 +612,1334 @@ def start_new_game_with_dialogs(
     print(
         f"[New Game] Started - Time: {new_time_control}s, Color: {Config.HUMAN_COLOR}"
     )
-    print(f"    Status: {board_state.get_game_status()}")
+    # get_game_status() runs several draw/mate checks - only pay for it when shown
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("    Status: %s", board_state.get_game_status())
 
     # Return updated game state
     return False, None, new_time_control, layout_handler
 
 
+# Screen regions tracked by GameContext.dirty_mask
+DIRTY_BOARD = 1  # Board, pieces, overlays
+DIRTY_CLOCK = 2  # Both player clocks
+DIRTY_PANEL = 4  # Move history panel
+DIRTY_CAPTURED = 8  # Captured pieces sections
+DIRTY_CONTROLS = 16  # Game control buttons and their tooltip
+DIRTY_ALL = DIRTY_BOARD | DIRTY_CLOCK | DIRTY_PANEL | DIRTY_CAPTURED | DIRTY_CONTROLS
+
+# Above this many dirty rects a partial frame falls back to a full flip()
+MAX_DIRTY_RECTS = 50
+
+
+class GameContext:
+    """
+    Mutable state shared by the main loop and its event handlers.
+
+    main() builds a single instance once initialization is done and passes it
+    to every handler in HANDLERS. Handlers read and replace components through
+    its attributes (e.g. loading a game or navigating the move history swaps in
+    a new ctx.board_state), so the main loop always sees the current objects.
+
+    Uses __slots__: attribute access in the per-event/per-frame hot path
+    skips the instance dict, and a typo'd attribute raises instead of
+    silently creating new state.
+    """
+
+    __slots__ = (
+        # Display surface and frame clock
+        "screen",
+        "clock",
+        # Board logic and rendering/input components
+        "board_state",
+        "board_gui",
+        "input_handler",
+        "layout_handler",
+        "move_panel",
+        "game_controls",
+        "move_animator",
+        "sound_manager",
+        "captured_display",
+        "white_clock",
+        "black_clock",
+        # Modal dialogs and menus
+        "result_dialog",
+        "time_control_dialog",
+        "color_selection_dialog",
+        "settings_menu",
+        "help_screen",
+        # Chess engine (AI opponent)
+        "engine_controller",
+        # Move history and navigation
+        "move_history",
+        "full_san_history",
+        "current_move_index",
+        "highlight_index",
+        "expected_len",
+        # Game state flags
+        "game_ended",
+        "last_result",
+        "engine_thinking",
+        "engine_busy",
+        "input_accept",
+        # Config flags read every frame (see _snapshot_config)
+        "show_last_move",
+        "show_captured",
+        "show_fps",
+        "premove_enabled",
+        "game_time_control",
+        "human_color",
+        "engine_color",
+        "pending_io",
+        "new_game_requested",
+        "running",
+        "dirty_mask",
+    )
+
+    def __init__(
+        self,
+        screen,
+        clock,
+        board_state,
+        board_gui,
+        input_handler,
+        layout_handler,
+        result_dialog,
+        move_panel,
+        game_controls,
+        move_animator,
+        sound_manager,
+        time_control_dialog,
+        color_selection_dialog,
+        white_clock,
+        black_clock,
+        captured_display,
+        settings_menu,
+        help_screen,
+        engine_controller,
+        game_time_control,
+        human_color,
+        engine_color,
+    ):
+        # Display surface and frame clock
+        self.screen = screen
+        self.clock = clock
+
+        # Board logic and rendering/input components
+        self.board_state = board_state
+        self.board_gui = board_gui
+        self.input_handler = input_handler
+        self.layout_handler = layout_handler
+        self.move_panel = move_panel
+        self.game_controls = game_controls
+        self.move_animator = move_animator
+        self.sound_manager = sound_manager
+        self.captured_display = captured_display
+        self.white_clock = white_clock
+        self.black_clock = black_clock
+
+        # Modal dialogs and menus
+        self.result_dialog = result_dialog
+        self.time_control_dialog = time_control_dialog
+        self.color_selection_dialog = color_selection_dialog
+        self.settings_menu = settings_menu
+        self.help_screen = help_screen
+
+        # Chess engine (AI opponent)
+        self.engine_controller = engine_controller
+
+        # Track move history for engine
+        self.move_history = deque()  # UCI moves; deque for cheap per-move appends
+        self.full_san_history = []  # Parallel list of SAN moves for display
+        # Track current position in move history for navigation
+        self.current_move_index = -1  # -1 means "at latest position"
+        # Move highlighted in the history panel (updated every frame)
+        self.highlight_index = -1
+        self.expected_len = 0
+
+        # Game state flags
+        self.game_ended = False
+        self.last_result = None
+        self.engine_thinking = False
+        # Per-frame snapshot of engine_controller.is_thinking()
+        self.engine_busy = False
+        # Per-frame "board accepts clicks/drags" guard (_refresh_input_state)
+        self.input_accept = False
+
+        # Per-frame Config flags, re-read only when the settings menu closes
+        _snapshot_config(self)
+
+        # Store time control and player colors for game resets
+        self.game_time_control = game_time_control
+        self.human_color = human_color
+        self.engine_color = engine_color
+
+        # Background PGN operation in flight: (kind, filepath, future) or None
+        self.pending_io = None
+
+        # Set by finalize_move() when the result dialog asks for a new game
+        self.new_game_requested = False
+
+        # Cleared by QUIT / ESC to leave the main loop
+        self.running = True
+
+        # DIRTY_* bits of screen regions that changed since the last frame;
+        # the main loop redraws only those (everything at startup)
+        self.dirty_mask = DIRTY_ALL
+
+
+def _snapshot_config(ctx: "GameContext"):
+    """
+    Copy the Config flags that rendering and input read every frame into ctx.
+
+    Config only changes through the settings menu, so these are refreshed
+    when it closes; per-frame code reads instance attributes instead of
+    class attributes of Config.
+
+    Args:
+        ctx: GameContext to update
+    """
+    ctx.show_last_move = Config.SHOW_LAST_MOVE
+    ctx.show_captured = Config.SHOW_CAPTURED_PIECES
+    ctx.show_fps = Config.SHOW_FPS
+    ctx.premove_enabled = Config.ENABLE_PREMOVE
+
+
+def _refresh_input_state(ctx: "GameContext"):
+    """
+    Re-snapshot engine state and recompute whether the board accepts input.
+
+    Board input (clicks, drags, highlights) is accepted while the game is
+    running and it is the human's turn - or during an engine search when
+    premoves are enabled. Called after anything that starts/cancels a
+    search, changes the side to move or ends a game. A search ending on its
+    own arrives as an ENGINE_MOVE_READY event, so nothing polls the engine.
+
+    Args:
+        ctx: GameContext to update
+    """
+    ctx.engine_busy = ctx.engine_controller.is_thinking()
+    ctx.input_accept = not ctx.game_ended and (
+        ctx.board_state.board.turn == ctx.human_color
+        or (ctx.premove_enabled and ctx.engine_busy)
+    )
+
+
+def _start_new_game(ctx: "GameContext"):
+    """
+    Run the new-game setup dialogs and reset everything for a fresh game.
+
+    Shared by the R key, the New Game button and the result dialog's
+    "New Game" choice.
+
+    Args:
+        ctx: GameContext to reset in place
+    """
+    ctx.game_ended, ctx.last_result, ctx.game_time_control, _ = (
+        start_new_game_with_dialogs(
+            ctx.board_state,
+            ctx.input_handler,
+            ctx.move_history,
+            ctx.full_san_history,
+            ctx.engine_controller,
+            ctx.move_panel,
+            ctx.white_clock,
+            ctx.black_clock,
+            ctx.move_animator,
+            ctx.sound_manager,
+            ctx.screen,
+            ctx.time_control_dialog,
+            ctx.color_selection_dialog,
+            ctx.layout_handler,
+        )
+    )
+    ctx.current_move_index = -1  # Back to "at latest position"
+
+    # New game may have switched sides
+    ctx.human_color, ctx.engine_color = get_player_colors()
+
+    ctx.white_clock, ctx.black_clock, ctx.captured_display = (
+        recreate_clocks_and_captured_display(
+            ctx.screen, ctx.game_time_control, ctx.board_gui.piece_loader
+        )
+    )
+
+    # Recalculate layout based on new FLIP_BOARD setting
+    ctx.layout_handler.handle_resize(ctx.screen.get_width(), ctx.screen.get_height())
+
+    # Check if engine should move first
+    ctx.engine_thinking = check_engine_turn_and_move(
+        ctx.board_state, ctx.engine_controller, ctx.move_history, ctx.engine_color
+    )
+    _refresh_input_state(ctx)
+
+
+def _save_game(ctx: "GameContext"):
+    """
+    Ask for a destination and write the current game as PGN in the background.
+
+    Args:
+        ctx: GameContext holding the game to save
+    """
+    if ctx.pending_io is not None:
+        print("[Action] ⚠️ File operation already in progress")
+        return
+    if len(ctx.board_state.board.move_stack) == 0:
+        return
+
+    filepath = ctx.game_controls.show_save_dialog()
+    if filepath:
+        # Build PGN on the main thread (reads the live board),
+        # write it to disk on the I/O worker
+        pgn_string = ctx.board_state.to_pgn()
+        ctx.pending_io = (
+            "save",
+            filepath,
+            _io_pool.submit(save_pgn_to_file, pgn_string, filepath),
+        )
+
+
+def _load_game(ctx: "GameContext"):
+    """
+    Ask for a PGN file and parse it in the background.
+
+    The parsed game is applied by _apply_loaded_game() once the worker is done.
+
+    Args:
+        ctx: GameContext receiving the pending load
+    """
+    if ctx.pending_io is not None:
+        print("[Action] ⚠️ File operation already in progress")
+        return
+
+    filepath = ctx.game_controls.show_load_dialog()
+    if filepath:
+        # Read and parse the PGN on the I/O worker
+        ctx.pending_io = (
+            "load",
+            filepath,
+            _io_pool.submit(load_board_state_from_pgn_file, filepath),
+        )
+
+
+def _apply_loaded_game(ctx: "GameContext", board_state: BoardState):
+    """
+    Replace the current game with one loaded from PGN.
+
+    Args:
+        ctx: GameContext to update
+        board_state: BoardState parsed from the PGN file
+    """
+    ctx.engine_controller.cancel_thinking()
+    _refresh_input_state(ctx)
+    ctx.move_animator.cancel()
+    ctx.board_state = board_state
+    clear_end_cache()
+    ctx.move_history = deque(board_state.get_move_history_uci())
+    ctx.full_san_history = board_state.get_move_history_san()
+    ctx.expected_len = len(ctx.move_history)
+    ctx.current_move_index = -1
+    ctx.input_handler.board_state = board_state
+    ctx.input_handler.reset()
+    ctx.move_panel.scroll_to_bottom()
+    ctx.game_ended = False
+    ctx.last_result = None
+
+
+def post_move_effects(
+    ctx: "GameContext",
+    move: chess.Move,
+    is_capture: bool,
+    is_castle: bool,
+    is_promotion: bool,
+    is_check: bool,
+    animate: bool = True,
+):
+    """
+    Shared visual/audio follow-up for a move that was just pushed.
+
+    Starts the move animation, plays the matching sound, hands the clock to
+    the side to move and scrolls the move panel to the latest move. Used by
+    player, premove and engine moves alike.
+
+    Args:
+        ctx: GameContext holding the components
+        move: The move that was played
+        is_capture: Move captured a piece (classified before the push)
+        is_castle: Move was castling (classified before the push)
+        is_promotion: Move promoted a pawn
+        is_check: Move gives check
+        animate: Animate the piece (False for drag moves - already in place)
+    """
+    # Start animation
+    if animate:
+        piece_at_dest = ctx.board_state.board.piece_at(move.to_square)
+        if piece_at_dest:
+            ctx.move_animator.start_animation(
+                piece_at_dest, move.from_square, move.to_square
+            )
+
+    # Play move sound
+    if is_castle:
+        ctx.sound_manager.play_castle_sound()
+    elif is_promotion:
+        ctx.sound_manager.play_promotion_sound()
+    else:
+        ctx.sound_manager.play_move_sound(is_capture=is_capture, is_check=is_check)
+
+    # Switch active clock based on whose turn it is
+    if ctx.board_state.board.turn == CHESS_WHITE:
+        ctx.white_clock.activate()
+        ctx.white_clock.resume()
+        ctx.black_clock.deactivate()
+    else:
+        ctx.black_clock.activate()
+        ctx.black_clock.resume()
+        ctx.white_clock.deactivate()
+
+    # Show the latest move in the history panel
+    ctx.move_panel.scroll_to_bottom()
+
+
+# ==================== Event Handlers ====================
+# Each handler receives the pygame event and the shared GameContext.
+
+
+def _on_quit(event, ctx: "GameContext"):
+    """Window close button - stop the main loop."""
+    ctx.running = False
+
+
+# ==================== Keyboard Shortcuts ====================
+# Populated at import time by @keybind; one dict lookup per keystroke.
+_KEY_HANDLERS: Dict[int, Callable] = {}
+
+
+def keybind(key: int):
+    """
+    Register the decorated function as the KEYDOWN handler for a key.
+
+    Args:
+        key: pygame key constant (e.g. pygame.K_ESCAPE)
+
+    Returns:
+        Decorator that stores the handler in _KEY_HANDLERS
+    """
+
+    def decorator(handler: Callable):
+        _KEY_HANDLERS[key] = handler
+        return handler
+
+    return decorator
+
+
+def _on_keydown(event, ctx: "GameContext"):
+    """Keyboard shortcuts - dispatch to the handler bound to the key."""
+    handler = _KEY_HANDLERS.get(event.key)
+    if handler is not None:
+        handler(event, ctx)
+
+
+@keybind(K_ESCAPE)
+def _key_escape(event, ctx: "GameContext"):
+    """ESC key exits the application."""
+    ctx.running = False
+
+
+@keybind(K_LEFT)
+def _key_left(event, ctx: "GameContext"):
+    """Left arrow - previous halfmove."""
+    if not ctx.move_history:
+        log.debug("[Navigation] ← No moves to navigate")
+    else:
+        # Determine current position
+        if ctx.current_move_index < 0:
+            # At "latest" - use board's actual position
+            current_idx = len(ctx.board_state.board.move_stack) - 1
+        else:
+            # Navigating in history
+            current_idx = ctx.current_move_index
+
+        if current_idx > 0:
+            ctx.current_move_index = current_idx - 1
+            ctx.board_state = navigate_to_move(ctx.current_move_index, ctx.move_history)
+            pair_index = ctx.highlight_index // 2
+            ctx.move_panel.scroll_offset = max(
+                0, pair_index - ctx.move_panel.visible_lines // 2
+            )  # Centers the line if possible
+            ctx.input_handler.board_state = ctx.board_state
+            ctx.input_handler.reset()
+            _refresh_input_state(ctx)
+            log.debug("move_history: %s", ctx.move_history)
+            log.debug(
+                "[Navigation] ← Previous move (position %s)",
+                ctx.current_move_index + 1,
+            )
+        else:
+            log.debug("[Navigation] ← Already at first halfmove")
+
+
+@keybind(K_RIGHT)
+def _key_right(event, ctx: "GameContext"):
+    """Right arrow - next halfmove."""
+    if not ctx.move_history:
+        log.debug("[Navigation] → No moves to navigate")
+    else:
+        # DEBUG: Print current state
+        log.debug("Before navigation:")
+        log.debug("  move_history length: %s", len(ctx.move_history))
+        log.debug("  current_move_index: %s", ctx.current_move_index)
+        log.debug(
+            "  board.move_stack length: %s",
+            len(ctx.board_state.board.move_stack),
+        )
+
+        # Determine current position
+        if ctx.current_move_index < 0:
+            # At "latest" - already at the end, can't go forward
+            log.debug("[Navigation] → Already at latest position")
+        else:
+            # Navigating in history
+            current_idx = ctx.current_move_index
+
+            if current_idx < len(ctx.move_history) - 1:
+                ctx.current_move_index = current_idx + 1
+
+                # DEBUG: Print what move we're navigating to
+                log.debug("Navigating to index %s", ctx.current_move_index)
+                log.debug(
+                    "Move at that index: %s",
+                    ctx.move_history[ctx.current_move_index],
+                )
+
+                ctx.board_state = navigate_to_move(
+                    ctx.current_move_index, ctx.move_history
+                )
+                pair_index = ctx.highlight_index // 2
+                ctx.move_panel.scroll_offset = max(
+                    0, pair_index - ctx.move_panel.visible_lines // 2
+                )  # Centers the line if possible
+
+                # DEBUG: Print resulting board state
+                log.debug("After navigate_to_move:")
+                log.debug(
+                    "  board.move_stack length: %s",
+                    len(ctx.board_state.board.move_stack),
+                )
+                log.debug("  FEN: %s", ctx.board_state.get_fen())
+
+                ctx.input_handler.board_state = ctx.board_state
+                ctx.input_handler.reset()
+                _refresh_input_state(ctx)
+                log.debug(
+                    "[Navigation] → Next move (position %s)",
+                    ctx.current_move_index + 1,
+                )
+            else:
+                # At the last move in history - stay here
+                log.debug("[Navigation] → Already at last move")
+
+
+@keybind(K_UP)
+def _key_up(event, ctx: "GameContext"):
+    """Up arrow - jump to first move."""
+    if ctx.move_history:
+        ctx.current_move_index = 0
+        ctx.board_state = navigate_to_move(0, ctx.move_history)
+        pair_index = ctx.highlight_index // 2
+        ctx.move_panel.scroll_offset = max(
+            0, pair_index - ctx.move_panel.visible_lines // 2
+        )  # Centers the line if possible
+        ctx.input_handler.board_state = ctx.board_state
+        ctx.input_handler.reset()
+        _refresh_input_state(ctx)
+        log.debug("move_history: %s", ctx.move_history)
+        log.debug("[Navigation] ↑ First move")
+
+
+@keybind(K_DOWN)
+def _key_down(event, ctx: "GameContext"):
+    """Down arrow - jump to last played move."""
+    if ctx.move_history:
+        ctx.current_move_index = len(ctx.move_history) - 1
+        ctx.board_state = navigate_to_move(ctx.current_move_index, ctx.move_history)
+        pair_index = ctx.highlight_index // 2
+        ctx.move_panel.scroll_offset = max(
+            0, pair_index - ctx.move_panel.visible_lines // 2
+        )  # Centers the line if possible
+        ctx.input_handler.board_state = ctx.board_state
+        ctx.input_handler.reset()
+        _refresh_input_state(ctx)
+        log.debug("move_history: %s", ctx.move_history)
+        log.debug(
+            "[Navigation] ↓ Last move (position %s)",
+            ctx.current_move_index + 1,
+        )
+
+
+@keybind(K_s)
+def _key_settings(event, ctx: "GameContext"):
+    """S key opens settings menu."""
+    print("[Menu] Opening settings...")
+    settings_changed = ctx.settings_menu.show()
+    _snapshot_config(ctx)
+    _refresh_input_state(ctx)  # ENABLE_PREMOVE may have changed
+    if settings_changed:
+        # Apply sound settings to sound manager
+        ctx.sound_manager.set_enabled(Config.ENABLE_SOUNDS)
+        ctx.sound_manager.set_volume(Config.SOUND_VOLUME)
+
+        # Apply animation settings to move animator
+        ctx.move_animator.animation_enabled = Config.ANIMATE_MOVES
+        ctx.move_animator.animation_speed = Config.ANIMATION_SPEED
+
+        print("[Menu] Settings updated")
+        print(f"  Animations: {Config.ANIMATE_MOVES}")
+        print(f"  Sounds: {Config.ENABLE_SOUNDS}")
+        print(f"  Last move highlight: {Config.SHOW_LAST_MOVE}")
+        print(f"  Captured pieces: {Config.SHOW_CAPTURED_PIECES}")
+
+
+@keybind(K_h)
+def _key_help(event, ctx: "GameContext"):
+    """H key opens help screen."""
+    print("[Menu] Opening help...")
+    ctx.help_screen.show()
+
+
+@keybind(K_r)
+def _key_reset(event, ctx: "GameContext"):
+    """R key resets the board to starting position."""
+    if ctx.game_ended:
+        return
+
+    _start_new_game(ctx)
+    print("[Action] Board reset")
+    print("\n[Game] New game started")
+
+
+@keybind(K_u)
+def _key_undo(event, ctx: "GameContext"):
+    """U key undoes last move (or two moves if playing vs engine)."""
+    if ctx.game_ended:
+        return
+
+    if not ctx.engine_busy:
+        # Undo two moves (player + engine)
+        move1 = ctx.board_state.undo_move()
+        move2 = ctx.board_state.undo_move()
+
+        if move1:
+            if ctx.move_history:
+                ctx.move_history.pop()
+                ctx.full_san_history.pop()
+            print(f"[Game] Undid move: {move1.uci()}")
+        if move2:
+            if ctx.move_history:
+                ctx.move_history.pop()
+                ctx.full_san_history.pop()
+            print(f"[Game] Undid move: {move2.uci()}")
+
+        ctx.current_move_index = -1  # Reset to "at latest"
+        ctx.input_handler.reset()
+        _refresh_input_state(ctx)
+        log.debug("move_history: %s", ctx.move_history)
+
+
+def _on_videoresize(event, ctx: "GameContext"):
+    """Window resize - relayout and resize size-dependent components."""
+    # Update layout
+    ctx.layout_handler.handle_resize(event.w, event.h)
+
+    # Recreate screen with new size
+    ctx.screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
+
+    # Resize existing components in place with the new Config values
+    # (keeps loaded piece images, icons, fonts, Tk roots and clock state)
+    ctx.board_gui.resize(ctx.screen)
+    ctx.move_panel.resize(
+        ctx.screen,
+        x=Config.MOVE_HISTORY_X,
+        y=Config.MOVE_HISTORY_Y,
+        width=Config.MOVE_HISTORY_WIDTH,
+        height=Config.MOVE_HISTORY_HEIGHT,
+    )
+    ctx.game_controls.resize(
+        ctx.screen,
+        x=Config.GAME_CONTROLS_X,
+        y=Config.GAME_CONTROLS_Y,
+        width=Config.GAME_CONTROLS_WIDTH,
+        icon_size=Config.GAME_CONTROLS_ICON_SIZE,
+        spacing=Config.GAME_CONTROLS_SPACING,
+    )
+    ctx.white_clock.resize(
+        ctx.screen,
+        x=Config.WHITE_CLOCK_X,
+        y=Config.WHITE_CLOCK_Y,
+        width=Config.WHITE_CLOCK_WIDTH,
+        height=Config.WHITE_CLOCK_HEIGHT,
+    )
+    ctx.black_clock.resize(
+        ctx.screen,
+        x=Config.BLACK_CLOCK_X,
+        y=Config.BLACK_CLOCK_Y,
+        width=Config.BLACK_CLOCK_WIDTH,
+        height=Config.BLACK_CLOCK_HEIGHT,
+    )
+    ctx.captured_display.resize(
+        ctx.screen,
+        white_x=Config.CAPTURED_PIECES_WHITE_X,
+        white_y=Config.CAPTURED_PIECES_WHITE_Y,
+        white_width=Config.CAPTURED_PIECES_WHITE_WIDTH,
+        white_height=Config.CAPTURED_PIECES_WHITE_HEIGHT,
+        black_x=Config.CAPTURED_PIECES_BLACK_X,
+        black_y=Config.CAPTURED_PIECES_BLACK_Y,
+        black_width=Config.CAPTURED_PIECES_BLACK_WIDTH,
+        black_height=Config.CAPTURED_PIECES_BLACK_HEIGHT,
+    )
+
+    # Settings/help/result dialogs (and the promotion dialog) center
+    # themselves on the display surface each time they are shown, and
+    # set_mode() hands back the same surface object, so they need no update.
+
+    print(
+        f"[Resize] Window: {event.w}x{event.h}, Board: {Config.BOARD_SIZE}x{Config.BOARD_SIZE}"
+    )
+
+
+def _on_mousewheel(event, ctx: "GameContext"):
+    """Mouse wheel scrolls the move history panel."""
+    mouse_pos = pygame.mouse.get_pos()
+    if ctx.move_panel.is_mouse_over(mouse_pos):
+        ctx.move_panel.handle_mouse_wheel(event.y)
+
+
+def _on_mousedown(event, ctx: "GameContext"):
+    """Mouse button down - game controls, history clicks, drag/arrow start."""
+    if event.button == 1:  # Left click
+        # Check for game controls clicks
+        button_id = ctx.game_controls.handle_click(event.pos)
+
+        # Handle New Game button click
+        if button_id == "new_game":
+            print("[Action] New Game button pressed")
+            _start_new_game(ctx)
+
+        # Handle save button click
+        elif button_id == "save_pgn":
+            _save_game(ctx)
+
+        # Handle load button click
+        elif button_id == "load_pgn":
+            _load_game(ctx)
+
+        # Handle resign button click
+        elif button_id == "resign":
+            # Current player resigns
+            winner = "Black" if ctx.board_state.board.turn == CHESS_WHITE else "White"
+            print(f"[Action] {ctx.board_state.get_turn_string()} resigns!")
+            (
+                ctx.game_ended,
+                ctx.last_result,
+                ctx.engine_thinking,
+                ctx.new_game_requested,
+            ) = finalize_move(
+                ctx.board_state,
+                ctx.engine_controller,
+                ctx.move_history,
+                ctx.engine_color,
+                ctx.result_dialog,
+                ctx.sound_manager,
+                ctx.white_clock,
+                ctx.black_clock,
+                forced_result=("resignation", winner, ""),
+            )
+            _refresh_input_state(ctx)
+
+        # Move history click navigation
+        else:
+            # Check if user clicked on move history panel
+            clicked_move_idx = ctx.move_panel.handle_click(event.pos)
+
+            # If a move was clicked, navigate to that position
+            if clicked_move_idx is not None and clicked_move_idx < len(
+                ctx.move_history
+            ):
+                log.debug(
+                    "[Navigation] Jumped to position after move %s",
+                    clicked_move_idx + 1,
+                )
+
+                ctx.current_move_index = clicked_move_idx
+
+                # Update navigation index
+                ctx.current_move_index = clicked_move_idx
+
+                # Create new board state at that position
+                ctx.board_state = navigate_to_move(clicked_move_idx, ctx.move_history)
+                pair_index = ctx.highlight_index // 2
+                ctx.move_panel.scroll_offset = max(
+                    0, pair_index - ctx.move_panel.visible_lines // 2
+                )  # Centers the line if possible
+
+                # Update references
+                ctx.input_handler.board_state = ctx.board_state
+                ctx.input_handler.reset()
+                log.debug("move_history: %s", ctx.move_history)
+
+                # Cancel any thinking
+                ctx.engine_controller.cancel_thinking()
+                _refresh_input_state(ctx)
+
+                # This is navigation mode - viewing only
+                # To resume play, user clicks "New Game"
+                log.debug("[Navigation] Position: %s", ctx.board_state.get_fen())
+                log.debug("[Navigation] Click 'New Game' to start fresh game")
+
+            # Allow mouse down during engine thinking if premove enabled
+            elif ctx.input_accept:
+                ctx.input_handler.handle_mouse_down(event.pos, ctx.engine_busy)
+
+    elif event.button == 3 and not ctx.game_ended:
+        # Start potential arrow drag (if on board)
+        ctx.input_handler.start_arrow_drag(event.pos)
+
+
+def _on_mouseup(event, ctx: "GameContext"):
+    """Mouse button up - complete drag/click moves and arrows."""
+    if ctx.game_ended:
+        return
+
+    if event.button == 1:  # Left click release
+        # Allow mouse up during engine thinking if premove enabled
+        if ctx.input_accept:
+            # Try to complete drag move (may be premove)
+            move_made = ctx.input_handler.handle_mouse_up(event.pos, ctx.engine_busy)
+
+            # If no drag move was made, handle as click-to-move
+            if not move_made:
+                move_made = ctx.input_handler.handle_mouse_click(
+                    event.pos, ctx.engine_busy
+                )
+
+            # If player made a move, add to history and check for engine turn
+            if move_made:
+                # Get the last move recorded by BoardState
+                if ctx.board_state.last_move is not None:
+                    last_move = ctx.board_state.last_move
+                    last_move_uci = ctx.board_state.last_move_uci
+                    log.debug(
+                        "Adding PLAYER move to history: %s",
+                        last_move_uci,
+                    )
+                    log.debug("move_history before: %s", ctx.move_history)
+                    # Prevent duplicates - only add if not already in history
+                    if not ctx.move_history or ctx.move_history[-1] != last_move_uci:
+                        ctx.move_history.append(last_move_uci)
+                        ctx.current_move_index = -1
+                        # SAN was computed once by BoardState.make_move
+                        ctx.full_san_history.append(ctx.board_state.last_move_san)
+                        ctx.move_panel.scroll_to_bottom()
+                    else:
+                        log.debug(
+                            "Prevented duplicate PLAYER move: %s",
+                            last_move_uci,
+                        )
+                    log.debug("move_history after: %s", ctx.move_history)
+                    ctx.expected_len = len(ctx.move_history)
+                    ctx.current_move_index = -1  # Reset to "at latest"
+
+                    # Animate click-to-move only (a dragged piece is already in place)
+                    animate = ctx.input_handler.get_last_move_method() == "click"
+
+                    # Clear the move method tracking
+                    ctx.input_handler.clear_move_method()
+
+                    # Animation, sound and clock switch
+                    # Flags were classified before the move was pushed
+                    is_capture, is_castle, is_promotion = (
+                        ctx.board_state.last_move_flags
+                    )
+                    post_move_effects(
+                        ctx,
+                        last_move,
+                        is_capture,
+                        is_castle,
+                        is_promotion,
+                        ctx.board_state.board.is_check(),
+                        animate=animate,
+                    )
+
+                # Shared post-move hook (game end, result dialog, engine turn)
+                (
+                    ctx.game_ended,
+                    ctx.last_result,
+                    ctx.engine_thinking,
+                    ctx.new_game_requested,
+                ) = finalize_move(
+                    ctx.board_state,
+                    ctx.engine_controller,
+                    ctx.move_history,
+                    ctx.engine_color,
+                    ctx.result_dialog,
+                    ctx.sound_manager,
+                    ctx.white_clock,
+                    ctx.black_clock,
+                )
+                _refresh_input_state(ctx)
+
+    elif event.button == 3:
+        # Try to finish arrow drag
+        arrow_created = ctx.input_handler.finish_arrow_drag(event.pos)
+
+        # If no arrow was created and there was no drag movement -> treat as clear-click
+        if not arrow_created and not ctx.input_handler.right_click_moved:
+            ctx.input_handler.clear_premoves_and_arrows()
+
+
+def _on_mousemotion(event, ctx: "GameContext"):
+    """Mouse motion - drag tracking."""
+    # Track mouse position during drag, but only on human's turn
+    # Allow mouse motion during engine thinking if premove enabled
+    if ctx.input_accept:
+        ctx.input_handler.handle_mouse_motion(event.pos, ctx.engine_busy)
+
+
+def _on_engine_move(event, ctx: "GameContext"):
+    """Engine finished searching - apply its move (posted by the listener thread)."""
+    # The listener cleared the engine's thinking flag before posting - this
+    # event is the engine_busy True -> False transition (even on errors)
+    _refresh_input_state(ctx)
+
+    # Drop answers that belong to a cancelled request or a finished game
+    if event.request_id != ctx.engine_controller.current_request_id:
+        return
+    if ctx.game_ended:
+        return
+
+    move_uci = event.uci
+    if move_uci is None:
+        print("[Engine] ❌ Engine failed to return a move")
+        return
+
+    try:
+        # Parsed, validated and classified on the engine listener thread
+        ready = event.ready
+
+        if ready is None:
+            print(f"[Engine] ❌ Illegal move returned: {move_uci}")
+            return
+
+        # Analysis belongs to the searched position - the live game must not
+        # have moved on since. Compare with the game record, not with
+        # ctx.board_state: the user may be browsing an older position
+        if ready.ply != len(ctx.move_history):
+            print(f"[Engine] ⚠ Discarding move for a stale position: {move_uci}")
+            return
+
+        # Browsing history while the engine thought: play the move on the
+        # live game (not animated - it isn't on screen) and show the browsed
+        # position again afterwards
+        browsed_index = None
+        if ctx.board_state.board.ply() != ready.ply:
+            browsed_index = ctx.current_move_index
+            browsed_scroll = ctx.move_panel.scroll_offset
+            ctx.board_state = navigate_to_move(-1, ctx.move_history)
+            ctx.input_handler.board_state = ctx.board_state
+
+        move = ready.move
+        ctx.board_state.make_analyzed_move(
+            move,
+            ready.san,
+            (ready.is_capture, ready.is_castling, ready.is_promotion),
+        )
+
+        # Update history and reset input
+        # SAN was computed by the engine listener
+        move_san = ready.san
+        log.debug("Adding ENGINE move to history: %s", move_uci)
+        log.debug("move_history before: %s", ctx.move_history)
+        # Prevent duplicates - only add if not already in history
+        if not ctx.move_history or ctx.move_history[-1] != move_uci:
+            ctx.move_history.append(move_uci)
+            ctx.current_move_index = -1
+            ctx.full_san_history.append(move_san)
+            ctx.move_panel.scroll_to_bottom()
+        else:
+            log.debug(
+                "Prevented duplicate ENGINE move: %s",
+                move_uci,
+            )
+        log.debug("move_history after: %s", ctx.move_history)
+
+        ctx.expected_len = len(ctx.move_history)
+        ctx.current_move_index = -1  # Reset to "at latest"
+
+        # Animation, sound and clock switch (flags precomputed by the listener)
+        post_move_effects(
+            ctx,
+            move,
+            ready.is_capture,
+            ready.is_castling,
+            ready.is_promotion,
+            ready.is_check,
+        )
+
+        log.debug("Engine move: %s (%s)", move_san, move_uci)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "         Status: %s",
+                ctx.board_state.get_game_status(),
+            )
+        ctx.input_handler.soft_reset()
+
+        # Shared post-move hook (game end, result dialog, engine turn)
+        (
+            ctx.game_ended,
+            ctx.last_result,
+            ctx.engine_thinking,
+            ctx.new_game_requested,
+        ) = finalize_move(
+            ctx.board_state,
+            ctx.engine_controller,
+            ctx.move_history,
+            ctx.engine_color,
+            ctx.result_dialog,
+            ctx.sound_manager,
+            ctx.white_clock,
+            ctx.black_clock,
+        )
+        _refresh_input_state(ctx)
+
+        # Game continues - execute premove if queued
+        if not ctx.game_ended and ctx.input_handler.has_premove():
+            premove_made = ctx.input_handler.execute_next_premove_if_valid()
+            if premove_made:
+                # Premove was executed - handle as a regular move
+                if ctx.board_state.last_move is not None:
+                    last_move = ctx.board_state.last_move
+                    last_move_uci = ctx.board_state.last_move_uci
+                    log.debug(
+                        "Adding EXECUTED PREMOVE to history: %s",
+                        last_move_uci,
+                    )
+                    log.debug(
+                        "move_history before: %s",
+                        ctx.move_history,
+                    )
+                    # Prevent duplicates - only add if not already in history
+                    if not ctx.move_history or ctx.move_history[-1] != last_move_uci:
+                        ctx.move_history.append(last_move_uci)
+                        ctx.current_move_index = -1
+                        # SAN was computed once by BoardState.make_move
+                        ctx.full_san_history.append(ctx.board_state.last_move_san)
+                    else:
+                        log.debug(
+                            "Prevented duplicate PREMOVE: %s",
+                            last_move_uci,
+                        )
+                    log.debug(
+                        "move_history after: %s",
+                        ctx.move_history,
+                    )
+                    ctx.expected_len = len(ctx.move_history)
+                    ctx.current_move_index = -1  # Reset to "at latest"
+
+                    # Animate click-to-move only (a dragged piece is already in place)
+                    animate = ctx.input_handler.get_last_move_method() == "click"
+
+                    # Clear the move method tracking
+                    ctx.input_handler.clear_move_method()
+
+                    # Animation, sound and clock switch
+                    # Flags were classified before the move was pushed
+                    is_capture, is_castle, is_promotion = (
+                        ctx.board_state.last_move_flags
+                    )
+                    post_move_effects(
+                        ctx,
+                        last_move,
+                        is_capture,
+                        is_castle,
+                        is_promotion,
+                        ctx.board_state.board.is_check(),
+                        animate=animate,
+                    )
+
+                # Shared post-move hook (game end, result dialog, engine turn)
+                (
+                    ctx.game_ended,
+                    ctx.last_result,
+                    ctx.engine_thinking,
+                    ctx.new_game_requested,
+                ) = finalize_move(
+                    ctx.board_state,
+                    ctx.engine_controller,
+                    ctx.move_history,
+                    ctx.engine_color,
+                    ctx.result_dialog,
+                    ctx.sound_manager,
+                    ctx.white_clock,
+                    ctx.black_clock,
+                )
+                _refresh_input_state(ctx)
+
+        if browsed_index is not None:
+            ctx.current_move_index = browsed_index
+            ctx.board_state = navigate_to_move(browsed_index, ctx.move_history)
+            ctx.move_panel.scroll_offset = browsed_scroll
+            ctx.input_handler.board_state = ctx.board_state
+            ctx.input_handler.reset()
+            _refresh_input_state(ctx)
+
+    except Exception as e:
+        print(f"[Engine] ❌ Error applying move: {e}")
+
+
+def _render_board_layers(ctx: "GameContext"):
+    """
+    Draw everything on top of the static board: highlights, pieces, dots,
+    animated and dragged pieces, arrows and status banners.
+
+    Args:
+        ctx: GameContext holding all components and game state
+    """
+    if ctx.show_last_move and not ctx.move_animator.is_animating:
+        ctx.board_gui.draw_last_move_highlight(ctx.board_state.board)
+
+    # Draw check indicator
+    ctx.board_gui.draw_check_indicator(ctx.board_state.board)
+
+    # Draw square highlights UNDER pieces
+    if ctx.input_accept:
+        ctx.input_handler.render_square_highlights(ctx.engine_busy)
+
+    # Decide which board to use for drawing pieces
+    if ctx.premove_enabled and ctx.input_handler.has_premove():
+        draw_board = ctx.input_handler.build_visual_board()
+    else:
+        draw_board = ctx.board_state.board
+
+    # Draw pieces (hide piece being animated or dragged)
+    # Only occupied squares are visited; hidden squares are masked out of
+    # the occupancy bitboard instead of being tested one by one
+    occupied = draw_board.occupied
+    if ctx.move_animator.is_animating:
+        occupied &= ~ctx.move_animator.hidden_squares_mask()
+    if ctx.input_handler.dragging and ctx.input_handler.drag_start_square is not None:
+        occupied &= ~CHESS_BB_SQUARES[ctx.input_handler.drag_start_square]
+
+    ctx.board_gui.blit_pieces(
+        cached_piece_grid(draw_board), chess_scan_forward(occupied)
+    )
+
+    # Draw legal move dots OVER pieces
+    if ctx.input_accept:
+        ctx.input_handler.render_legal_move_dots(ctx.engine_busy)
+
+    # Render animated piece
+    ctx.move_animator.render(ctx.screen)
+
+    # Render dragged piece (on human's turn OR during engine thinking if premove)
+    if ctx.input_accept:
+        ctx.input_handler.render_dragged_piece()
+
+    # Render user arrows always
+    ctx.board_gui.draw_user_arrows(ctx.input_handler.user_arrows)
+
+    # Show pre-rendered banner while the engine is searching
+    if ctx.engine_busy:
+        ctx.board_gui.draw_thinking_banner()
+    elif ctx.pending_io is not None:
+        ctx.board_gui.draw_io_banner(loading=ctx.pending_io[0] == "load")
+
+
+def _render_frame(ctx: "GameContext"):
+    """
+    Draw one complete frame (board, pieces, overlays, side panels) and flip.
+
+    Args:
+        ctx: GameContext holding all components and game state
+    """
+    # Clear screen and draw board with squares and coordinates
+    ctx.board_gui.draw_board()
+
+    _render_board_layers(ctx)
+
+    # Draw captured pieces (if enabled)
+    if ctx.show_captured:
+        ctx.captured_display.draw(ctx.board_state.board)
+
+    # Draw player clocks
+    ctx.white_clock.draw()
+    ctx.black_clock.draw()
+
+    # Calculate which move to highlight in the panel
+    if ctx.current_move_index >= 0:
+        ctx.highlight_index = ctx.current_move_index
+    else:
+        ctx.highlight_index = (
+            len(ctx.board_state.board.move_stack) - 1
+            if ctx.board_state.board.move_stack
+            else -1
+        )
+
+    ctx.move_panel.draw(ctx.full_san_history, ctx.highlight_index)
+
+    # Draw game controls
+    ctx.game_controls.draw()
+
+    # Show FPS if enabled
+    if ctx.show_fps:
+        # Whole frames only: the label is re-rendered when the number changes
+        fps = ctx.clock.get_fps()
+        fps_text = render_text(f"FPS: {fps:.0f}", 18, (255, 255, 255))
+        ctx.screen.blit(fps_text, (10, 10))
+
+    # Update the display with all rendered graphics
+    # flip() updates the entire display surface
+    pygame.display.flip()
+
+
+def _render_regions(ctx: "GameContext", mask: int):
+    """
+    Redraw only the regions marked in mask and update their areas.
+
+    Used for clock ticks, hovering the move panel or the buttons, scrolling
+    the history, and board-only changes (animation frames, dragging a piece
+    within the board). Each side component repaints its own background;
+    the board area is restored from BoardGUI's cached static board and
+    drawn with clipping, so the rest of the frame stays valid.
+
+    Args:
+        ctx: GameContext holding all components
+        mask: DIRTY_* bits to redraw
+    """
+    rects = []
+
+    if mask & DIRTY_BOARD:
+        area = ctx.board_gui.get_board_area().clip(ctx.screen.get_rect())
+        ctx.screen.set_clip(area)
+        ctx.board_gui.restore_board_area()
+        _render_board_layers(ctx)
+        ctx.screen.set_clip(None)
+        rects.append(area)
+
+    if mask & DIRTY_CLOCK:
+        rects.append(ctx.white_clock.draw())
+        rects.append(ctx.black_clock.draw())
+
+    if mask & DIRTY_CAPTURED and ctx.show_captured:
+        rects.extend(ctx.captured_display.draw(ctx.board_state.board))
+
+    if mask & DIRTY_PANEL:
+        rects.append(ctx.move_panel.draw(ctx.full_san_history, ctx.highlight_index))
+
+    if mask & DIRTY_CONTROLS:
+        rects.extend(ctx.game_controls.draw())
+
+    # Push only the repainted areas to the window. Past a point a per-rect
+    # update costs more than presenting the whole surface at once.
+    width, height = ctx.screen.get_size()
+    if (
+        len(rects) > MAX_DIRTY_RECTS
+        or sum(r.width * r.height for r in rects) * 2 > width * height
+    ):
+        pygame.display.flip()
+    else:
+        pygame.display.update(rects)
+
+
+def _idle_timeout(ctx: "GameContext") -> int:
+    """
+    How long the main loop may sleep on the event queue when nothing is dirty.
+
+    Input and engine results wake the loop by themselves; the timeout only
+    has to cover changes nobody posts an event for: a running clock showing
+    a new second (or running out), a tooltip coming due and a background
+    PGN operation finishing.
+
+    Args:
+        ctx: GameContext holding the clocks, controls and pending I/O
+
+    Returns:
+        int: Milliseconds to wait (at least 1)
+    """
+    timeouts = [Config.IDLE_WAIT_MAX_MS]
+
+    if ctx.pending_io is not None:
+        # The I/O future is polled, so keep checking it at the idle rate
+        timeouts.append(1000 // Config.IDLE_FPS)
+
+    for timeout in (
+        ctx.white_clock.ms_until_redraw(),
+        ctx.black_clock.ms_until_redraw(),
+        ctx.game_controls.ms_until_tooltip(),
+    ):
+        if timeout is not None:
+            timeouts.append(timeout)
+
+    return max(1, min(timeouts))
+
+
+def _event_dirty_bits(event, ctx: "GameContext") -> int:
+    """
+    Screen regions an input event can change.
+
+    Args:
+        event: pygame event about to be handled
+        ctx: GameContext (for drag / tooltip state)
+
+    Returns:
+        int: DIRTY_* bits to OR into ctx.dirty_mask
+    """
+    if event.type == MOUSEWHEEL:
+        # Wheel only scrolls the move history panel
+        return DIRTY_PANEL
+
+    if event.type == MOUSEMOTION:
+        handler = ctx.input_handler
+        if ctx.game_controls.tooltip_visible:
+            # Erasing a tooltip that may be drawn over the board
+            return DIRTY_ALL
+
+        if handler.arrow_dragging:
+            # Arrows run between square centers - always inside the board
+            return DIRTY_BOARD
+
+        if handler.drag_start_pos is not None or handler.dragging:
+            # The dragged piece is a square-sized sprite centered on the
+            # cursor; stay board-only while the old and new sprite fit
+            area = ctx.board_gui.get_board_area()
+            sprite = pygame.Rect(
+                0, 0, ctx.board_gui.square_size, ctx.board_gui.square_size
+            )
+            for pos in (event.pos, handler.drag_pos):
+                if pos is not None:
+                    sprite.center = pos
+                    if not area.contains(sprite):
+                        return DIRTY_ALL
+            return DIRTY_BOARD
+
+        # Plain hover only changes panel and button highlights
+        return DIRTY_PANEL | DIRTY_CONTROLS
+
+    return DIRTY_ALL
+
+
+# Event type -> handler dispatch table (replaces the if/elif ladder)
+HANDLERS = {
+    QUIT: _on_quit,
+    KEYDOWN: _on_keydown,
+    VIDEORESIZE: _on_videoresize,
+    MOUSEWHEEL: _on_mousewheel,
+    MOUSEBUTTONDOWN: _on_mousedown,
+    MOUSEBUTTONUP: _on_mouseup,
+    MOUSEMOTION: _on_mousemotion,
+    ENGINE_MOVE_READY: _on_engine_move,
+}
+
+
 def main():
     """
     Main application entry point and game loop.
@@ -484,6 +1959,12 @@ def main():
     print("Chess GUI")
     print("=" * 50)
 
+    # Configure console logging; hot-path diagnostics are DEBUG level
+    logging.basicConfig(
+        level=getattr(logging, str(Config.LOG_LEVEL).upper(), logging.INFO),
+        format="%(message)s",
+    )
+
     # Validate configuration settings before proceeding
     # This ensures all required config values are present and valid
     Config.validate()
@@ -551,9 +2032,12 @@ def main():
     )
     game_time_control = selected_time_control
 
+    # Resolve player colors once - refreshed only when a new game picks colors
+    human_color, engine_color = get_player_colors()
+
     # Recreate clocks and captured display with correct positions
     white_clock, black_clock, captured_display = recreate_clocks_and_captured_display(
-        screen, game_time_control
+        screen, game_time_control, board_gui.piece_loader
     )
     print("✅ Player clocks and captured pieces display initialized")
 
@@ -576,27 +2060,44 @@ def main():
     engine_controller = initialize_engine()  # Uses path from engine_wrapper.py
     print("✅ Engine controller initialized")
 
-    # Track move history for engine
-    move_history = []
-    full_san_history = []  # Parallel list of SAN moves for full history display
-    # Track current position in move history for navigation
-    current_move_index = -1  # -1 means "at latest position"
-
-    # Game state flags
-    game_ended = False
-    last_result = None
-
-    # Store time control for game resets
-    game_time_control = selected_time_control
+    # Bundle components and game state shared with the event handlers
+    ctx = GameContext(
+        screen=screen,
+        clock=clock,
+        board_state=board_state,
+        board_gui=board_gui,
+        input_handler=input_handler,
+        layout_handler=layout_handler,
+        result_dialog=result_dialog,
+        move_panel=move_panel,
+        game_controls=game_controls,
+        move_animator=move_animator,
+        sound_manager=sound_manager,
+        time_control_dialog=time_control_dialog,
+        color_selection_dialog=color_selection_dialog,
+        white_clock=white_clock,
+        black_clock=black_clock,
+        captured_display=captured_display,
+        settings_menu=settings_menu,
+        help_screen=help_screen,
+        engine_controller=engine_controller,
+        game_time_control=selected_time_control,
+        human_color=human_color,
+        engine_color=engine_color,
+    )
 
     # Play game start sound
     sound_manager.play_game_start_sound()
 
     # Check if engine should move first
-    engine_thinking = check_engine_turn_and_move(
-        board_state, engine_controller, move_history
+    ctx.engine_thinking = check_engine_turn_and_move(
+        board_state, engine_controller, ctx.move_history, engine_color
     )
 
+    # Handlers and rendering read ctx.engine_busy / ctx.input_accept; from
+    # here on they are refreshed by whatever changes them, not per frame
+    _refresh_input_state(ctx)
+
     print(f"\n[Info] You are playing as: {Config.HUMAN_COLOR.upper()}")
     print(f"[Info] Engine is playing as: {Config.ENGINE_COLOR.upper()}")
     print("\n[Keyboard Shortcuts]")
@@ -606,1260 +2107,177 @@ def main():
     print("  H = Help screen")
     print("  ESC = Exit game")
 
-    expected_len = 0
+    # Frame rate cap is fixed for the whole run
+    fps = Config.FPS
+
+    # Event that ended the last idle wait; handled first in the next frame
+    woken = None
 
     # ==================== Main Game Loop ====================
-    running = True
-    while running:
+    while ctx.running:
         # Monitor move_history for unexpected changes
-        if len(move_history) != expected_len:
-            print(f"[ERROR] move_history length changed unexpectedly!")
-            print(f"  Expected: {expected_len}, Got: {len(move_history)}")
-            print(f"  Contents: {move_history}")
-            expected_len = len(move_history)
+        if len(ctx.move_history) != ctx.expected_len:
+            log.warning("[ERROR] move_history length changed unexpectedly!")
+            log.warning(
+                "  Expected: %s, Got: %s", ctx.expected_len, len(ctx.move_history)
+            )
+            log.warning("  Contents: %s", ctx.move_history)
+            ctx.expected_len = len(ctx.move_history)
 
         # -------------------- Event Handling --------------------
-        # Process all events from the event queue
-        for event in pygame.event.get():
-            # Handle window close button
-            if event.type == pygame.QUIT:
-                running = False
-
-            # Handle keyboard input
-            elif event.type == pygame.KEYDOWN:
-                # ESC key exits the application
-                if event.key == pygame.K_ESCAPE:
-                    running = False
-
-                # Left arrow - previous halfmove
-                elif event.key == pygame.K_LEFT:
-                    if not move_history:
-                        print("[Navigation] ← No moves to navigate")
-                    else:
-                        # Determine current position
-                        if current_move_index < 0:
-                            # At "latest" - use board's actual position
-                            current_idx = len(board_state.board.move_stack) - 1
-                        else:
-                            # Navigating in history
-                            current_idx = current_move_index
-
-                        if current_idx > 0:
-                            current_move_index = current_idx - 1
-                            board_state = navigate_to_move(
-                                current_move_index, move_history
-                            )
-                            pair_index = highlight_index // 2
-                            move_panel.scroll_offset = max(
-                                0, pair_index - move_panel.visible_lines // 2
-                            )  # Centers the line if possible
-                            input_handler.board_state = board_state
-                            input_handler.reset()
-                            print(f"[DEBUG] move_history: {move_history}")
-                            print(
-                                f"[Navigation] ← Previous move (position {current_move_index + 1})"
-                            )
-                        else:
-                            print("[Navigation] ← Already at first halfmove")
-
-                # Right arrow - next halfmove
-                elif event.key == pygame.K_RIGHT:
-                    if not move_history:
-                        print("[Navigation] → No moves to navigate")
-                    else:
-                        # DEBUG: Print current state
-                        print(f"[DEBUG] Before navigation:")
-                        print(f"  move_history length: {len(move_history)}")
-                        print(f"  current_move_index: {current_move_index}")
-                        print(
-                            f"  board.move_stack length: {len(board_state.board.move_stack)}"
-                        )
-
-                        # Determine current position
-                        if current_move_index < 0:
-                            # At "latest" - already at the end, can't go forward
-                            print("[Navigation] → Already at latest position")
-                        else:
-                            # Navigating in history
-                            current_idx = current_move_index
-
-                            if current_idx < len(move_history) - 1:
-                                current_move_index = current_idx + 1
-
-                                # DEBUG: Print what move we're navigating to
-                                print(
-                                    f"[DEBUG] Navigating to index {current_move_index}"
-                                )
-                                print(
-                                    f"[DEBUG] Move at that index: {move_history[current_move_index]}"
-                                )
-
-                                board_state = navigate_to_move(
-                                    current_move_index, move_history
-                                )
-                                pair_index = highlight_index // 2
-                                move_panel.scroll_offset = max(
-                                    0, pair_index - move_panel.visible_lines // 2
-                                )  # Centers the line if possible
-
-                                # DEBUG: Print resulting board state
-                                print(f"[DEBUG] After navigate_to_move:")
-                                print(
-                                    f"  board.move_stack length: {len(board_state.board.move_stack)}"
-                                )
-                                print(f"  FEN: {board_state.get_fen()}")
-
-                                input_handler.board_state = board_state
-                                input_handler.reset()
-                                print(
-                                    f"[Navigation] → Next move (position {current_move_index + 1})"
-                                )
-                            else:
-                                # At the last move in history - stay here
-                                print("[Navigation] → Already at last move")
-
-                # Up arrow - jump to first move
-                elif event.key == pygame.K_UP:
-                    if move_history:
-                        current_move_index = 0
-                        board_state = navigate_to_move(0, move_history)
-                        pair_index = highlight_index // 2
-                        move_panel.scroll_offset = max(
-                            0, pair_index - move_panel.visible_lines // 2
-                        )  # Centers the line if possible
-                        input_handler.board_state = board_state
-                        input_handler.reset()
-                        print(f"[DEBUG] move_history: {move_history}")
-                        print(f"[Navigation] ↑ First move")
-
-                # Down arrow - jump to last played move
-                elif event.key == pygame.K_DOWN:
-                    if move_history:
-                        current_move_index = len(move_history) - 1
-                        board_state = navigate_to_move(current_move_index, move_history)
-                        pair_index = highlight_index // 2
-                        move_panel.scroll_offset = max(
-                            0, pair_index - move_panel.visible_lines // 2
-                        )  # Centers the line if possible
-                        input_handler.board_state = board_state
-                        input_handler.reset()
-                        print(f"[DEBUG] move_history: {move_history}")
-                        print(
-                            f"[Navigation] ↓ Last move (position {current_move_index + 1})"
-                        )
-
-                # S key opens settings menu
-                elif event.key == pygame.K_s:
-                    print("[Menu] Opening settings...")
-                    settings_changed = settings_menu.show()
-                    if settings_changed:
-                        # Apply sound settings to sound manager
-                        sound_manager.set_enabled(Config.ENABLE_SOUNDS)
-                        sound_manager.set_volume(Config.SOUND_VOLUME)
-
-                        # Apply animation settings to move animator
-                        move_animator.animation_enabled = Config.ANIMATE_MOVES
-                        move_animator.animation_speed = Config.ANIMATION_SPEED
-
-                        print("[Menu] Settings updated")
-                        print(f"  Animations: {Config.ANIMATE_MOVES}")
-                        print(f"  Sounds: {Config.ENABLE_SOUNDS}")
-                        print(f"  Last move highlight: {Config.SHOW_LAST_MOVE}")
-                        print(f"  Captured pieces: {Config.SHOW_CAPTURED_PIECES}")
-
-                # H key opens help screen
-                elif event.key == pygame.K_h:
-                    print("[Menu] Opening help...")
-                    help_screen.show()
-
-                # R key resets the board to starting position
-                elif event.key == pygame.K_r and not game_ended:
-                    game_ended, last_result, game_time_control, _ = (
-                        start_new_game_with_dialogs(
-                            board_state,
-                            input_handler,
-                            move_history,
-                            full_san_history,
-                            engine_controller,
-                            move_panel,
-                            white_clock,
-                            black_clock,
-                            move_animator,
-                            sound_manager,
-                            screen,
-                            time_control_dialog,
-                            color_selection_dialog,
-                            layout_handler,
-                        )
-                    )
-
-                    white_clock, black_clock, captured_display = (
-                        recreate_clocks_and_captured_display(screen, game_time_control)
-                    )
-
-                    # Recalculate layout based on new FLIP_BOARD setting
-                    layout_handler.handle_resize(
-                        screen.get_width(), screen.get_height()
-                    )
-
-                    print("[Action] Board reset")
-                    print(f"    Status: {board_state.get_game_status()}")
-                    print("\n[Game] New game started")
-                    # Check if engine should move first
-                    engine_thinking = check_engine_turn_and_move(
-                        board_state, engine_controller, move_history
-                    )
-
-                # U key undoes last move (or two moves if playing vs engine)
-                elif event.key == pygame.K_u and not game_ended:
-                    if not engine_controller.is_thinking():
-                        # Undo two moves (player + engine)
-                        move1 = board_state.undo_move()
-                        move2 = board_state.undo_move()
-
-                        if move1:
-                            if move_history:
-                                move_history.pop()
-                                full_san_history.pop()
-                            print(f"[Game] Undid move: {move1.uci()}")
-                        if move2:
-                            if move_history:
-                                move_history.pop()
-                                full_san_history.pop()
-                            print(f"[Game] Undid move: {move2.uci()}")
-
-                        current_move_index = -1  # Reset to "at latest"
-                        input_handler.reset()
-                        print(f"[DEBUG] move_history: {move_history}")
-
-            # Window resize handler
-            elif event.type == pygame.VIDEORESIZE:
-                # Update layout
-                layout_handler.handle_resize(event.w, event.h)
-
-                # Recreate screen with new size
-                screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
-
-                # Reinitialize components with new Config values
-                board_gui = BoardGUI(screen)
-                move_panel = MoveHistoryPanel(
-                    screen,
-                    x=Config.MOVE_HISTORY_X,
-                    y=Config.MOVE_HISTORY_Y,
-                    width=Config.MOVE_HISTORY_WIDTH,
-                    height=Config.MOVE_HISTORY_HEIGHT,
-                )
-                game_controls = GameControls(
-                    screen,
-                    x=Config.GAME_CONTROLS_X,
-                    y=Config.GAME_CONTROLS_Y,
-                    width=Config.GAME_CONTROLS_WIDTH,
-                    icon_size=Config.GAME_CONTROLS_ICON_SIZE,
-                    spacing=Config.GAME_CONTROLS_SPACING,
-                )
-                # captured_display = CapturedPiecesDisplay(
-                #     screen,
-                #     white_x=Config.CAPTURED_PIECES_WHITE_X,
-                #     white_y=Config.CAPTURED_PIECES_WHITE_Y,
-                #     white_width=Config.CAPTURED_PIECES_WHITE_WIDTH,
-                #     white_height=Config.CAPTURED_PIECES_WHITE_HEIGHT,
-                #     black_x=Config.CAPTURED_PIECES_BLACK_X,
-                #     black_y=Config.CAPTURED_PIECES_BLACK_Y,
-                #     black_width=Config.CAPTURED_PIECES_BLACK_WIDTH,
-                #     black_height=Config.CAPTURED_PIECES_BLACK_HEIGHT,
-                # )
-
-                # Recreate player clocks - preserve state from old clocks
-                # Save state before recreating
-                old_white_time = (
-                    white_clock.time_remaining
-                    if hasattr(white_clock, "time_remaining")
-                    else game_time_control
-                )
-                old_black_time = (
-                    black_clock.time_remaining
-                    if hasattr(black_clock, "time_remaining")
-                    else game_time_control
-                )
-                old_white_is_active = (
-                    white_clock.is_active
-                    if hasattr(white_clock, "is_active")
-                    else (board_state.board.turn == chess.WHITE)
-                )
-                old_paused = (
-                    white_clock.paused if hasattr(white_clock, "paused") else True
-                )
-
-                white_clock, black_clock, captured_display = (
-                    recreate_clocks_and_captured_display(screen, game_time_control)
-                )
-
-                # white_clock = PlayerClock(
-                #     screen,
-                #     x=Config.WHITE_CLOCK_X,
-                #     y=Config.WHITE_CLOCK_Y,
-                #     width=Config.WHITE_CLOCK_WIDTH,
-                #     height=Config.WHITE_CLOCK_HEIGHT,
-                #     player_name="White",
-                #     player_color=chess.WHITE,
-                #     time_control=game_time_control,
-                # )
-
-                # black_clock = PlayerClock(
-                #     screen,
-                #     x=Config.BLACK_CLOCK_X,
-                #     y=Config.BLACK_CLOCK_Y,
-                #     width=Config.BLACK_CLOCK_WIDTH,
-                #     height=Config.BLACK_CLOCK_HEIGHT,
-                #     player_name="Black",
-                #     player_color=chess.BLACK,
-                #     time_control=game_time_control,
-                # )
-
-                # Restore clock state
-                if game_time_control is not None:  # Only restore if using time controls
-                    white_clock.time_remaining = old_white_time
-                    black_clock.time_remaining = old_black_time
-                    white_clock.start()  # Initialize
-                    black_clock.start()
-                    if old_white_is_active:
-                        white_clock.activate()
-                    else:
-                        black_clock.activate()
-                    if not old_paused:
-                        if old_white_is_active:
-                            white_clock.resume()
-                        else:
-                            black_clock.resume()
-
-                settings_menu = SettingsMenu(screen)
-                help_screen = HelpScreen(screen)
-                result_dialog = GameResultDialog(screen)
-
-                # Update references in other components
-                input_handler.board_gui = board_gui
-                move_animator.board_gui = board_gui
-
-                print(
-                    f"[Resize] Window: {event.w}x{event.h}, Board: {Config.BOARD_SIZE}x{Config.BOARD_SIZE}"
-                )
-
-            # Mouse wheel for move history scrolling
-            elif event.type == pygame.MOUSEWHEEL:
-                mouse_pos = pygame.mouse.get_pos()
-                if move_panel.is_mouse_over(mouse_pos):
-                    move_panel.handle_mouse_wheel(event.y)
-
-            # Mouse events - Support BOTH drag-and-drop AND click-to-move
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 1:  # Left click
-                    # Check for game controls clicks
-                    button_id = game_controls.handle_click(event.pos)
-
-                    # Handle New Game button click
-                    if button_id == "new_game":
-                        print("[Action] New Game button pressed")
-                        game_ended, last_result, game_time_control, _ = (
-                            start_new_game_with_dialogs(
-                                board_state,
-                                input_handler,
-                                move_history,
-                                full_san_history,
-                                engine_controller,
-                                move_panel,
-                                white_clock,
-                                black_clock,
-                                move_animator,
-                                sound_manager,
-                                screen,
-                                time_control_dialog,
-                                color_selection_dialog,
-                                layout_handler,
-                            )
-                        )
-
-                        white_clock, black_clock, captured_display = (
-                            recreate_clocks_and_captured_display(
-                                screen, game_time_control
-                            )
-                        )
-
-                        # Recalculate layout based on new FLIP_BOARD setting
-                        layout_handler.handle_resize(
-                            screen.get_width(), screen.get_height()
-                        )
-
-                        # Check if engine should move first
-                        engine_thinking = check_engine_turn_and_move(
-                            board_state, engine_controller, move_history
-                        )
-
-                    # Handle save button click
-                    if button_id == "save_pgn":
-                        if len(board_state.board.move_stack) > 0:
-                            filepath = game_controls.show_save_dialog()
-                            if filepath:
-                                pgn_string = board_state.to_pgn()
-                                if save_pgn_to_file(pgn_string, filepath):
-                                    print(f"[Action] ✅ Game saved to: {filepath}")
-
-                    # Handle load button click
-                    elif button_id == "load_pgn":
-                        filepath = game_controls.show_load_dialog()
-                        if filepath:
-                            pgn_string = load_pgn_from_file(filepath)
-                            if pgn_string:
-                                try:
-                                    new_state = BoardState.from_pgn(pgn_string)
-                                    board_state = new_state
-                                    move_history = board_state.get_move_history_uci()
-                                    full_san_history = (
-                                        board_state.get_move_history_san()
-                                    )
-                                    input_handler.board_state = board_state
-                                    move_panel.scroll_to_bottom()
-                                    game_ended = False
-                                    last_result = None
-                                    print(f"[Action] ✅ Game loaded: {filepath}")
-                                except Exception as e:
-                                    print(f"[Action] ❌ Failed to load: {e}")
-
-                    # Handle resign button click
-                    elif button_id == "resign":
-                        # Current player resigns
-                        winner = (
-                            "Black"
-                            if board_state.board.turn == chess.WHITE
-                            else "White"
-                        )
-                        print(f"[Action] {board_state.get_turn_string()} resigns!")
-                        game_ended = True
-                        last_result = ("resignation", winner, "")
-
-                        # Pause both clocks
-                        white_clock.pause()
-                        black_clock.pause()
-
-                        # Show result dialog
-                        choice = result_dialog.show("resignation", winner, "")
-                        if choice == "new_game":
-                            game_ended, last_result, game_time_control, _ = (
-                                start_new_game_with_dialogs(
-                                    board_state,
-                                    input_handler,
-                                    move_history,
-                                    full_san_history,
-                                    engine_controller,
-                                    move_panel,
-                                    white_clock,
-                                    black_clock,
-                                    move_animator,
-                                    sound_manager,
-                                    screen,
-                                    time_control_dialog,
-                                    color_selection_dialog,
-                                    layout_handler,
-                                )
-                            )
-
-                            white_clock, black_clock, captured_display = (
-                                recreate_clocks_and_captured_display(
-                                    screen, game_time_control
-                                )
-                            )
-
-                            # Recalculate layout based on new FLIP_BOARD setting
-                            layout_handler.handle_resize(
-                                screen.get_width(), screen.get_height()
-                            )
-
-                            engine_thinking = check_engine_turn_and_move(
-                                board_state, engine_controller, move_history
-                            )
-
-                    # Move history click navigation
-                    else:
-                        # Check if user clicked on move history panel
-                        clicked_move_idx = move_panel.handle_click(event.pos)
-
-                        # If a move was clicked, navigate to that position
-                        if clicked_move_idx is not None and clicked_move_idx < len(
-                            move_history
-                        ):
-                            print(
-                                f"[Navigation] Jumped to position after move {clicked_move_idx + 1}"
-                            )
-
-                            current_move_index = clicked_move_idx
-
-                            # Update navigation index
-                            current_move_index = clicked_move_idx
-
-                            # Create new board state at that position
-                            board_state = navigate_to_move(
-                                clicked_move_idx, move_history
-                            )
-                            pair_index = highlight_index // 2
-                            move_panel.scroll_offset = max(
-                                0, pair_index - move_panel.visible_lines // 2
-                            )  # Centers the line if possible
-
-                            # Update references
-                            input_handler.board_state = board_state
-                            input_handler.reset()
-                            print(f"[DEBUG] move_history: {move_history}")
-
-                            # Cancel any thinking
-                            engine_controller.cancel_thinking()
-
-                            # This is navigation mode - viewing only
-                            # To resume play, user clicks "New Game"
-                            print(f"[Navigation] Position: {board_state.get_fen()}")
-                            print("[Navigation] Click 'New Game' to start fresh game")
-
-                        elif not game_ended:
-                            human_color = (
-                                chess.WHITE
-                                if Config.HUMAN_COLOR == "white"
-                                else chess.BLACK
-                            )
-                            # Allow mouse down during engine thinking if premove enabled
-                            if board_state.board.turn == human_color or (
-                                Config.ENABLE_PREMOVE
-                                and engine_controller.is_thinking()
-                            ):
-                                input_handler.handle_mouse_down(
-                                    event.pos, engine_controller.is_thinking()
-                                )
-
-                elif event.button == 3 and not game_ended:
-                    # Start potential arrow drag (if on board)
-                    input_handler.start_arrow_drag(event.pos)
-
-            # Mouse button up - handle move completion
-            elif event.type == pygame.MOUSEBUTTONUP and not game_ended:
-                if event.button == 1:  # Left click release
-                    human_color = (
-                        chess.WHITE if Config.HUMAN_COLOR == "white" else chess.BLACK
-                    )
-                    # Allow mouse up during engine thinking if premove enabled
-                    if board_state.board.turn == human_color or (
-                        Config.ENABLE_PREMOVE and engine_controller.is_thinking()
-                    ):
-                        # Try to complete drag move (may be premove)
-                        move_made = input_handler.handle_mouse_up(
-                            event.pos, engine_controller.is_thinking()
-                        )
-
-                        # If no drag move was made, handle as click-to-move
-                        if not move_made:
-                            move_made = input_handler.handle_mouse_click(
-                                event.pos, engine_controller.is_thinking()
-                            )
-
-                        # If player made a move, add to history and check for engine turn
-                        if move_made:
-                            # Get the last move from board
-                            if board_state.board.move_stack:
-                                last_move = board_state.board.peek()
-                                print(
-                                    f"[DEBUG] Adding PLAYER move to history: {last_move.uci()}"
-                                )
-                                print(f"[DEBUG] move_history before: {move_history}")
-                                # Prevent duplicates - only add if not already in history
-                                if (
-                                    not move_history
-                                    or move_history[-1] != last_move.uci()
-                                ):
-                                    move_history.append(last_move.uci())
-                                    current_move_index = -1
-                                    # Temporarily undo the move to compute SAN
-                                    board_state.board.pop()
-                                    move_san = board_state.board.san(last_move)
-                                    board_state.board.push(last_move)
-                                    full_san_history.append(move_san)
-                                    move_panel.scroll_to_bottom()
-                                else:
-                                    print(
-                                        f"[DEBUG] Prevented duplicate PLAYER move: {last_move.uci()}"
-                                    )
-                                print(f"[DEBUG] move_history after: {move_history}")
-                                expected_len = len(move_history)
-                                current_move_index = -1  # Reset to "at latest"
-                                move_panel.scroll_to_bottom()
-
-                                # Start move animation ONLY for click-to-move
-                                # Check how the move was made
-                                move_method = input_handler.get_last_move_method()
-
-                                if move_method == "click":
-                                    # Animate click-to-move
-                                    piece_at_dest = board_state.board.piece_at(
-                                        last_move.to_square
-                                    )
-                                    if piece_at_dest:
-                                        move_animator.start_animation(
-                                            piece_at_dest,
-                                            last_move.from_square,
-                                            last_move.to_square,
-                                        )
-                                # If move_method == "drag", skip animation
-
-                                # Clear the move method tracking
-                                input_handler.clear_move_method()
-
-                                # Play move sound
-                                is_capture = board_state.board.is_capture(last_move)
-                                is_check = board_state.board.is_check()
-                                is_castle = board_state.board.is_castling(last_move)
-
-                                if is_castle:
-                                    sound_manager.play_castle_sound()
-                                elif last_move.promotion:
-                                    sound_manager.play_promotion_sound()
-                                else:
-                                    sound_manager.play_move_sound(
-                                        is_capture=is_capture, is_check=is_check
-                                    )
-
-                                # Switch active clock based on whose turn it is
-                                if board_state.board.turn == chess.WHITE:
-                                    white_clock.activate()
-                                    white_clock.resume()
-                                    black_clock.deactivate()
-                                else:
-                                    black_clock.activate()
-                                    black_clock.resume()
-                                    white_clock.deactivate()
-
-                            # Check for game end
-                            is_over, result_type, winner, reason = (
-                                check_game_end_conditions(board_state)
-                            )
-                            if is_over:
-                                game_ended = True
-                                last_result = (result_type, winner, reason)
-                                sound_manager.play_game_end_sound()
-
-                                # Pause both clocks
-                                white_clock.pause()
-                                black_clock.pause()
-
-                                print(f"[Game] Game over: {result_type}")
-                                if winner:
-                                    print(f"       Winner: {winner}")
-                                if reason:
-                                    print(f"       Reason: {reason}")
-
-                                # Show result dialog
-                                choice = result_dialog.show(result_type, winner, reason)
-                                if choice == "new_game":
-                                    game_ended, last_result, game_time_control, _ = (
-                                        start_new_game_with_dialogs(
-                                            board_state,
-                                            input_handler,
-                                            move_history,
-                                            full_san_history,
-                                            engine_controller,
-                                            move_panel,
-                                            white_clock,
-                                            black_clock,
-                                            move_animator,
-                                            sound_manager,
-                                            screen,
-                                            time_control_dialog,
-                                            color_selection_dialog,
-                                            layout_handler,
-                                        )
-                                    )
-
-                                    white_clock, black_clock, captured_display = (
-                                        recreate_clocks_and_captured_display(
-                                            screen, game_time_control
-                                        )
-                                    )
-
-                                    # Recalculate layout based on new FLIP_BOARD setting
-                                    layout_handler.handle_resize(
-                                        screen.get_width(), screen.get_height()
-                                    )
-
-                                    engine_thinking = check_engine_turn_and_move(
-                                        board_state, engine_controller, move_history
-                                    )
-                            else:
-                                # Check if engine should move now
-                                engine_thinking = check_engine_turn_and_move(
-                                    board_state, engine_controller, move_history
-                                )
-
-                elif event.button == 3:
-                    # Try to finish arrow drag
-                    arrow_created = input_handler.finish_arrow_drag(event.pos)
-
-                    # If no arrow was created and there was no drag movement -> treat as clear-click
-                    if not arrow_created and not input_handler.right_click_moved:
-                        input_handler.clear_premoves_and_arrows()
-
-            # Mouse motion - drag handling
-            elif event.type == pygame.MOUSEMOTION and not game_ended:
-                # Track mouse position during drag, but only on human's turn
-                human_color = (
-                    chess.WHITE if Config.HUMAN_COLOR == "white" else chess.BLACK
-                )
-                # Allow mouse motion during engine thinking if premove enabled
-                if board_state.board.turn == human_color or (
-                    Config.ENABLE_PREMOVE and engine_controller.is_thinking()
-                ):
-                    input_handler.handle_mouse_motion(
-                        event.pos, engine_controller.is_thinking()
-                    )
-
-        # -------------------- Engine Move Processing --------------------
-
-        if not game_ended:
-            # Check if engine has a move ready
-            move_uci = engine_controller.get_move_if_ready()
-
-            if move_uci is not None:  # Engine has returned a move
-                try:
-                    # Parse, validate, and apply the move
-                    move = chess.Move.from_uci(move_uci)
-
-                    # Check if move is legal
-                    if move in board_state.board.legal_moves:
-                        piece_to_move = board_state.board.piece_at(move.from_square)
-                        move_san = board_state.board.san(move)
-                        is_capture = board_state.board.is_capture(move)
-                        is_castle = board_state.board.is_castling(move)
-                        success = board_state.make_move(move)
-
-                        # If move applied successfully, update history and reset input
-                        if success:
-                            print(
-                                f"[DEBUG] Adding ENGINE move to history: {last_move.uci()}"
-                            )
-                            print(f"[DEBUG] move_history before: {move_history}")
-                            # Prevent duplicates - only add if not already in history
-                            if not move_history or move_history[-1] != move_uci:
-                                move_history.append(move_uci)
-                                current_move_index = -1
-                                # Temporarily undo the move to compute SAN
-                                last_move = board_state.board.pop()
-                                move_san = board_state.board.san(last_move)
-                                board_state.board.push(last_move)
-                                full_san_history.append(move_san)
-                                move_panel.scroll_to_bottom()
-                            else:
-                                print(
-                                    f"[DEBUG] Prevented duplicate ENGINE move: {move_uci}"
-                                )
-                            print(f"[DEBUG] move_history after: {move_history}")
-
-                            expected_len = len(move_history)
-                            current_move_index = -1  # Reset to "at latest"
-                            move_panel.scroll_to_bottom()
-
-                            # Start animation
-                            if piece_to_move:
-                                piece_at_dest = board_state.board.piece_at(
-                                    move.to_square
-                                )
-                                if piece_at_dest:
-                                    move_animator.start_animation(
-                                        piece_at_dest, move.from_square, move.to_square
-                                    )
-
-                            # Play sound
-                            is_check = board_state.board.is_check()
-                            if is_castle:
-                                sound_manager.play_castle_sound()
-                            elif move.promotion:
-                                sound_manager.play_promotion_sound()
-                            else:
-                                sound_manager.play_move_sound(
-                                    is_capture=is_capture, is_check=is_check
-                                )
-
-                            # Switch active clock
-                            if board_state.board.turn == chess.WHITE:
-                                white_clock.activate()
-                                white_clock.resume()
-                                black_clock.deactivate()
-                            else:
-                                black_clock.activate()
-                                black_clock.resume()
-                                white_clock.deactivate()
-
-                            print(f"[Engine] Move made: {move_san} ({move_uci})")
-                            print(f"         Status: {board_state.get_game_status()}")
-                            input_handler.soft_reset()
-
-                            # Check for game end
-                            is_over, result_type, winner, reason = (
-                                check_game_end_conditions(board_state)
-                            )
-                            if is_over:
-                                game_ended = True
-                                last_result = (result_type, winner, reason)
-                                sound_manager.play_game_end_sound()
-
-                                # Pause both clocks
-                                white_clock.pause()
-                                black_clock.pause()
-
-                                print(f"[Game] Game over: {result_type}")
-                                if winner:
-                                    print(f"       Winner: {winner}")
-                                if reason:
-                                    print(f"       Reason: {reason}")
-
-                                # Show result dialog
-                                choice = result_dialog.show(result_type, winner, reason)
-                                if choice == "new_game":
-                                    game_ended, last_result, game_time_control, _ = (
-                                        start_new_game_with_dialogs(
-                                            board_state,
-                                            input_handler,
-                                            move_history,
-                                            full_san_history,
-                                            engine_controller,
-                                            move_panel,
-                                            white_clock,
-                                            black_clock,
-                                            move_animator,
-                                            sound_manager,
-                                            screen,
-                                            time_control_dialog,
-                                            color_selection_dialog,
-                                            layout_handler,
-                                        )
-                                    )
-
-                                    white_clock, black_clock, captured_display = (
-                                        recreate_clocks_and_captured_display(
-                                            screen, game_time_control
-                                        )
-                                    )
-
-                                    # Recalculate layout based on new FLIP_BOARD setting
-                                    layout_handler.handle_resize(
-                                        screen.get_width(), screen.get_height()
-                                    )
-
-                                    engine_thinking = check_engine_turn_and_move(
-                                        board_state, engine_controller, move_history
-                                    )
-
-                            else:
-                                # Game continues - execute premove if queued
-                                if input_handler.has_premove():
-                                    premove_made = (
-                                        input_handler.execute_next_premove_if_valid()
-                                    )
-                                    if premove_made:
-                                        # Premove was executed - handle as a regular move
-                                        if board_state.board.move_stack:
-                                            last_move = board_state.board.peek()
-                                            print(
-                                                f"[DEBUG] Adding EXECUTED PREMOVE to history: {last_move.uci()}"
-                                            )
-                                            print(
-                                                f"[DEBUG] move_history before: {move_history}"
-                                            )
-                                            # Prevent duplicates - only add if not already in history
-                                            if (
-                                                not move_history
-                                                or move_history[-1] != last_move.uci()
-                                            ):
-                                                move_history.append(last_move.uci())
-                                                current_move_index = -1
-                                                # Temporarily undo the move to compute SAN
-                                                board_state.board.pop()
-                                                move_san = board_state.board.san(
-                                                    last_move
-                                                )
-                                                board_state.board.push(last_move)
-                                                full_san_history.append(move_san)
-                                            else:
-                                                print(
-                                                    f"[DEBUG] Prevented duplicate PREMOVE: {last_move.uci()}"
-                                                )
-                                            print(
-                                                f"[DEBUG] move_history after: {move_history}"
-                                            )
-                                            expected_len = len(move_history)
-                                            current_move_index = (
-                                                -1
-                                            )  # Reset to "at latest"
-
-                                            # Start move animation ONLY for click-to-move
-                                            # Check how the move was made
-                                            move_method = (
-                                                input_handler.get_last_move_method()
-                                            )
-
-                                            if move_method == "click":
-                                                # Animate click-to-move
-                                                piece_at_dest = (
-                                                    board_state.board.piece_at(
-                                                        last_move.to_square
-                                                    )
-                                                )
-                                                if piece_at_dest:
-                                                    move_animator.start_animation(
-                                                        piece_at_dest,
-                                                        last_move.from_square,
-                                                        last_move.to_square,
-                                                    )
-                                            # If move_method == "drag", skip animation
-
-                                            # Clear the move method tracking
-                                            input_handler.clear_move_method()
-
-                                            # Play move sound
-                                            is_capture = board_state.board.is_capture(
-                                                last_move
-                                            )
-                                            is_check = board_state.board.is_check()
-                                            is_castle = board_state.board.is_castling(
-                                                last_move
-                                            )
-
-                                            if is_castle:
-                                                sound_manager.play_castle_sound()
-                                            elif last_move.promotion:
-                                                sound_manager.play_promotion_sound()
-                                            else:
-                                                sound_manager.play_move_sound(
-                                                    is_capture=is_capture,
-                                                    is_check=is_check,
-                                                )
-
-                                            # Switch active clock based on whose turn it is
-                                            if board_state.board.turn == chess.WHITE:
-                                                white_clock.activate()
-                                                white_clock.resume()
-                                                black_clock.deactivate()
-                                            else:
-                                                black_clock.activate()
-                                                black_clock.resume()
-                                                white_clock.deactivate()
-
-                                        # Check for game end
-                                        is_over, result_type, winner, reason = (
-                                            check_game_end_conditions(board_state)
-                                        )
-                                        if is_over:
-                                            game_ended = True
-                                            last_result = (result_type, winner, reason)
-                                            sound_manager.play_game_end_sound()
-
-                                            # Pause both clocks
-                                            white_clock.pause()
-                                            black_clock.pause()
-
-                                            print(f"[Game] Game over: {result_type}")
-                                            if winner:
-                                                print(f"       Winner: {winner}")
-                                            if reason:
-                                                print(f"       Reason: {reason}")
-
-                                            # Show result dialog
-                                            choice = result_dialog.show(
-                                                result_type, winner, reason
-                                            )
-                                            if choice == "new_game":
-                                                (
-                                                    game_ended,
-                                                    last_result,
-                                                    game_time_control,
-                                                    _,
-                                                ) = start_new_game_with_dialogs(
-                                                    board_state,
-                                                    input_handler,
-                                                    move_history,
-                                                    full_san_history,
-                                                    engine_controller,
-                                                    move_panel,
-                                                    white_clock,
-                                                    black_clock,
-                                                    move_animator,
-                                                    sound_manager,
-                                                    screen,
-                                                    time_control_dialog,
-                                                    color_selection_dialog,
-                                                    layout_handler,
-                                                )
-
-                                                (
-                                                    white_clock,
-                                                    black_clock,
-                                                    captured_display,
-                                                ) = recreate_clocks_and_captured_display(
-                                                    screen, game_time_control
-                                                )
-
-                                                # Recalculate layout based on new FLIP_BOARD setting
-                                                layout_handler.handle_resize(
-                                                    screen.get_width(),
-                                                    screen.get_height(),
-                                                )
-
-                                                engine_thinking = (
-                                                    check_engine_turn_and_move(
-                                                        board_state,
-                                                        engine_controller,
-                                                        move_history,
-                                                    )
-                                                )
-                                        else:
-                                            engine_thinking = (
-                                                check_engine_turn_and_move(
-                                                    board_state,
-                                                    engine_controller,
-                                                    move_history,
-                                                )
-                                            )
-
-                        else:
-                            print(f"[Engine] ❌ Failed to apply move: {move_uci}")
-                    else:
-                        print(f"[Engine] ❌ Illegal move returned: {move_uci}")
-
-                except Exception as e:
-                    print(f"[Engine] ❌ Error applying move: {e}")
+        # Process all events from the event queue.
+        # Consecutive MOUSEMOTION events are coalesced - only the latest
+        # position matters for dragging, so it is dispatched once, right
+        # before the next non-motion event (or at the end of the batch).
+        # Interactive window drags queue many VIDEORESIZE events; only the
+        # final size is applied, once per frame after the other events.
+        last_motion = None
+        last_resize = None
+        events = pygame.event.get()
+        if woken is not None:
+            events.insert(0, woken)
+            woken = None
+        for event in events:
+            # Mark the screen regions this input (or window expose) can change
+            ctx.dirty_mask |= _event_dirty_bits(event, ctx)
+            if event.type == MOUSEMOTION:
+                last_motion = event
+                continue
+            if event.type == VIDEORESIZE:
+                last_resize = event
+                continue
+            if last_motion is not None:
+                _on_mousemotion(last_motion, ctx)
+                last_motion = None
+            handler = HANDLERS.get(event.type)
+            if handler is not None:
+                handler(event, ctx)
+        if last_motion is not None:
+            _on_mousemotion(last_motion, ctx)
+        if last_resize is not None:
+            _on_videoresize(last_resize, ctx)
+
+        # -------------------- Background PGN I/O --------------------
+
+        if ctx.pending_io is not None and ctx.pending_io[2].done():
+            io_kind, filepath, future = ctx.pending_io
+            ctx.pending_io = None
+            ctx.dirty_mask |= DIRTY_ALL  # Hide the I/O banner
+
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"[Action] ❌ Failed to {io_kind}: {e}")
+            else:
+                if io_kind == "save":
+                    if result:
+                        print(f"[Action] ✅ Game saved to: {filepath}")
+                elif result is not None:
+                    # Loaded game replaces the current one
+                    _apply_loaded_game(ctx, result)
+                    print(f"[Action] ✅ Game loaded: {filepath}")
 
         # Check for time expiration (optional - only if using timed games)
-        if not game_ended:
-            if white_clock.is_time_expired():
+        if not ctx.game_ended:
+            forfeit_result = None
+            if ctx.white_clock.is_time_expired():
                 # White ran out of time - check if Black can win
-
-                # Check if Black has insufficient material to deliver checkmate
-                if board_state.board.has_insufficient_material(chess.BLACK):
-                    # Draw - Black cannot checkmate even with infinite time
-                    game_ended = True
-                    last_result = ("draw", None, "insufficient material")
-                    sound_manager.play_game_end_sound()
-                    white_clock.pause()
-                    black_clock.pause()
-
+                # Black cannot checkmate even with infinite time -> draw
+                if ctx.board_state.board.has_insufficient_material(CHESS_BLACK):
                     print(
                         "[Game] Time forfeit, but draw - Black has insufficient mating material"
                     )
-                    choice = result_dialog.show("draw", None, "insufficient material")
+                    forfeit_result = ("draw", None, "insufficient material")
                 else:
-                    # Black wins on time
-                    game_ended = True
-                    last_result = ("time_forfeit", "Black", "White ran out of time")
-                    sound_manager.play_game_end_sound()
-                    white_clock.pause()
-                    black_clock.pause()
-
                     print("[Game] Time expired: White ran out of time - Black wins")
-                    choice = result_dialog.show(
-                        "time_forfeit", "Black", "White ran out of time"
-                    )
-
-                if choice == "new_game":
-                    game_ended, last_result, game_time_control, _ = (
-                        start_new_game_with_dialogs(
-                            board_state,
-                            input_handler,
-                            move_history,
-                            full_san_history,
-                            engine_controller,
-                            move_panel,
-                            white_clock,
-                            black_clock,
-                            move_animator,
-                            sound_manager,
-                            screen,
-                            time_control_dialog,
-                            color_selection_dialog,
-                            layout_handler,
-                        )
-                    )
-
-                    white_clock, black_clock, captured_display = (
-                        recreate_clocks_and_captured_display(screen, game_time_control)
-                    )
-
-                    # Recalculate layout based on new FLIP_BOARD setting
-                    layout_handler.handle_resize(
-                        screen.get_width(), screen.get_height()
-                    )
-
-                    engine_thinking = check_engine_turn_and_move(
-                        board_state, engine_controller, move_history
-                    )
+                    forfeit_result = ("time_forfeit", "Black", "White ran out of time")
 
-            elif black_clock.is_time_expired():
+            elif ctx.black_clock.is_time_expired():
                 # Black ran out of time - check if White can win
-
-                # Check if White has insufficient material to deliver checkmate
-                if board_state.board.has_insufficient_material(chess.WHITE):
-                    # Draw - White cannot checkmate even with infinite time
-                    game_ended = True
-                    last_result = ("draw", None, "insufficient material")
-                    sound_manager.play_game_end_sound()
-                    white_clock.pause()
-                    black_clock.pause()
-
+                # White cannot checkmate even with infinite time -> draw
+                if ctx.board_state.board.has_insufficient_material(CHESS_WHITE):
                     print(
                         "[Game] Time forfeit, but draw - White has insufficient mating material"
                     )
-                    choice = result_dialog.show("draw", None, "insufficient material")
+                    forfeit_result = ("draw", None, "insufficient material")
                 else:
-                    # White wins on time
-                    game_ended = True
-                    last_result = ("time_forfeit", "White", "Black ran out of time")
-                    sound_manager.play_game_end_sound()
-                    white_clock.pause()
-                    black_clock.pause()
-
                     print("[Game] Time expired: Black ran out of time - White wins")
-                    choice = result_dialog.show(
-                        "time_forfeit", "White", "Black ran out of time"
-                    )
-
-                if choice == "new_game":
-                    game_ended, last_result, game_time_control, _ = (
-                        start_new_game_with_dialogs(
-                            board_state,
-                            input_handler,
-                            move_history,
-                            full_san_history,
-                            engine_controller,
-                            move_panel,
-                            white_clock,
-                            black_clock,
-                            move_animator,
-                            sound_manager,
-                            screen,
-                            time_control_dialog,
-                            color_selection_dialog,
-                            layout_handler,
-                        )
-                    )
+                    forfeit_result = ("time_forfeit", "White", "Black ran out of time")
+
+            if forfeit_result is not None:
+                ctx.dirty_mask |= DIRTY_ALL
+                (
+                    ctx.game_ended,
+                    ctx.last_result,
+                    ctx.engine_thinking,
+                    ctx.new_game_requested,
+                ) = finalize_move(
+                    ctx.board_state,
+                    ctx.engine_controller,
+                    ctx.move_history,
+                    ctx.engine_color,
+                    ctx.result_dialog,
+                    ctx.sound_manager,
+                    ctx.white_clock,
+                    ctx.black_clock,
+                    forced_result=forfeit_result,
+                )
+                _refresh_input_state(ctx)
 
-                    white_clock, black_clock, captured_display = (
-                        recreate_clocks_and_captured_display(screen, game_time_control)
-                    )
+        # -------------------- New Game After Result --------------------
+        # Single place that restarts the game when the result dialog asked for it
 
-                    # Recalculate layout based on new FLIP_BOARD setting
-                    layout_handler.handle_resize(
-                        screen.get_width(), screen.get_height()
-                    )
+        if ctx.new_game_requested:
+            ctx.new_game_requested = False
+            _start_new_game(ctx)
+            ctx.dirty_mask |= DIRTY_ALL
 
-                    engine_thinking = check_engine_turn_and_move(
-                        board_state, engine_controller, move_history
-                    )
-
-        move_animator.update()
+        # Keep redrawing until the final frame of an animation is shown
+        if ctx.move_animator.is_animating:
+            ctx.move_animator.update()
+            ctx.dirty_mask |= DIRTY_BOARD
 
         # -------------------- Rendering Phase --------------------
-
-        # Clear screen
-        screen.fill(Colors.BACKGROUND)
-
-        # Draw board with squares and coordinates
-        board_gui.draw_board()
-
-        if Config.SHOW_LAST_MOVE and not move_animator.is_animating:
-            board_gui.draw_last_move_highlight(board_state.board)
-
-        # Draw check indicator
-        board_gui.draw_check_indicator(board_state.board)
-
-        # Draw square highlights UNDER pieces
-        if not game_ended:
-            human_color = chess.WHITE if Config.HUMAN_COLOR == "white" else chess.BLACK
-            if board_state.board.turn == human_color or (
-                Config.ENABLE_PREMOVE and engine_controller.is_thinking()
-            ):
-                input_handler.render_square_highlights(engine_controller.is_thinking())
-
-        # Decide which board to use for drawing pieces
-        if Config.ENABLE_PREMOVE and input_handler.has_premove():
-            draw_board = input_handler.build_visual_board()
-        else:
-            draw_board = board_state.board
-
-        # Draw pieces (hide piece being animated or dragged)
-        for square in chess.SQUARES:
-            # Skip if being animated
-            if move_animator.is_square_being_animated(square):
-                continue
-
-            # Skip if being dragged
-            if input_handler.dragging and square == input_handler.drag_start_square:
-                continue
-
-            piece = draw_board.piece_at(square)
-            if piece:
-                board_gui._draw_piece(piece, square)
-
-        # Draw legal move dots OVER pieces
-        if not game_ended:
-            human_color = chess.WHITE if Config.HUMAN_COLOR == "white" else chess.BLACK
-            if board_state.board.turn == human_color or (
-                Config.ENABLE_PREMOVE and engine_controller.is_thinking()
+        # Identical frames are skipped: only regions marked in dirty_mask are
+        # redrawn - by events and state changes, a running animation, a
+        # clock about to show a different second or a tooltip coming due.
+
+        if ctx.white_clock.needs_redraw() or ctx.black_clock.needs_redraw():
+            ctx.dirty_mask |= DIRTY_CLOCK
+        if ctx.game_controls.needs_redraw():
+            ctx.dirty_mask |= DIRTY_CONTROLS
+
+        if ctx.dirty_mask:
+            if ctx.dirty_mask == DIRTY_ALL or (
+                ctx.dirty_mask & DIRTY_BOARD and ctx.game_controls.tooltip_visible
             ):
-                input_handler.render_legal_move_dots(engine_controller.is_thinking())
-
-        # Render animated piece
-        move_animator.render(screen)
-
-        # Render dragged piece (on human's turn OR during engine thinking if premove)
-        if not game_ended:
-            human_color = chess.WHITE if Config.HUMAN_COLOR == "white" else chess.BLACK
-            if board_state.board.turn == human_color or (
-                Config.ENABLE_PREMOVE and engine_controller.is_thinking()
+                # Events can touch anything (dialogs, banners, tooltips drawn
+                # over the board) - redraw the whole frame
+                _render_frame(ctx)
+            else:
+                _render_regions(ctx, ctx.dirty_mask)
+            ctx.dirty_mask = 0
+
+            # -------------------- Frame Rate Control --------------------
+            # Limit the loop to run at the configured FPS
+            # This prevents excessive CPU usage and ensures smooth animation
+            if (
+                ctx.engine_busy
+                and not ctx.move_animator.is_animating
+                and not ctx.input_handler.dragging
             ):
-                input_handler.render_dragged_piece()
-
-        # Render user arrows always
-        board_gui.draw_user_arrows(input_handler.user_arrows)
-
-        # Draw captured pieces (if enabled)
-        if Config.SHOW_CAPTURED_PIECES:
-            captured_display.draw(board_state.board)
-
-        # Draw player clocks
-        white_clock.draw()
-        black_clock.draw()
-
-        # Calculate which move to highlight in the panel
-        if current_move_index >= 0:
-            highlight_index = current_move_index
+                # The engine searches on its own thread: hover and scroll
+                # redraws don't need the full rate, leave the CPU to it.
+                # Animations and premove drags keep the full frame rate.
+                ctx.clock.tick(Config.ENGINE_THINKING_FPS)
+            else:
+                ctx.clock.tick(fps)
         else:
-            highlight_index = (
-                len(board_state.board.move_stack) - 1
-                if board_state.board.move_stack
-                else -1
-            )
-
-        move_panel.draw(full_san_history, highlight_index)
-
-        # Draw game controls
-        game_controls.draw()
-
-        # Show FPS if enabled
-        if Config.SHOW_FPS:
-            fps = clock.get_fps()
-            font = pygame.font.SysFont("Arial", 18)
-            fps_text = font.render(f"FPS: {fps:.1f}", True, (255, 255, 255))
-            screen.blit(fps_text, (10, 10))
-
-        # Update the display with all rendered graphics
-        # flip() updates the entire display surface
-        pygame.display.flip()
-
-        # -------------------- Frame Rate Control --------------------
-        # Limit the loop to run at the configured FPS
-        # This prevents excessive CPU usage and ensures smooth animation
-        clock.tick(Config.FPS)
+            # Nothing to draw - sleep until an event arrives or the next
+            # timed change is due instead of spinning through empty frames
+            event = pygame.event.wait(_idle_timeout(ctx))
+            if event.type != pygame.NOEVENT:
+                woken = event
 
     # ==================== Cleanup Phase ====================
     # Cleanup
@@ -1867,20 +2285,25 @@ def main():
     print("Shutting down...")
 
     # Cancel any ongoing engine thinking
-    if engine_controller.is_thinking():
+    if ctx.engine_controller.is_thinking():
         print("[Cleanup] Cancelling engine thinking...")
-        engine_controller.cancel_thinking()
+        ctx.engine_controller.cancel_thinking()
 
-    # Close the engine (handles UCI shutdown)
-    close_engine()
+    # Stop the engine process (closes the engine, including UCI shutdown)
+    ctx.engine_controller.shutdown()
+
+    # Let an in-flight PGN save finish before exiting
+    _io_pool.shutdown(wait=True)
 
     # Properly shut down pygame and release resources
     # Display final game state summary
     print("Final Game State:")
-    print(f"    Moves played: {len(board_state.get_move_history_uci())}")
-    print(f"    Status: {board_state.get_game_status()}")
-    if board_state.get_move_history_san():
-        print(f"    Move history: {' '.join(board_state.get_move_history_san())}")
+    # Read-only use - no need for the copies get_move_history_*() return
+    san_history = ctx.board_state.move_history_san
+    print(f"    Moves played: {len(ctx.board_state.move_history_uci)}")
+    print(f"    Status: {ctx.board_state.get_game_status()}")
+    if san_history:
+        print(f"    Move history: {' '.join(san_history)}")
     print("✅ Application closed cleanly")
     print("=" * 50)
 
@@ -1890,5 +2313,9 @@ def main():
 
 if __name__ == "__main__":
     # Entry point guard - ensures main() only runs when script is executed directly
-    # (not when imported as a module)
+    # (not when imported as a module, e.g. by the engine subprocess)
+
+    # Required for the engine subprocess in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
+
     sys.exit(main())
@@ -9,6 +9,8 @@ including display settings, gameplay options, animation parameters, and file pat
 
 import os
 
+import chess
+
 
 class Config:
     """
@@ -25,6 +27,9 @@ class Config:
     WINDOW_HEIGHT = 840  # Window height in pixels (must accommodate board + controls)
     WINDOW_TITLE = "Chess - Human vs Engine"
     FPS = 60
+    IDLE_FPS = 15  # Poll rate while idle and waiting on a background file operation
+    ENGINE_THINKING_FPS = 10  # Frame cap while the engine searches and nothing moves
+    IDLE_WAIT_MAX_MS = 1000  # Longest sleep on the event queue while nothing changes
 
     # ===================
     # Board Settings
@@ -100,7 +105,13 @@ class Config:
     HUMAN_COLOR = "white"  # Color for human player: "white" or "black"
     # Engine color is automatically assigned as the opposite of human color
     # This ensures proper turn-based gameplay without manual configuration
-    ENGINE_COLOR = HUMAN_COLOR == "white" and "black" or "white"
+    ENGINE_COLOR = "black" if HUMAN_COLOR == "white" else "white"
+
+    # The same colors as python-chess booleans (chess.WHITE / chess.BLACK),
+    # so game logic compares bools instead of strings
+    # Kept in sync with the strings by set_human_color()
+    HUMAN_CHESS_COLOR = chess.WHITE if HUMAN_COLOR == "white" else chess.BLACK
+    ENGINE_CHESS_COLOR = not HUMAN_CHESS_COLOR
 
     # ===================
     # Engine Settings
@@ -155,6 +166,24 @@ class Config:
     # ===================
     DEBUG_MODE = False  # Enable verbose debug output and additional error information
     LOG_MOVES = True  # Print move notation to console for debugging and game review
+    LOG_LEVEL = "INFO"  # Console log level ("DEBUG" shows per-move diagnostics)
+
+    @classmethod
+    def set_human_color(cls, color: str):
+        """
+        Set the human's color and derive every other player color setting.
+
+        Args:
+            color (str): "white" or "black"
+        """
+        cls.HUMAN_COLOR = color
+        cls.ENGINE_COLOR = "black" if color == "white" else "white"
+        cls.HUMAN_CHESS_COLOR = chess.WHITE if color == "white" else chess.BLACK
+        cls.ENGINE_CHESS_COLOR = not cls.HUMAN_CHESS_COLOR
+
+    # Settings the last successful validate() checked; an unchanged set is
+    # not validated again
+    _validated_key = None
 
     @classmethod
     def validate(cls):
@@ -167,6 +196,23 @@ class Config:
         Raises:
             ValueError: If any configuration setting is invalid, with a detailed error message listing all validation failures
         """
+        # Every value read below; layout values change at runtime (resizing,
+        # flipping), so the result is memoized on them rather than validated once
+        key = (
+            cls.BOARD_SIZE,
+            cls.HUMAN_COLOR,
+            cls.BOARD_X,
+            cls.BOARD_Y,
+            cls.SIDE_PANEL_MARGIN,
+            cls.SIDE_PANEL_WIDTH,
+            cls.WINDOW_WIDTH,
+            cls.WINDOW_HEIGHT,
+            cls.MOVE_HISTORY_X,
+            cls.MOVE_HISTORY_WIDTH,
+        )
+        if key == cls._validated_key:
+            return True
+
         errors = []
 
         # Validate board size is divisible by 8
@@ -179,6 +225,9 @@ class Config:
             errors.append(
                 f"HUMAN_COLOR must be 'white' or 'black', got '{cls.HUMAN_COLOR}'"
             )
+        else:
+            # Derived colors may lag behind a HUMAN_COLOR set directly
+            cls.set_human_color(cls.HUMAN_COLOR)
 
         # Validate window width can accommodate the board and panels
         min_width = (
@@ -204,17 +253,17 @@ class Config:
             )
 
         # Validate panels don't go off screen
-        if hasattr(cls, "MOVE_HISTORY_X") and hasattr(cls, "MOVE_HISTORY_WIDTH"):
-            panel_right_edge = cls.MOVE_HISTORY_X + cls.MOVE_HISTORY_WIDTH
-            if panel_right_edge > cls.WINDOW_WIDTH:
-                errors.append(
-                    f"Move history panel extends beyond window edge. "
-                    f"Panel ends at {panel_right_edge}px but window is {cls.WINDOW_WIDTH}px wide. "
-                    f"Increase WINDOW_WIDTH to at least {panel_right_edge + 20}px"
-                )
+        panel_right_edge = cls.MOVE_HISTORY_X + cls.MOVE_HISTORY_WIDTH
+        if panel_right_edge > cls.WINDOW_WIDTH:
+            errors.append(
+                f"Move history panel extends beyond window edge. "
+                f"Panel ends at {panel_right_edge}px but window is {cls.WINDOW_WIDTH}px wide. "
+                f"Increase WINDOW_WIDTH to at least {panel_right_edge + 20}px"
+            )
 
         # If any errors were found, raise an exception with all error messages
         if errors:
             raise ValueError("Configuration errors:\n" + "\n".join(errors))
 
+        cls._validated_key = key
         return True
@@ -1,8 +1,8 @@
 # utils/config_persistence.py
-import json
+import contextlib
 import os
 import sys
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from utils.config import Config
 
 
@@ -17,106 +17,140 @@ else:
 CONFIG_FILE = os.path.join(BASE_DIR, "config.json")
 
 
+def _optional_int(value: Any) -> Optional[int]:
+    """int() that keeps None (ENGINE_MAX_DEPTH = None means no depth limit)."""
+    return int(value) if value is not None else None
+
+
+def _lowercase_str(value: Any) -> str:
+    """str() normalized to lowercase ("White" -> "white")."""
+    return str(value).lower()
+
+
+# Every persisted setting, in file order, with the conversion applied when it
+# is read back from config.json. The single whitelist for saving and loading
+_LOAD_SPEC = (
+    # Engine / gameplay
+    ("USE_UCI_ENGINE", bool),
+    ("UCI_ENGINE_PATH", str),
+    ("ENGINE_TIME_LIMIT", float),
+    ("ENGINE_MAX_DEPTH", _optional_int),
+    ("ENGINE_SKILL_LEVEL", int),
+    ("MCTS_ITERATIONS", int),
+    ("TEMPERATURE", float),
+    # Visual / UX
+    ("ANIMATE_MOVES", bool),
+    ("ANIMATION_SPEED", int),
+    ("SHOW_LAST_MOVE", bool),
+    ("SHOW_COORDINATES", bool),
+    ("SHOW_CAPTURED_PIECES", bool),
+    ("ENABLE_PREMOVE", bool),
+    ("SHOW_FPS", bool),
+    # Audio
+    ("ENABLE_SOUNDS", bool),
+    ("SOUND_VOLUME", float),
+    # Board orientation (important!)
+    ("FLIP_BOARD", bool),
+    # Less common / rarely changed, but good to persist
+    ("HUMAN_COLOR", _lowercase_str),
+    ("DEBUG_MODE", bool),
+    ("LOG_MOVES", bool),
+)
+
+# Config attributes written to config.json, in file order
+PERSISTED_KEYS = tuple(key for key, _ in _LOAD_SPEC)
+
+# Marks a setting absent from config.json (None is a valid saved value)
+_MISSING = object()
+
+
+# Settings written by the last successful save; the settings menu saves after
+# every change and again on close, so identical saves are skipped before
+# anything is encoded
+_last_saved_data: Optional[Dict[str, Any]] = None
+
+
 def save_config_to_file() -> bool:
     """Save current Config values we care about to JSON file."""
-    data: Dict[str, Any] = {
-        ""
-        # Engine / gameplay
-        "USE_UCI_ENGINE": Config.USE_UCI_ENGINE,
-        "UCI_ENGINE_PATH": Config.UCI_ENGINE_PATH,
-        "ENGINE_TIME_LIMIT": Config.ENGINE_TIME_LIMIT,
-        "ENGINE_MAX_DEPTH": Config.ENGINE_MAX_DEPTH,
-        "ENGINE_SKILL_LEVEL": Config.ENGINE_SKILL_LEVEL,
-        "MCTS_ITERATIONS": Config.MCTS_ITERATIONS,
-        "TEMPERATURE": Config.TEMPERATURE,
-        # Visual / UX
-        "ANIMATE_MOVES": Config.ANIMATE_MOVES,
-        "ANIMATION_SPEED": Config.ANIMATION_SPEED,
-        "SHOW_LAST_MOVE": Config.SHOW_LAST_MOVE,
-        "SHOW_COORDINATES": Config.SHOW_COORDINATES,
-        "SHOW_CAPTURED_PIECES": Config.SHOW_CAPTURED_PIECES,
-        "ENABLE_PREMOVE": Config.ENABLE_PREMOVE,
-        "SHOW_FPS": Config.SHOW_FPS,
-        # Audio
-        "ENABLE_SOUNDS": Config.ENABLE_SOUNDS,
-        "SOUND_VOLUME": Config.SOUND_VOLUME,
-        # Board orientation (important!)
-        "FLIP_BOARD": Config.FLIP_BOARD,
-        # Less common / rarely changed, but good to persist
-        "HUMAN_COLOR": Config.HUMAN_COLOR,
-        "DEBUG_MODE": Config.DEBUG_MODE,
-        "LOG_MOVES": Config.LOG_MOVES,
-    }
+    global _last_saved_data
+
+    # One dict snapshot of the class instead of an attribute lookup per key
+    cfg = vars(Config)
+    data: Dict[str, Any] = {key: cfg[key] for key in PERSISTED_KEYS}
+    if data == _last_saved_data:
+        # Nothing changed since the last save - the file is up to date
+        return True
+
+    # Imported on first use: without a config file nothing at startup needs json
+    import json
 
+    # Written next to config.json first, then swapped in (see below)
+    tmp_file = CONFIG_FILE + ".tmp"
     try:
-        os.makedirs(os.path.dirname(CONFIG_FILE), exist_ok=True)
-        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
+        # Encode the whole document first: json.dump() writes every token
+        # separately, this is a single write
+        payload = json.dumps(data, indent=4, ensure_ascii=False)
+
+        # Write next to config.json and swap the file in, so an interrupted
+        # save never leaves a truncated config behind. BASE_DIR is where the
+        # script / exe lives, so it always exists - no makedirs needed
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp_file, CONFIG_FILE)
+        _last_saved_data = data
         print(f"[ConfigPersistence] Settings saved to {CONFIG_FILE}")
         return True
     except Exception as e:
         print(f"[ConfigPersistence] Failed to save config: {type(e).__name__}: {e}")
+        # Don't leave a half-written temp file next to config.json
+        with contextlib.suppress(OSError):
+            os.remove(tmp_file)
         return False
 
 
 def load_config_from_file() -> bool:
     """Load saved values from JSON and override Config defaults."""
-    if not os.path.exists(CONFIG_FILE):
-        print(
-            f"[ConfigPersistence] No config file found ({CONFIG_FILE}) → using defaults"
-        )
-        return False
-
     try:
-        with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        # Apply only known/safe keys — ignore unknown/old ones
-        mappings = {
-            "USE_UCI_ENGINE": lambda v: setattr(Config, "USE_UCI_ENGINE", bool(v)),
-            "UCI_ENGINE_PATH": lambda v: setattr(Config, "UCI_ENGINE_PATH", str(v)),
-            "ENGINE_TIME_LIMIT": lambda v: setattr(
-                Config, "ENGINE_TIME_LIMIT", float(v)
-            ),
-            "ENGINE_MAX_DEPTH": lambda v: setattr(
-                Config, "ENGINE_MAX_DEPTH", int(v) if v is not None else None
-            ),
-            "ENGINE_SKILL_LEVEL": lambda v: setattr(
-                Config, "ENGINE_SKILL_LEVEL", int(v)
-            ),
-            "MCTS_ITERATIONS": lambda v: setattr(Config, "MCTS_ITERATIONS", int(v)),
-            "TEMPERATURE": lambda v: setattr(Config, "TEMPERATURE", float(v)),
-            "ANIMATE_MOVES": lambda v: setattr(Config, "ANIMATE_MOVES", bool(v)),
-            "ANIMATION_SPEED": lambda v: setattr(Config, "ANIMATION_SPEED", int(v)),
-            "SHOW_LAST_MOVE": lambda v: setattr(Config, "SHOW_LAST_MOVE", bool(v)),
-            "SHOW_COORDINATES": lambda v: setattr(Config, "SHOW_COORDINATES", bool(v)),
-            "SHOW_CAPTURED_PIECES": lambda v: setattr(
-                Config, "SHOW_CAPTURED_PIECES", bool(v)
-            ),
-            "ENABLE_PREMOVE": lambda v: setattr(Config, "ENABLE_PREMOVE", bool(v)),
-            "SHOW_FPS": lambda v: setattr(Config, "SHOW_FPS", bool(v)),
-            "ENABLE_SOUNDS": lambda v: setattr(Config, "ENABLE_SOUNDS", bool(v)),
-            "SOUND_VOLUME": lambda v: setattr(Config, "SOUND_VOLUME", float(v)),
-            "FLIP_BOARD": lambda v: setattr(Config, "FLIP_BOARD", bool(v)),
-            "HUMAN_COLOR": lambda v: setattr(Config, "HUMAN_COLOR", str(v).lower()),
-            "DEBUG_MODE": lambda v: setattr(Config, "DEBUG_MODE", bool(v)),
-            "LOG_MOVES": lambda v: setattr(Config, "LOG_MOVES", bool(v)),
-        }
+        # Read the whole file at once and let json.loads() decode the UTF-8
+        # bytes, instead of json.load() going through a text-mode reader.
+        # A missing file is reported by open() - no separate exists() check
+        with open(CONFIG_FILE, "rb") as f:
+            raw = f.read()
 
+        # Imported on first use: without a config file nothing at startup needs json
+        import json
+
+        data = json.loads(raw)
+
+        # Apply only known/safe keys — ignore unknown/old ones. Walking the
+        # spec bounds the loop to the known settings, however many stale
+        # keys the file has collected
         applied = 0
-        for key, value in data.items():
-            if key in mappings:
-                try:
-                    mappings[key](value)
-                    applied += 1
-                except Exception as e:
-                    print(f"[ConfigPersistence] Failed to apply {key} = {value!r}: {e}")
+        for key, coerce in _LOAD_SPEC:
+            value = data.get(key, _MISSING)
+            if value is _MISSING:
+                continue
+            try:
+                converted = coerce(value)
+                if key == "HUMAN_COLOR":
+                    # Also derives the engine and python-chess colors
+                    Config.set_human_color(converted)
+                else:
+                    setattr(Config, key, converted)
+                applied += 1
+            except Exception as e:
+                print(f"[ConfigPersistence] Failed to apply {key} = {value!r}: {e}")
 
         print(f"[ConfigPersistence] Loaded {applied} settings from {CONFIG_FILE}")
         if applied > 0 and Config.USE_UCI_ENGINE:
             print(f"  → UCI engine: enabled, path = {Config.UCI_ENGINE_PATH}")
         return applied > 0
 
+    except FileNotFoundError:
+        print(
+            f"[ConfigPersistence] No config file found ({CONFIG_FILE}) → using defaults"
+        )
+        return False
     except Exception as e:
         print(f"[ConfigPersistence] Failed to load config: {e}")
         return False
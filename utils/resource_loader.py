@@ -1,15 +1,17 @@
 import sys
 import os
+from functools import lru_cache
 
+# Resource root, fixed for the lifetime of the process
+if getattr(sys, "_MEIPASS", None) is not None:
+    # PyInstaller creates a temp folder and stores path in _MEIPASS
+    _BASE_PATH = sys._MEIPASS
+else:
+    # In dev mode, go up one directory from utils/ to project root
+    _BASE_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 
+
+@lru_cache(maxsize=None)
 def resource_path(relative_path):
     """Get absolute path to resource, works for dev and PyInstaller"""
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = getattr(sys, "_MEIPASS", None)
-        if base_path is None:
-            raise AttributeError("_MEIPASS not found")
-    except AttributeError:
-        # In dev mode, go up one directory from utils/ to project root
-        base_path = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-    return os.path.join(base_path, relative_path)
+    return os.path.join(_BASE_PATH, relative_path)